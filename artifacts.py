@@ -0,0 +1,128 @@
+"""Failure-only artifact capture.
+
+conftest.py calls capture() from the report phase of every failing test. Only the WebDriver
+reads happen on the test's thread (screenshot as base64, page source, browser console log);
+decoding and file writes are queued to one background writer thread, so the browser is free
+for the next test right away. flush() at the end of the session waits for the queue.
+
+Files go to ARTIFACTS_DIR/<run timestamp>/<scenario>/<test>.{png,html,console.log}.
+Screenshots with identical content are written once and later failures point at the first
+file. Once ARTIFACTS_MAX_MB have been written in a run, further artifacts are dropped (and
+the drop is noted in the report). ARTIFACTS=0 disables capture.
+"""
+import base64
+import hashlib
+import json
+import os
+import queue
+import re
+import threading
+from datetime import datetime
+
+ARTIFACTS_DIR = os.environ.get('ARTIFACTS_DIR', os.path.join('reports', 'artifacts'))
+ARTIFACTS_MAX_MB = float(os.environ.get('ARTIFACTS_MAX_MB', 50))
+
+_run_dir = os.path.join(ARTIFACTS_DIR, datetime.now().strftime('%Y%m%d_%H%M%S') + f'_{os.getpid()}')
+_queue = queue.Queue()
+_writer = None
+_screenshots = {}  # sha256 of the base64 screenshot -> path of the file that holds it
+_state = {'bytes': 0, 'dropped': 0}
+_lock = threading.Lock()
+
+
+def enabled():
+    return os.environ.get('ARTIFACTS', '1').lower() not in ('0', 'false', 'no')
+
+
+def _safe(name):
+    return re.sub(r'[^A-Za-z0-9_.-]+', '_', name).strip('_')[:120] or 'unnamed'
+
+
+def _reserve(size):
+    """Account ``size`` bytes against the run's cap; False when it would be exceeded."""
+    with _lock:
+        if _state['bytes'] + size > ARTIFACTS_MAX_MB * 1024 * 1024:
+            _state['dropped'] += 1
+            return False
+        _state['bytes'] += size
+        return True
+
+
+def _write_loop():
+    while True:
+        path, payload, is_base64 = _queue.get()
+        try:
+            data = base64.b64decode(payload) if is_base64 else payload.encode('utf-8')
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as fh:
+                fh.write(data)
+        except Exception as e:
+            print(f"⚠️  Could not write artifact {path}: {e}")
+        finally:
+            _queue.task_done()
+
+
+def _submit(path, payload, is_base64=False):
+    global _writer
+    if _writer is None:
+        _writer = threading.Thread(target=_write_loop, name='artifact-writer', daemon=True)
+        _writer.start()
+    _queue.put((path, payload, is_base64))
+
+
+def capture(driver, scenario, test_name, when, retry=0):
+    """Grab screenshot, DOM and console log for a failed test; returns {kind: path} (writes are async).
+
+    ``retry`` numbers recovery.py's later attempts of the same test, so each keeps its own files.
+    """
+    base = os.path.join(_run_dir, _safe(scenario or 'default'), _safe(test_name))
+    if retry:
+        base += f'__retry{retry}'
+    if when != 'call':
+        base += f'__{when}'
+    saved = {}
+
+    try:
+        shot = driver.get_screenshot_as_base64()
+    except Exception:
+        shot = None
+    if shot:
+        digest = hashlib.sha256(shot.encode('ascii')).hexdigest()
+        with _lock:
+            existing = _screenshots.get(digest)
+        if existing:
+            saved['screenshot'] = existing
+        elif _reserve(len(shot) * 3 // 4):
+            with _lock:
+                _screenshots[digest] = base + '.png'
+            _submit(base + '.png', shot, is_base64=True)
+            saved['screenshot'] = base + '.png'
+
+    try:
+        dom = driver.page_source
+    except Exception:
+        dom = None
+    if dom and _reserve(len(dom)):
+        _submit(base + '.html', dom)
+        saved['dom'] = base + '.html'
+
+    try:
+        # Needs the goog:loggingPrefs capability set in shared_driver.create_chrome
+        entries = driver.get_log('browser')
+    except Exception:
+        entries = None
+    if entries:
+        text = '\n'.join(json.dumps(entry) for entry in entries)
+        if _reserve(len(text)):
+            _submit(base + '.console.log', text)
+            saved['console'] = base + '.console.log'
+    return saved
+
+
+def flush(timeout=30):
+    """Wait for queued writes; returns {'bytes', 'dropped', 'dir'} for the run."""
+    if _writer is not None:
+        done = threading.Event()
+        threading.Thread(target=lambda: (_queue.join(), done.set()), daemon=True).start()
+        done.wait(timeout)
+    return {'bytes': _state['bytes'], 'dropped': _state['dropped'], 'dir': _run_dir}
@@ -0,0 +1,149 @@
+"""Persistent authenticated-session cache used by shared_driver.login.
+
+After the first successful form login for a (base_url, username) pair the browser's cookies
+and localStorage are stored under AUTH_CACHE_DIR with a TTL. Later sessions inject that state
+and load the post-login page once; if the dashboard marker shows up the form login is skipped,
+otherwise the entry is dropped and the caller falls back to the form.
+
+Enable with AUTH_CACHE=1 (run_scenarios_selective.py --auth-cache). While enabled,
+shared_driver.logout only clears the browser's own state, because a server-side logout would
+invalidate the cached session.
+"""
+import hashlib
+import json
+import os
+import time
+from urllib.parse import urlparse
+
+AUTH_CACHE_DIR = os.environ.get('AUTH_CACHE_DIR', '.auth_cache')
+AUTH_CACHE_TTL = int(os.environ.get('AUTH_CACHE_TTL', 1800))  # seconds
+DASHBOARD_MARKER = "//a[@class='active']"
+LOGIN_MARKER = "username"  # id of the login form's username field
+
+_stats = {'hit': 0, 'miss': 0}
+
+# Resolves with 'dashboard' or 'login' as soon as either page is recognizable, 'timeout' otherwise
+_PROBE_JS = r"""
+var marker = arguments[0], loginId = arguments[1], timeoutMs = arguments[2];
+var callback = arguments[arguments.length - 1], start = Date.now();
+(function poll() {
+  if (document.evaluate(marker, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue) {
+    callback('dashboard');
+  } else if (document.getElementById(loginId)) {
+    callback('login');
+  } else if (Date.now() - start >= timeoutMs) {
+    callback('timeout');
+  } else {
+    setTimeout(poll, 50);
+  }
+})();
+"""
+
+
+def enabled():
+    return os.environ.get('AUTH_CACHE', 'false').lower() in ('1', 'true', 'yes')
+
+
+def _entry_path(base_url, username):
+    key = hashlib.sha1(f"{base_url}|{username}".encode('utf-8')).hexdigest()
+    return os.path.join(AUTH_CACHE_DIR, f"{key}.json")
+
+
+def _record(outcome, reason):
+    _stats[outcome] += 1
+    os.makedirs(AUTH_CACHE_DIR, exist_ok=True)
+    line = json.dumps({'time': time.time(), 'outcome': outcome, 'reason': reason})
+    # One short append per line keeps concurrent workers from clobbering each other
+    with open(os.path.join(AUTH_CACHE_DIR, 'stats.jsonl'), 'a', encoding='utf-8') as fh:
+        fh.write(line + '\n')
+
+
+def _drop(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def probe_page(driver, timeout=5):
+    """Return 'dashboard', 'login' or 'timeout' for the currently loaded page, in one round trip."""
+    return driver.execute_async_script(_PROBE_JS, DASHBOARD_MARKER, LOGIN_MARKER, int(timeout * 1000))
+
+
+def save(driver, base_url, username):
+    """Store the current (logged-in) browser state for ``username``; returns False if not on the dashboard."""
+    if probe_page(driver) != 'dashboard':
+        return False
+    entry = {
+        'saved_at': time.time(),
+        'landing_url': driver.current_url,
+        'cookies': driver.get_cookies(),
+        'local_storage': driver.execute_script(
+            "var s = {}; for (var i = 0; i < localStorage.length; i++) {"
+            " var k = localStorage.key(i); s[k] = localStorage.getItem(k); } return s;"),
+    }
+    os.makedirs(AUTH_CACHE_DIR, exist_ok=True)
+    path = _entry_path(base_url, username)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as fh:
+        json.dump(entry, fh)
+    os.replace(tmp_path, path)
+    return True
+
+
+def restore(driver, base_url, username):
+    """Try to resume a cached session for ``username``; returns True when the dashboard loads with it."""
+    path = _entry_path(base_url, username)
+    try:
+        with open(path, 'r', encoding='utf-8') as fh:
+            entry = json.load(fh)
+    except (OSError, ValueError):
+        _record('miss', 'absent')
+        return False
+    if time.time() - entry.get('saved_at', 0) > AUTH_CACHE_TTL:
+        _drop(path)
+        _record('miss', 'expired')
+        return False
+
+    # Cookies and localStorage can only be set on a document of the same origin
+    origin = "{0.scheme}://{0.netloc}".format(urlparse(base_url))
+    if not driver.current_url.startswith(origin):
+        driver.get(base_url)
+    driver.delete_all_cookies()
+    for cookie in entry['cookies']:
+        cookie = dict(cookie)
+        if 'expiry' in cookie:
+            cookie['expiry'] = int(cookie['expiry'])
+        driver.add_cookie(cookie)
+    driver.execute_script(
+        "var s = arguments[0]; for (var k in s) { localStorage.setItem(k, s[k]); }",
+        entry.get('local_storage') or {})
+
+    driver.get(entry['landing_url'])
+    if probe_page(driver) == 'dashboard':
+        _record('hit', 'restored')
+        return True
+    _drop(path)
+    _record('miss', 'rejected')
+    return False
+
+
+def discard(base_url, username, reason):
+    """Drop the entry for ``username`` after restoring it failed outright; counts as a miss."""
+    _drop(_entry_path(base_url, username))
+    _record('miss', reason)
+
+
+def get_stats():
+    """Hit/miss counts for this process plus the totals recorded across all runs."""
+    lifetime = {'hit': 0, 'miss': 0}
+    try:
+        with open(os.path.join(AUTH_CACHE_DIR, 'stats.jsonl'), 'r', encoding='utf-8') as fh:
+            for line in fh:
+                try:
+                    lifetime[json.loads(line)['outcome']] += 1
+                except (ValueError, KeyError):
+                    continue
+    except OSError:
+        pass
+    return {'run': dict(_stats), 'lifetime': lifetime}
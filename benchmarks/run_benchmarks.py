@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Harness Benchmarks - measure the test harness against the local stand-in app
+
+Starts benchmarks/standin_app.py on a free local port (or uses --base-url), then for each
+harness mode runs run_scenarios_selective.py against it and measures:
+- wall-clock time and scenario throughput per mode
+- per-test latency (from the runner's JUnit XML output)
+- browser startup cost (shared_driver.create_chrome + quit, measured separately)
+
+Results are written as JSON to benchmarks/results/ so runs can be compared over time
+(--compare PREVIOUS.json prints the change per mode and per test).
+
+Usage Examples:
+    python benchmarks/run_benchmarks.py
+    python benchmarks/run_benchmarks.py --scenarios 3 --repeat 3 --latency-ms 80
+    python benchmarks/run_benchmarks.py --modes adaptive,pacing-off --compare benchmarks/results/benchmark_X.json
+    python benchmarks/run_benchmarks.py --modes profile-faithful,profile-fast --repeat 3
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import statistics
+import subprocess
+import tempfile
+import xml.etree.ElementTree as ET
+from datetime import datetime
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, PROJECT_ROOT)
+
+import standin_app  # noqa: E402  (benchmarks/ is on sys.path when run as a script)
+
+# name -> extra runner arguments and environment for one harness mode
+MODES = {
+    'legacy-delay': {'args': ['--pacing', 'demo'], 'env': {'PACING_DEMO_DELAY': '1'}},
+    'adaptive': {'args': ['--pacing', 'adaptive']},
+    'pacing-off': {'args': ['--pacing', 'off']},
+    'workers-2': {'args': ['--pacing', 'adaptive', '--workers', '2']},
+    'single-process': {'args': ['--pacing', 'adaptive', '--single-process']},
+    'auth-cache': {'args': ['--pacing', 'adaptive', '--auth-cache'], 'fresh_dir_env': 'AUTH_CACHE_DIR'},
+    # A/B pair for the Chrome session profiles (browser_profiles.py)
+    'profile-faithful': {'args': ['--pacing', 'adaptive', '--browser-profile', 'faithful']},
+    'profile-fast': {'args': ['--pacing', 'adaptive', '--browser-profile', 'fast']},
+}
+DEFAULT_MODES = ('legacy-delay', 'adaptive', 'pacing-off', 'workers-2', 'single-process', 'auth-cache')
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description="Benchmark the test harness against a local stand-in app")
+    parser.add_argument('--scenarios', type=int, default=2, metavar='N',
+                        help='Run the first N scenarios of testdata.csv per mode (default: 2)')
+    parser.add_argument('--repeat', type=int, default=1, metavar='N', help='Runs per mode (default: 1)')
+    parser.add_argument('--modes', default=','.join(DEFAULT_MODES),
+                        help=f"Comma-separated modes to run (available: {', '.join(MODES)})")
+    parser.add_argument('--latency-ms', type=float, default=0, help='Artificial stand-in latency per request')
+    parser.add_argument('--jitter-ms', type=float, default=0, help='Random extra stand-in latency (0..N ms)')
+    parser.add_argument('--startup-samples', type=int, default=3, metavar='N',
+                        help='Browser launches to time for the startup cost (0 to skip, default: 3)')
+    parser.add_argument('--base-url', help='Benchmark an already running app (login URL) instead of the stand-in')
+    parser.add_argument('--headed', action='store_true', help='Show the browser (default: headless)')
+    parser.add_argument('--output', default=os.path.join(BENCH_DIR, 'results'),
+                        help='Directory for the JSON results (default: benchmarks/results)')
+    parser.add_argument('--compare', metavar='JSON', help='Previous results file to compare against')
+    args = parser.parse_args()
+    args.modes = [m.strip() for m in args.modes.split(',') if m.strip()]
+    unknown = [m for m in args.modes if m not in MODES]
+    if unknown:
+        parser.error(f"unknown mode(s): {', '.join(unknown)}")
+    return args
+
+
+def measure_browser_startup(samples, headless=True):
+    """Time launching and quitting Chrome the way shared_driver does; returns seconds per launch."""
+    import shared_driver
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        driver = shared_driver.create_chrome(headless=headless)
+        launched = time.perf_counter()
+        driver.quit()
+        timings.append({'launch': launched - start, 'quit': time.perf_counter() - launched})
+    return timings
+
+
+def read_junit(junit_dir):
+    """Return {test id: (seconds, outcome)} from every JUnit XML file in junit_dir.
+
+    Per-scenario files (scenario_<index>_<name>.xml) get the scenario name appended to the
+    test id, so ids match the parametrized ids of --single-process runs.
+    """
+    tests = {}
+    for name in sorted(os.listdir(junit_dir)):
+        if not name.endswith('.xml'):
+            continue
+        scenario = os.path.splitext(name)[0]
+        if scenario.startswith('scenario_'):
+            scenario = scenario.split('_', 2)[2]
+        for case in ET.parse(os.path.join(junit_dir, name)).iter('testcase'):
+            outcome = 'passed'
+            if case.find('failure') is not None or case.find('error') is not None:
+                outcome = 'failed'
+            elif case.find('skipped') is not None:
+                outcome = 'skipped'
+            test_id = f"{case.get('classname')}::{case.get('name')}"
+            if scenario != 'scenarios':
+                test_id = f"{test_id}[{scenario}]"
+            tests[test_id] = (float(case.get('time') or 0), outcome)
+    return tests
+
+
+def run_mode(mode, args, login_url):
+    """Run the selected scenarios once with the given harness mode."""
+    spec = MODES[mode]
+    with tempfile.TemporaryDirectory(prefix='bench_') as tmp:
+        junit_dir = os.path.join(tmp, 'junit')
+        env = os.environ.copy()
+        env.update(spec.get('env', {}))
+        env['TEST_LOGIN_URL'] = login_url
+        if spec.get('fresh_dir_env'):
+            env[spec['fresh_dir_env']] = os.path.join(tmp, 'state')
+        cmd = [sys.executable, 'run_scenarios_selective.py', '--first', str(args.scenarios),
+               '--junit-dir', junit_dir] + spec['args']
+        if not args.headed:
+            cmd.append('--headless')
+        start = time.perf_counter()
+        completed = subprocess.run(cmd, cwd=PROJECT_ROOT, env=env, stdout=subprocess.PIPE,
+                                   stderr=subprocess.STDOUT, text=True, errors='replace')
+        wall = time.perf_counter() - start
+        tests = read_junit(junit_dir) if os.path.isdir(junit_dir) else {}
+    return {'wall': wall, 'returncode': completed.returncode, 'tests': tests,
+            'output_tail': completed.stdout[-2000:] if completed.returncode else ''}
+
+
+def summarize_mode(runs, scenarios):
+    walls = [run['wall'] for run in runs]
+    per_test = {}
+    for run in runs:
+        for test_id, (seconds, outcome) in run['tests'].items():
+            per_test.setdefault(test_id, []).append(seconds)
+    outcomes = [outcome for run in runs for _, outcome in run['tests'].values()]
+    median_wall = statistics.median(walls)
+    return {
+        'wall_median': median_wall,
+        'wall_runs': walls,
+        'scenarios_per_minute': scenarios * 60.0 / median_wall if median_wall else 0.0,
+        'passed': outcomes.count('passed'),
+        'failed': outcomes.count('failed'),
+        'skipped': outcomes.count('skipped'),
+        'returncodes': [run['returncode'] for run in runs],
+        'per_test_median': {test_id: statistics.median(times) for test_id, times in sorted(per_test.items())},
+    }
+
+
+def print_comparison(current, previous):
+    print(f"\n{'='*60}\nCOMPARISON WITH {previous.get('timestamp', '?')}\n{'='*60}")
+    for mode, result in current['modes'].items():
+        before = previous.get('modes', {}).get(mode)
+        if not before:
+            print(f"{mode:15} (new mode)")
+            continue
+        delta = (result['wall_median'] - before['wall_median']) / before['wall_median'] * 100
+        print(f"{mode:15} wall {before['wall_median']:7.2f}s -> {result['wall_median']:7.2f}s ({delta:+.1f}%)")
+        for test_id, seconds in result['per_test_median'].items():
+            old = before['per_test_median'].get(test_id)
+            if old:
+                print(f"    {seconds - old:+7.2f}s  {test_id}")
+
+
+def main():
+    args = parse_arguments()
+    server = None
+    login_url = args.base_url
+    if not login_url:
+        server, login_url = standin_app.start_in_background(args.latency_ms, args.jitter_ms)
+        print(f"🏥 Stand-in app running at {login_url}")
+
+    results = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'config': {'scenarios': args.scenarios, 'repeat': args.repeat, 'latency_ms': args.latency_ms,
+                   'jitter_ms': args.jitter_ms, 'target': args.base_url or 'standin',
+                   'python': platform.python_version(), 'platform': platform.platform()},
+        'startup': None,
+        'modes': {},
+    }
+    try:
+        if args.startup_samples:
+            print(f"⏱️  Measuring browser startup ({args.startup_samples} launches)...")
+            try:
+                timings = measure_browser_startup(args.startup_samples, headless=not args.headed)
+                launches = [t['launch'] for t in timings]
+                results['startup'] = {'samples': timings, 'launch_median': statistics.median(launches)}
+                print(f"   median launch: {results['startup']['launch_median']:.2f}s")
+            except Exception as e:
+                results['startup'] = {'error': str(e)}
+                print(f"❌ Browser startup measurement failed: {e}")
+
+        for mode in args.modes:
+            runs = []
+            for i in range(args.repeat):
+                print(f"🚀 {mode}: run {i + 1}/{args.repeat}...")
+                runs.append(run_mode(mode, args, login_url))
+                if runs[-1]['returncode']:
+                    print(f"⚠️  {mode}: runner exited with {runs[-1]['returncode']}\n{runs[-1]['output_tail']}")
+            summary = summarize_mode(runs, args.scenarios)
+            results['modes'][mode] = summary
+            print(f"   {mode}: {summary['wall_median']:.2f}s median, "
+                  f"{summary['scenarios_per_minute']:.1f} scenarios/min, "
+                  f"{summary['passed']} passed / {summary['failed']} failed")
+    finally:
+        if server is not None:
+            server.shutdown()
+
+    os.makedirs(args.output, exist_ok=True)
+    out_path = os.path.join(args.output, f"benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    with open(out_path, 'w', encoding='utf-8') as fh:
+        json.dump(results, fh, indent=2)
+    print(f"\n📄 Results written to {out_path}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as fh:
+            print_comparison(results, json.load(fh))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the healthcare application under test
+
+Serves the same DOM the TC001-TC006 and TC01 tests expect (login, dashboard, cost estimator,
+claim submission, claims, estimate history and provider search) from an in-memory store, with
+configurable artificial latency. It exists so harness performance can be measured without the
+remote EC2 host's latency swamping everything else; it is not a functional copy of the app.
+
+Usage Examples:
+    python benchmarks/standin_app.py --port 8765 --latency-ms 50
+    set TEST_LOGIN_URL=http://127.0.0.1:8765/login
+    python run_scenarios_selective.py --first 1
+"""
+import argparse
+import html
+import itertools
+import random
+import secrets
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+USERS = {
+    'alexsingh': {'password': 'demo123', 'name': 'Alex Singh'},
+    'samrivera': {'password': 'demo123', 'name': 'Sam Rivera'},
+}
+CPT_CODES = {
+    '99213': ('Office Visit', 180.0),
+    '87070': ('Culture Test', 95.0),
+    '70450': ('CT Head', 1250.0),
+    '87635': ('COVID-19 PCR', 110.0),
+}
+SITES = ('Clinic', 'Hospital', 'Telehealth')
+SITE_FACTOR = {'Clinic': 1.0, 'Hospital': 1.6, 'Telehealth': 0.7}
+SPECIALTIES = ('Primary Care', 'Cardiology', 'Orthopedics', 'Dermatology')
+PROVIDER_NETWORKS = ('In-Network Only', 'Out-of-Network', 'Any')
+ACCEPTING = ('Yes', 'No', 'Any')
+PROVIDERS = [
+    {'name': f"Dr. {last}", 'specialty': specialty, 'in_network': i % 3 != 0, 'accepting': i % 2 == 0}
+    for i, (last, specialty) in enumerate(zip(
+        ('Patel', 'Nguyen', 'Garcia', 'Kim', 'Okafor', 'Rossi', 'Haddad', 'Larsen'),
+        itertools.cycle(SPECIALTIES)))
+]
+
+SIDEBAR = (
+    ('/dashboard', 'Dashboard'),
+    ('/estimate', 'Cost Estimator'),
+    ('/claims/new', 'Submit Claim'),
+    ('/claims', 'My Claims'),
+    ('/estimates', 'Estimates'),
+    ('/providers', 'Find Providers'),
+)
+
+ACTIVE = ' class="active"'
+
+
+def _estimate_costs(cpt, site, in_network):
+    base = CPT_CODES[cpt][1] * SITE_FACTOR.get(site, 1.0)
+    plan = base * (0.8 if in_network else 0.5)
+    return round(base, 2), round(plan, 2)
+
+
+class Store:
+    """In-memory sessions, claims and estimates; each user starts with one of each."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.sessions = {}
+        self.claims = {user: [] for user in USERS}
+        self.estimates = {user: [] for user in USERS}
+        self._ids = itertools.count(1001)
+        for user in USERS:
+            self.add_estimate(user, '99213', 'Clinic', True)
+            self.add_claim(user, '99213', 'Clinic', True, '150', '01-01-2025')
+
+    def add_estimate(self, user, cpt, site, in_network):
+        total, plan = _estimate_costs(cpt, site, in_network)
+        with self.lock:
+            estimate = {'id': next(self._ids), 'cpt': cpt, 'desc': CPT_CODES[cpt][0], 'site': site,
+                        'in_network': in_network, 'total': total, 'plan': plan,
+                        'member': round(total - plan, 2), 'created': time.strftime('%Y-%m-%d')}
+            self.estimates[user].insert(0, estimate)
+        return estimate
+
+    def add_claim(self, user, cpt, site, in_network, amount, service_date):
+        billed = float(amount)
+        denied = not in_network and billed > 5000
+        plan = 0.0 if denied else round(billed * (0.8 if in_network else 0.5), 2)
+        with self.lock:
+            claim = {'id': f"CLM-{next(self._ids)}", 'cpt': cpt, 'site': site, 'billed': billed,
+                     'plan': plan, 'member': round(billed - plan, 2), 'date': service_date,
+                     'status': 'DENIED' if denied else 'Processed'}
+            self.claims[user].insert(0, claim)
+        return claim
+
+
+def _options(values, selected=None, labels=None):
+    out = []
+    for value in values:
+        label = labels(value) if labels else value
+        sel = ' selected' if value == selected else ''
+        out.append(f'<option value="{html.escape(value)}"{sel}>{html.escape(label)}</option>')
+    return ''.join(out)
+
+
+def _layout(path, body, title='HealthCare Portal'):
+    links = ''.join(
+        f'<li><a href="{href}"{ACTIVE if href == path else ""}>{label}</a></li>'
+        for href, label in SIDEBAR)
+    return (
+        '<!doctype html><html><head><meta charset="utf-8">'
+        f'<title>{title}</title></head><body>'
+        '<div class="main-layout">'
+        f'<aside><nav><ul class="sidebar-nav">{links}<li><a href="/logout">Logout</a></li></ul></nav></aside>'
+        f'<main class="container">{body}</main>'
+        '</div></body></html>'
+    )
+
+
+def render_login(error=None):
+    alert = f'<div class="alert error">{html.escape(error)}</div>' if error else ''
+    return (
+        '<!doctype html><html><head><meta charset="utf-8"><title>Sign In</title></head><body>'
+        f'<main class="login">{alert}<form method="post" action="/login">'
+        '<label>Username <input id="username" name="username" type="text"></label>'
+        '<label>Password <input id="password" name="password" type="password"></label>'
+        '<button type="submit">Sign In</button></form></main></body></html>'
+    )
+
+
+def render_dashboard(user):
+    return _layout('/dashboard', (
+        f'<h2>Welcome, {html.escape(USERS[user]["name"])}</h2>'
+        '<div class="welcome">Here is your benefits overview.</div>'
+        '<div class="card"><a href="/estimate">Estimate a procedure cost</a></div>'
+    ))
+
+
+def render_estimate(form=None, result=None, error=None):
+    form = form or {}
+    in_network = form.get('in_network', 'true') == 'true'
+    out = ''
+    if error:
+        out = f'<div class="alert error">{html.escape(error)}</div>'
+    elif result:
+        out = (f'<div>Estimated Cost: ${result["total"]:.2f}</div>'
+               f'<div>Plan Pays: ${result["plan"]:.2f}</div>'
+               f'<div>You Pay: ${result["member"]:.2f}</div>')
+    return _layout('/estimate', (
+        '<h2>Cost Estimator</h2><form method="post" action="/estimate">'
+        f'<label>CPT Code <input name="cpt" type="text" value="{html.escape(form.get("cpt", ""))}"></label>'
+        f'<label>Service Location <select id="est_site" name="site">{_options(SITES, form.get("site"))}</select></label>'
+        f'<label><input type="radio" id="est_inn_true" name="in_network" value="true"{" checked" if in_network else ""}> In-Network</label>'
+        f'<label><input type="radio" id="est_inn_false" name="in_network" value="false"{"" if in_network else " checked"}> Out-of-Network</label>'
+        '<button id="est_submit" type="submit">Calculate Estimate</button></form>'
+        f'<div aria-live="polite">{out}</div>'
+    ))
+
+
+def render_claim_form(result=None, error=None):
+    out = ''
+    if error:
+        out = f'<div class="alert error">{html.escape(error)}</div>'
+    elif result:
+        if result['status'] == 'DENIED':
+            summary = f'Claim {result["id"]}: DENIED. Your Responsibility: ${result["member"]:.2f}'
+        else:
+            summary = (f'Claim {result["id"]}: Plan Paid: ${result["plan"]:.2f}. '
+                       f'Your Responsibility: ${result["member"]:.2f}')
+        out = f'<div class="result-summary">{summary}</div>'
+    cpt_options = _options(tuple(CPT_CODES), labels=lambda code: f"{code} - {CPT_CODES[code][0]}")
+    return _layout('/claims/new', (
+        '<h2>Submit Claim</h2><form method="post" action="/claims/new">'
+        f'<label>CPT <select id="claim_cpt" name="cpt">{cpt_options}</select></label>'
+        f'<label>Site <select id="claim_site" name="site">{_options(SITES)}</select></label>'
+        '<label>Billed Amount <input id="claim_billed_amount" name="billed_amount" type="text"></label>'
+        '<label>Service Date <input id="claim_service_date" name="service_date" type="text"></label>'
+        '<label><input type="radio" id="claim_network_true" name="in_network" value="true" checked> In-Network</label>'
+        '<label><input type="radio" id="claim_network_false" name="in_network" value="false"> Out-of-Network</label>'
+        '<button id="claim_submit" type="submit">Process Claim</button></form>'
+        f'{out}'
+    ))
+
+
+def render_claims(claims):
+    rows = ''.join(
+        f'<tr><td>{c["id"]}</td><td>{c["date"]}</td><td>{c["cpt"]}</td><td>{c["site"]}</td>'
+        f'<td>${c["billed"]:.2f}</td><td>${c["plan"]:.2f}</td><td>${c["member"]:.2f}</td><td>{c["status"]}</td></tr>'
+        for c in claims)
+    return _layout('/claims', (
+        '<h2>My Claims</h2><table><thead><tr><th>Claim #</th><th>Service Date</th><th>CPT</th>'
+        '<th>Site</th><th>Billed</th><th>Plan Paid</th><th>You Owe</th><th>Status</th></tr></thead>'
+        f'<tbody>{rows}</tbody></table>'
+    ))
+
+
+def render_estimates(estimates):
+    rows = ''.join(
+        f'<tr><td>{e["id"]}</td><td>{e["created"]}</td><td>{e["cpt"]}</td><td>{e["desc"]}</td>'
+        f'<td>{e["site"]}</td><td>{"In" if e["in_network"] else "Out"}</td><td>${e["total"]:.2f}</td>'
+        f'<td>${e["member"]:.2f}</td><td><a href="/estimates/{e["id"]}">View</a></td></tr>'
+        for e in estimates)
+    return _layout('/estimates', (
+        '<h2>Estimate History</h2><table><thead><tr><th>#</th><th>Date</th><th>CPT</th><th>Description</th>'
+        '<th>Site</th><th>Network</th><th>Total</th><th>You Pay</th><th></th></tr></thead>'
+        f'<tbody>{rows}</tbody></table>'
+    ))
+
+
+def render_estimate_detail(estimate):
+    return _layout('/estimates', (
+        '<div class="card"><div class="card-header">'
+        f'<div>Estimate #{estimate["id"]} - CPT {estimate["cpt"]} ({estimate["desc"]})</div>'
+        f'<div>{estimate["created"]}</div></div>'
+        f'<div class="card-body">Total ${estimate["total"]:.2f}, plan pays ${estimate["plan"]:.2f}</div></div>'
+    ))
+
+
+def render_providers(query):
+    specialty = query.get('specialty')
+    network = query.get('network', 'Any')
+    accepting = query.get('accepting', 'Any')
+    results = ''
+    if specialty:
+        matches = [p for p in PROVIDERS if p['specialty'] == specialty
+                   and (network == 'Any' or p['in_network'] == (network == 'In-Network Only'))
+                   and (accepting == 'Any' or p['accepting'] == (accepting == 'Yes'))]
+        items = ''.join(f'<li class="provider">{html.escape(p["name"])} - {p["specialty"]}</li>' for p in matches)
+        results = f'<ul class="provider-results">{items or "<li>No providers found</li>"}</ul>'
+    return _layout('/providers', (
+        '<h2>Find Providers</h2><form method="get" action="/providers">'
+        f'<select name="specialty">{_options(SPECIALTIES, specialty)}</select>'
+        f'<select name="network">{_options(PROVIDER_NETWORKS, network)}</select>'
+        f'<select name="accepting">{_options(ACCEPTING, accepting)}</select>'
+        '<button type="submit">Search Providers</button></form>'
+        f'{results}'
+    ))
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    store = None          # set by make_server
+    latency = 0.0         # seconds added to every response
+    jitter = 0.0
+
+    def log_message(self, format, *args):
+        pass
+
+    def _delay(self):
+        if self.latency or self.jitter:
+            time.sleep(self.latency + random.uniform(0, self.jitter))
+
+    def _send(self, status, body='', headers=None):
+        data = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _redirect(self, location, headers=None):
+        self._send(303, '', dict(headers or {}, Location=location))
+
+    def _user(self):
+        for part in self.headers.get('Cookie', '').split(';'):
+            name, _, value = part.strip().partition('=')
+            if name == 'session':
+                return self.store.sessions.get(value)
+        return None
+
+    def _form(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        raw = self.rfile.read(length).decode('utf-8')
+        return {k: v[0] for k, v in parse_qs(raw).items()}
+
+    def do_GET(self):
+        self._delay()
+        url = urlparse(self.path)
+        path = url.path.rstrip('/') or '/'
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        if path == '/login':
+            return self._send(200, render_login())
+        if path == '/favicon.ico':
+            return self._send(404)
+        user = self._user()
+        if user is None:
+            return self._redirect('/login')
+        if path in ('/', '/dashboard'):
+            return self._send(200, render_dashboard(user))
+        if path == '/estimate':
+            return self._send(200, render_estimate())
+        if path == '/claims/new':
+            return self._send(200, render_claim_form())
+        if path == '/claims':
+            return self._send(200, render_claims(self.store.claims[user]))
+        if path == '/estimates':
+            return self._send(200, render_estimates(self.store.estimates[user]))
+        if path.startswith('/estimates/'):
+            wanted = path.rsplit('/', 1)[1]
+            for estimate in self.store.estimates[user]:
+                if str(estimate['id']) == wanted:
+                    return self._send(200, render_estimate_detail(estimate))
+            return self._send(404, _layout(path, '<h2>Estimate not found</h2>'))
+        if path == '/providers':
+            return self._send(200, render_providers(query))
+        if path == '/logout':
+            return self._redirect('/login', {'Set-Cookie': 'session=; Path=/; Max-Age=0'})
+        return self._send(404, _layout(path, '<h2>Not found</h2>'))
+
+    def do_POST(self):
+        self._delay()
+        path = urlparse(self.path).path.rstrip('/')
+        form = self._form()
+        if path == '/login':
+            username = form.get('username', '').strip()
+            account = USERS.get(username)
+            if not account or account['password'] != form.get('password'):
+                return self._send(200, render_login('Invalid username or password'))
+            token = secrets.token_hex(16)
+            self.store.sessions[token] = username
+            return self._redirect('/dashboard', {'Set-Cookie': f'session={token}; Path=/; HttpOnly'})
+        user = self._user()
+        if user is None:
+            return self._redirect('/login')
+        in_network = form.get('in_network', 'true') == 'true'
+        if path == '/estimate':
+            cpt = form.get('cpt', '').strip()
+            if cpt not in CPT_CODES:
+                return self._send(200, render_estimate(form, error=f"Invalid CPT code '{cpt}': not recognized"))
+            estimate = self.store.add_estimate(user, cpt, form.get('site', 'Clinic'), in_network)
+            return self._send(200, render_estimate(form, result=estimate))
+        if path == '/claims/new':
+            try:
+                claim = self.store.add_claim(user, form.get('cpt', ''), form.get('site', 'Clinic'), in_network,
+                                             form.get('billed_amount', ''), form.get('service_date', ''))
+            except ValueError:
+                return self._send(200, render_claim_form(error='Invalid billed amount'))
+            return self._send(200, render_claim_form(result=claim))
+        return self._send(404, _layout(path, '<h2>Not found</h2>'))
+
+
+def make_server(host='127.0.0.1', port=0, latency_ms=0, jitter_ms=0):
+    """Create (but do not start) a stand-in server; port 0 picks a free port."""
+    handler = type('Handler', (StandinHandler,), {
+        'store': Store(), 'latency': latency_ms / 1000.0, 'jitter': jitter_ms / 1000.0})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def start_in_background(latency_ms=0, jitter_ms=0, port=0):
+    """Start a stand-in server on a background thread; returns (server, login_url)."""
+    server = make_server(port=port, latency_ms=latency_ms, jitter_ms=jitter_ms)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address[:2]
+    return server, f"http://{host}:{port}/login"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in of the healthcare app for benchmarks")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency-ms', type=float, default=0, help='Artificial latency per request')
+    parser.add_argument('--jitter-ms', type=float, default=0, help='Random extra latency per request (0..N ms)')
+    args = parser.parse_args()
+    server = make_server(args.host, args.port, args.latency_ms, args.jitter_ms)
+    print(f"🏥 Stand-in app on http://{args.host}:{args.port}/login "
+          f"(latency {args.latency_ms:.0f} ms + up to {args.jitter_ms:.0f} ms jitter)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+"""
+Warm Browser Pool - keep pre-launched Chrome sessions ready for pytest runs
+
+Starting Chrome and chromedriver is a large fixed cost of every scenario. This daemon keeps
+K Chrome sessions running; each pytest process leases one through Remote WebDriver (set
+BROWSER_POOL=host:port, see shared_driver.start_driver) and hands it back when it quits.
+Returned sessions are reset (extra windows closed; cookies, cache, storage and service
+workers cleared and checked, see shared_driver.reset_state) and health-checked. Broken, worn-out (--max-uses) or abandoned (--lease-timeout) sessions are
+replaced with fresh ones.
+
+Usage Examples:
+    python browser_pool.py --size 3 --headless      # start the daemon (foreground)
+    set BROWSER_POOL=127.0.0.1:4460                 # then, in another shell
+    python run_scenarios_selective.py --workers 3
+    python browser_pool.py --status
+    python browser_pool.py --stop
+
+Requests are authenticated with BROWSER_POOL_AUTHKEY when set. Otherwise the daemon generates
+a random key at startup into BROWSER_POOL_KEY_FILE (default ~/.browser_pool_key, readable by
+its owner only), which clients on the same machine read; clients elsewhere need the env var.
+"""
+import os
+import sys
+import secrets
+import time
+import uuid
+import argparse
+import threading
+from collections import deque
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Listener
+
+from selenium import webdriver
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+
+from browser_profiles import BROWSER_PROFILES, current_profile_name
+
+DEFAULT_ADDRESS = "127.0.0.1:4460"
+KEY_FILE = os.environ.get('BROWSER_POOL_KEY_FILE', os.path.join(os.path.expanduser('~'), '.browser_pool_key'))
+
+
+def _client_authkey():
+    """The pool's key: BROWSER_POOL_AUTHKEY, else the key file the local daemon wrote."""
+    key = os.environ.get('BROWSER_POOL_AUTHKEY', '')
+    if key:
+        return key.encode()
+    try:
+        with open(KEY_FILE, 'r', encoding='utf-8') as fh:
+            key = fh.read().strip()
+    except OSError:
+        key = ''
+    if not key:
+        raise RuntimeError(f"No browser pool key: set BROWSER_POOL_AUTHKEY or start browser_pool.py "
+                           f"on this machine (it writes {KEY_FILE})")
+    return key.encode()
+
+
+def _server_authkey():
+    """BROWSER_POOL_AUTHKEY, else a new random key written to KEY_FILE (mode 0600) for local clients."""
+    key = os.environ.get('BROWSER_POOL_AUTHKEY', '')
+    if key:
+        return key.encode()
+    key = secrets.token_hex(32)
+    tmp_path = f"{KEY_FILE}.{os.getpid()}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'w', encoding='utf-8') as fh:
+        fh.write(key)
+    os.replace(tmp_path, KEY_FILE)
+    return key.encode()
+
+
+def _parse_address(address):
+    host, _, port = address.rpartition(':')
+    return (host or '127.0.0.1', int(port))
+
+
+# --- Client side (used by shared_driver) ---
+
+def _request(address, *message):
+    conn = Client(_parse_address(address), authkey=_client_authkey())
+    try:
+        conn.send(message)
+        status, payload = conn.recv()
+    finally:
+        conn.close()
+    if status != 'ok':
+        raise RuntimeError(f"Browser pool at {address}: {payload}")
+    return payload
+
+
+def lease(address, timeout=120, profile=None):
+    """Lease a warm session; returns a dict with lease_id, executor_url, session_id, capabilities and profile.
+
+    With ``profile`` the pool refuses the lease unless its sessions use that browser profile.
+    """
+    info = _request(address, 'lease', timeout, profile)
+    info['address'] = address
+    return info
+
+
+def release(address, lease_id, healthy=True):
+    """Hand a leased session back; ``healthy=False`` makes the pool replace it instead of reusing it."""
+    return _request(address, 'release', lease_id, healthy)
+
+
+class PooledChrome(webdriver.Remote):
+    """Remote WebDriver attached to an existing pooled session instead of creating a new one.
+
+    ``quit()`` returns the session to the pool rather than ending it.
+    """
+
+    def __init__(self, lease_info):
+        self._lease = lease_info
+        executor = ChromiumRemoteConnection(lease_info['executor_url'], vendor_prefix='goog',
+                                            browser_name='chrome')
+        super().__init__(command_executor=executor, options=webdriver.ChromeOptions())
+
+    def start_session(self, capabilities):
+        self.session_id = self._lease['session_id']
+        self.caps = self._lease['capabilities']
+
+    def quit(self, healthy=True):
+        if self._lease is not None:
+            lease_info, self._lease = self._lease, None
+            release(lease_info['address'], lease_info['lease_id'], healthy)
+
+
+def attach(lease_info):
+    return PooledChrome(lease_info)
+
+
+# --- Daemon side ---
+
+def _is_healthy(driver):
+    try:
+        return driver.execute_script('return 1') == 1
+    except Exception:
+        return False
+
+
+def _reset_browser(driver):
+    """Bring a returned session back to a blank state; raises when it cannot (see shared_driver.reset_state)."""
+    import shared_driver
+    shared_driver.reset_state(driver)
+
+
+class _PooledBrowser:
+    def __init__(self, driver):
+        self.driver = driver
+        self.uses = 0
+        self.leased_at = None
+
+
+class BrowserPool:
+    """Keeps ``size`` Chrome sessions launched; hands them out and takes them back."""
+
+    def __init__(self, size, headless=False, max_uses=20, lease_timeout=1800, profile=None):
+        self.size = size
+        self.headless = headless
+        # Resolved once, so the sessions and what lease replies report can never disagree
+        self.profile = profile or current_profile_name()
+        self.max_uses = max_uses
+        self.lease_timeout = lease_timeout
+        self._cond = threading.Condition()
+        self._idle = deque()
+        self._leased = {}
+        self._launching = 0
+        self.stats = {'launched': 0, 'leases': 0, 'recycled': 0}
+
+    def _launch(self):
+        import shared_driver
+        try:
+            browser = _PooledBrowser(shared_driver.create_chrome(headless=self.headless, profile=self.profile))
+        except Exception as e:
+            print(f"❌ Failed to launch pooled Chrome: {e}", flush=True)
+            browser = None
+        with self._cond:
+            self._launching -= 1
+            if browser is not None:
+                self.stats['launched'] += 1
+                self._idle.append(browser)
+            self._cond.notify_all()
+
+    def _retire(self, browser):
+        self.stats['recycled'] += 1
+        try:
+            browser.driver.quit()
+        except Exception:
+            pass
+
+    def top_up(self):
+        """Launch replacements in the background until the pool is back at ``size``."""
+        with self._cond:
+            missing = self.size - len(self._idle) - len(self._leased) - self._launching
+            self._launching += max(0, missing)
+        for _ in range(missing):
+            threading.Thread(target=self._launch, daemon=True).start()
+
+    def lease(self, timeout, profile=None):
+        if profile and profile != self.profile:
+            # Timings of a run are recorded under the profile it asked for; never hand it another one
+            raise RuntimeError(f"pool runs the '{self.profile}' browser profile, not '{profile}' "
+                               f"(restart it with --browser-profile {profile})")
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._cond:
+                while not self._idle:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise RuntimeError(f"no browser available within {timeout}s")
+                    self._cond.wait(remaining)
+                browser = self._idle.popleft()
+            if _is_healthy(browser.driver):
+                break
+            self._retire(browser)
+            self.top_up()
+        lease_id = uuid.uuid4().hex
+        browser.uses += 1
+        browser.leased_at = time.monotonic()
+        with self._cond:
+            self._leased[lease_id] = browser
+            self.stats['leases'] += 1
+        driver = browser.driver
+        return {
+            'lease_id': lease_id,
+            'executor_url': driver.service.service_url,
+            'session_id': driver.session_id,
+            'capabilities': driver.caps,
+            'profile': self.profile,
+        }
+
+    def release(self, lease_id, healthy=True):
+        with self._cond:
+            browser = self._leased.pop(lease_id, None)
+        if browser is None:
+            raise RuntimeError(f"unknown lease {lease_id}")
+        if healthy and browser.uses < self.max_uses:
+            try:
+                _reset_browser(browser.driver)
+                healthy = _is_healthy(browser.driver)
+            except Exception:
+                healthy = False
+        else:
+            healthy = False
+        if healthy:
+            with self._cond:
+                self._idle.append(browser)
+                self._cond.notify_all()
+        else:
+            self._retire(browser)
+            self.top_up()
+        return True
+
+    def maintain(self):
+        """Reclaim abandoned leases and replace idle sessions that failed their health check."""
+        now = time.monotonic()
+        with self._cond:
+            expired = [lid for lid, b in self._leased.items() if now - b.leased_at > self.lease_timeout]
+            stale = [self._leased.pop(lid) for lid in expired]
+            idle = list(self._idle)
+        for browser in stale:
+            print("⚠️  Reclaiming abandoned lease", flush=True)
+            self._retire(browser)
+        for browser in idle:
+            if not _is_healthy(browser.driver):
+                with self._cond:
+                    if browser not in self._idle:
+                        continue  # leased meanwhile; lease() checks health itself
+                    self._idle.remove(browser)
+                self._retire(browser)
+        self.top_up()
+
+    def status(self):
+        with self._cond:
+            return dict(self.stats, idle=len(self._idle), leased=len(self._leased),
+                        launching=self._launching, size=self.size, profile=self.profile)
+
+    def shutdown(self):
+        with self._cond:
+            browsers = list(self._idle) + list(self._leased.values())
+            self._idle.clear()
+            self._leased.clear()
+        for browser in browsers:
+            self._retire(browser)
+
+
+def serve(pool, address, authkey, check_interval=30):
+    """Serve lease/release/status/shutdown requests until a shutdown request arrives.
+
+    ``multiprocessing.connection`` unpickles what it receives, so it only listens with a key.
+    """
+    if not authkey:
+        raise ValueError("Refusing to start the browser pool without an auth key")
+    listener = Listener(_parse_address(address), authkey=authkey)
+    stopping = threading.Event()
+
+    def handle(conn):
+        try:
+            command, *params = conn.recv()
+            if command == 'lease':
+                reply = ('ok', pool.lease(*params))
+            elif command == 'release':
+                reply = ('ok', pool.release(*params))
+            elif command == 'status':
+                reply = ('ok', pool.status())
+            elif command == 'shutdown':
+                stopping.set()
+                reply = ('ok', True)
+            else:
+                reply = ('error', f"unknown command {command}")
+        except Exception as e:
+            reply = ('error', str(e))
+        try:
+            conn.send(reply)
+        finally:
+            conn.close()
+        if stopping.is_set():
+            # Unblock accept() in the main thread
+            try:
+                Client(_parse_address(address), authkey=authkey).close()
+            except Exception:
+                pass
+
+    def maintenance():
+        while not stopping.wait(check_interval):
+            pool.maintain()
+
+    threading.Thread(target=maintenance, daemon=True).start()
+    pool.top_up()
+    print(f"🚀 Browser pool listening on {address} with {pool.size} sessions", flush=True)
+    try:
+        while not stopping.is_set():
+            try:
+                conn = listener.accept()
+            except AuthenticationError:
+                print("⚠️  Rejected a browser pool request with a wrong auth key", flush=True)
+                continue
+            if stopping.is_set():
+                conn.close()
+                break
+            threading.Thread(target=handle, args=(conn,), daemon=True).start()
+    finally:
+        listener.close()
+        pool.shutdown()
+        print("🛑 Browser pool stopped", flush=True)
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description="Warm Chrome session pool for the test suite")
+    parser.add_argument('--address', default=os.environ.get('BROWSER_POOL') or DEFAULT_ADDRESS,
+                        help=f'host:port to listen on / talk to (default: {DEFAULT_ADDRESS})')
+    parser.add_argument('--size', type=int, default=2, metavar='K',
+                        help='Number of warm Chrome sessions to keep (default: 2)')
+    parser.add_argument('--headless', action='store_true', help='Launch pooled browsers headless')
+    parser.add_argument('--browser-profile', choices=sorted(BROWSER_PROFILES),
+                        help='Chrome profile of the pooled sessions (default: BROWSER_PROFILE or faithful)')
+    parser.add_argument('--max-uses', type=int, default=20, metavar='N',
+                        help='Recycle a session after N leases (default: 20)')
+    parser.add_argument('--lease-timeout', type=int, default=1800, metavar='SECONDS',
+                        help='Reclaim sessions not returned within this time (default: 1800)')
+    parser.add_argument('--status', action='store_true', help='Print the status of a running pool')
+    parser.add_argument('--stop', action='store_true', help='Stop a running pool')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_arguments()
+    if args.status:
+        print(_request(args.address, 'status'))
+        return 0
+    if args.stop:
+        _request(args.address, 'shutdown')
+        return 0
+    authkey = _server_authkey()
+    pool = BrowserPool(args.size, headless=args.headless, max_uses=args.max_uses,
+                       lease_timeout=args.lease_timeout, profile=args.browser_profile)
+    try:
+        serve(pool, args.address, authkey)
+    except KeyboardInterrupt:
+        pool.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
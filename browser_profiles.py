@@ -0,0 +1,49 @@
+"""Named Chrome session profiles, selected with BROWSER_PROFILE or run_scenarios_selective.py --browser-profile.
+
+faithful (default)  what a user gets: normal page-load strategy, maximized window, nothing blocked
+fast                eager page-load strategy (navigation returns at DOMContentLoaded), images,
+                    fonts and third-party trackers blocked through CDP Network.setBlockedURLs,
+                    extensions and background networking disabled, fixed 1366x900 viewport
+
+Kept free of selenium imports so the runner can list the names cheaply.
+"""
+import os
+
+DEFAULT_PROFILE = 'faithful'
+
+BROWSER_PROFILES = {
+    'faithful': {
+        'page_load_strategy': 'normal',
+        'window_size': None,  # maximized
+        'arguments': [],
+        'blocked_urls': [],
+    },
+    'fast': {
+        'page_load_strategy': 'eager',
+        'window_size': (1366, 900),
+        'arguments': [
+            '--disable-extensions',
+            '--disable-background-networking',
+            '--disable-component-update',
+            '--disable-default-apps',
+            '--disable-sync',
+            '--no-first-run',
+        ],
+        'blocked_urls': [
+            '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico',
+            '*.woff', '*.woff2', '*.ttf', '*.otf',
+            '*fonts.googleapis.com*', '*fonts.gstatic.com*',
+            '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+        ],
+    },
+}
+
+
+def current_profile_name():
+    """Profile named by BROWSER_PROFILE; unknown names warn and fall back to the default."""
+    name = os.environ.get('BROWSER_PROFILE', DEFAULT_PROFILE).strip().lower() or DEFAULT_PROFILE
+    if name not in BROWSER_PROFILES:
+        print(f"⚠️  Unknown BROWSER_PROFILE '{name}', using '{DEFAULT_PROFILE}' "
+              f"(choices: {', '.join(BROWSER_PROFILES)})")
+        name = DEFAULT_PROFILE
+    return name
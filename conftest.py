@@ -1,16 +1,36 @@
 import os
+import re
+import sys
+import time
+from datetime import datetime
 import pytest
-import shared_driver
+import auth_cache
+import browser_profiles
+import webdriver_timeline
+import report_store
+import live_events
+import artifacts
+from tests.data_store import get_current_scenario_data
+from tests.pacing import get_pacing_report
+# shared_driver and tests.helpers import Selenium; they are loaded only once a browser is needed
+
+# Single-process multi-scenario runs (--scenario-select, inert otherwise), history-driven ordering
+# and retries of transient failures
+pytest_plugins = ["conftest_parametrized", "history_order", "recovery"]
 
 
 @pytest.fixture(scope="session", autouse=True)
 def shared_session():
-    """Session-scoped fixture that starts shared driver and logs in once for the whole pytest run."""
+    """Session-scoped fixture that starts shared driver and logs in once for the whole pytest run.
+
+    Under pytest-xdist this runs once per worker: every worker has its own browser and login.
+    """
+    import shared_driver
     headless = os.environ.get('HEADLESS', 'false').lower() in ('1', 'true', 'yes')
     shared_driver.start_driver(headless=headless)
     username = os.environ.get('TEST_USERNAME', 'alexsingh')
     password = os.environ.get('TEST_PASSWORD', 'demo123')
-    shared_driver.login(username, password)
+    shared_driver.ensure_login(username, password)
 
     yield
 
@@ -22,11 +42,213 @@ def shared_session():
 
 
 
-def pytest_collection_modifyitems(items):
-    """Run positive tests before negative tests. Unmarked default to positive."""
-    def sort_key(item):
+# Per-test outcome/duration of this session, written to the run history at the end
+_run = {'started': None, 'exitstatus': None, 'results': {}, 'artifacts': 0}
+# pytest-xdist worker id (gw0, gw1, ...); the controller records history and emits live events
+_worker = os.environ.get('PYTEST_XDIST_WORKER')
+# Suffix pytest-xdist --dist loadgroup appends to node ids (groups are named by _assign_groups)
+_XDIST_GROUP_SUFFIX = re.compile(r'@xg-\w+$')
+
+
+def pytest_configure(config):
+    if webdriver_timeline.enabled():
+        webdriver_timeline.install()
+
+
+def pytest_sessionstart(session):
+    _run['started'] = time.time()
+
+
+def pytest_collection_finish(session):
+    if _worker not in (None, 'gw0'):
+        return  # every worker collects the same tests; count them once
+    live_events.emit('session_start', tests=len(session.items), scenario=os.environ.get('CURRENT_SCENARIO'))
+
+
+def pytest_runtest_logstart(nodeid, location):
+    if not _worker:
+        live_events.emit('test_start', nodeid=_XDIST_GROUP_SUFFIX.sub('', nodeid))
+
+
+def pytest_runtest_logreport(report):
+    nodeid = _XDIST_GROUP_SUFFIX.sub('', report.nodeid)
+    entry = _run['results'].get(nodeid)
+    if entry is None:
+        scenario = getattr(report, 'scenario', None) or get_current_scenario_data().get('scenario_name')
+        entry = _run['results'][nodeid] = {
+            'nodeid': nodeid, 'scenario': scenario, 'outcome': 'passed', 'duration': 0.0, 'reruns': 0}
+    _run['artifacts'] += sum(len(content.splitlines()) for title, content in report.sections
+                             if title == 'failure artifacts')
+    entry['duration'] += report.duration
+    if report.failed:
+        entry['outcome'] = 'failed'
+        crash = getattr(report.longrepr, 'reprcrash', None)
+        lines = (crash.message if crash else report.longreprtext).strip().splitlines()
+        entry['message'] = lines[0][:300] if lines else ''
+    elif report.skipped and entry['outcome'] != 'failed':
+        entry['outcome'] = 'skipped'
+    elif report.outcome == 'rerun':
+        # A failed attempt recovery.py retried; the test's outcome is that of its last attempt
+        entry['reruns'] += 1
+
+
+def pytest_runtest_logfinish(nodeid, location):
+    entry = _run['results'].get(_XDIST_GROUP_SUFFIX.sub('', nodeid))
+    if entry is not None and not _worker:
+        live_events.emit('test_end', **entry)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    _run['exitstatus'] = int(exitstatus)
+    _run['artifact_summary'] = artifacts.flush() if _run['artifacts'] else None
+
+
+def pytest_unconfigure(config):
+    """Record the run in the history store and archive its HTML report if it was written to reports/.
+
+    Under pytest-xdist only the controller records; it receives every worker's reports.
+    """
+    if not _run['results'] or _run['started'] is None or _worker:
+        return
+    results = list(_run['results'].values())
+    html_path = getattr(config.option, 'htmlpath', None)
+    scenarios = {r['scenario'] for r in results}
+    try:
+        report_store.record_run(results, _run['started'], time.time() - _run['started'], _run['exitstatus'],
+                                scenario=scenarios.pop() if len(scenarios) == 1 else None, report=html_path,
+                                profile=browser_profiles.current_profile_name())
+        if html_path and os.path.isfile(html_path) and \
+                os.path.abspath(os.path.dirname(html_path)) == os.path.abspath(report_store.REPORTS_DIR):
+            failed = sum(1 for r in results if r['outcome'] == 'failed')
+            report_store.archive(html_path, summary=f"{len(results) - failed}/{len(results)} passed")
+    except Exception as e:
+        print(f"⚠️  Could not update the run history: {e}")
+
+
+def _scenario_name(item):
+    """Scenario a collected test runs for: its parameter in single-process runs, else the current one."""
+    callspec = getattr(item, 'callspec', None)
+    if callspec is not None and 'scenario_row' in callspec.params:
+        return callspec.params['scenario_row'][1].get('scenario_name')
+    return get_current_scenario_data().get('scenario_name')
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Capture screenshot, DOM and console log for failing tests (written in the background)."""
+    outcome = yield
+    report = outcome.get_result()
+    if not report.failed or report.when == 'teardown' or not artifacts.enabled():
+        return
+    shared_driver = sys.modules.get('shared_driver')
+    driver = shared_driver and shared_driver.active_driver()
+    if driver is None:
+        return
+    # recovery.py counts the attempts already retried in the 'reruns' user property
+    retry = dict(item.user_properties).get('reruns', 0)
+    saved = artifacts.capture(driver, _scenario_name(item), item.name, report.when, retry=retry)
+    if saved:
+        # Counted from this section in pytest_runtest_logreport, which also sees xdist workers' reports
+        report.sections.append(("failure artifacts", "\n".join(f"{kind}: {path}" for kind, path in saved.items())))
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    """Attribute timeline events recorded during setup/call/teardown to this test."""
+    webdriver_timeline.set_current_test(item.nodeid)
+    yield
+    webdriver_timeline.set_current_test(None)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    """Run positive tests before negative tests. Unmarked default to positive.
+
+    Within each group history_order.py puts likely failures and cheap tests first (and, with
+    FAILED_FIRST set, tests that failed in their last recorded run), honouring ``after`` markers.
+    Runs first so pytest-xdist sees the xdist_group markers before it renames node ids.
+    """
+    def priority(item):
         is_neg = item.get_closest_marker("negative") is not None
         is_pos = item.get_closest_marker("positive") is not None
-        priority = 0 if is_pos or not (is_pos or is_neg) else 1
-        return (priority, item.fspath.basename.lower(), item.name.lower())
+        return 0 if is_pos or not (is_pos or is_neg) else 1
+
+    def sort_key(item):
+        return (priority(item), item.fspath.basename.lower(), item.name.lower())
     items.sort(key=sort_key)
+    import history_order  # already loaded through pytest_plugins; a top-level import would bypass that
+    history_order.reorder(items, config, priority, _scenario_name)
+    _assign_groups(config, items, history_order)
+
+
+def _assign_groups(config, items, history_order):
+    """Mark tests with xdist_group for ``--dist loadgroup``.
+
+    Single-process scenario runs keep each scenario on one worker (one login per scenario).
+    Otherwise tests linked by ``after`` markers share a worker and the rest spread freely.
+    """
+    if not _worker:
+        return
+    by_scenario = bool(getattr(config, '_scenarios', None))
+    groups = history_order.dependency_groups(items, _scenario_name, by_scenario)
+    for item in items:
+        item.add_marker(pytest.mark.xdist_group(groups[id(item)]))
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Report time spent in page-settled waits and action pacing for this run."""
+    tr = terminalreporter
+    scenario = os.environ.get('CURRENT_SCENARIO')
+
+    if webdriver_timeline.enabled() and webdriver_timeline.summarize():
+        scenario_part = f"scenario_{scenario}_" if scenario else ""
+        path = os.environ.get('WEBDRIVER_TIMELINE_PATH') or os.path.join(
+            'reports', f"timeline_{scenario_part}{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+        summary = webdriver_timeline.write(path)
+        tr.section("webdriver timeline")
+        header = f"{'network':>8} {'explicit':>8} {'implicit':>8} {'sleep':>8} {'pacing':>8} {'cmds':>5}  test"
+        tr.write_line(header)
+        for test, row in summary.items():
+            tr.write_line(f"{row['network']:8.2f} {row['explicit']:8.2f} {row['implicit']:8.2f} "
+                          f"{row['sleep']:8.2f} {row['pacing']:8.2f} {row['commands']:5}  {test}")
+        tr.write_line(f"timeline written to {path}")
+
+    if _run.get('artifact_summary'):
+        summary = _run['artifact_summary']
+        tr.section("failure artifacts")
+        if summary['bytes']:
+            tr.write_line(f"{_run['artifacts']} file(s), {summary['bytes'] / 1024:.0f} KB in {summary['dir']}")
+        else:
+            # pytest-xdist controller: the workers wrote them, each into its own run directory
+            tr.write_line(f"{_run['artifacts']} file(s) in {artifacts.ARTIFACTS_DIR}")
+        if summary['dropped']:
+            tr.write_line(f"{summary['dropped']} artifact(s) dropped: ARTIFACTS_MAX_MB={artifacts.ARTIFACTS_MAX_MB} reached")
+
+    if auth_cache.enabled():
+        stats = auth_cache.get_stats()
+        tr.section("auth cache")
+        tr.write_line(f"this run: {stats['run']['hit']} hit(s), {stats['run']['miss']} miss(es); "
+                      f"all runs: {stats['lifetime']['hit']} hit(s), {stats['lifetime']['miss']} miss(es)")
+
+    pacing = get_pacing_report()
+    if pacing['count']:
+        tr.section("action pacing")
+        if scenario:
+            tr.write_line(f"scenario {scenario}")
+        for key, entry in pacing['by_action'].items():
+            tr.write_line(f"  {entry['seconds']:6.2f}s  {entry['count']:4} x {key}")
+        tr.write_line(f"total {pacing['total']:.2f}s over {pacing['count']} actions (mode: {pacing['mode']})")
+
+    helpers = sys.modules.get('tests.helpers')
+    report = helpers.get_settle_report() if helpers else {'count': 0}
+    if not report['count']:
+        return
+    tr.section("page settle waits")
+    if scenario:
+        tr.write_line(f"scenario {scenario}")
+    for rec in report['waits']:
+        status = "settled" if rec['settled'] else "TIMEOUT"
+        replaced = f" (replaces {rec['replaces']:.1f}s sleep)" if rec['replaces'] else ""
+        tr.write_line(f"  {rec['elapsed']:6.2f}s  {status:8} {rec['label']}{replaced}")
+    tr.write_line(f"total {report['total']:.2f}s over {report['count']} waits, "
+                  f"max {report['max']:.2f}s, saved {report['saved']:.2f}s vs fixed sleeps")
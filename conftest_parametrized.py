@@ -0,0 +1,189 @@
+"""Single-process parametrized scenario runs.
+
+Loaded from conftest.py as a pytest plugin and inert unless ``--scenario-select`` is given.
+In that mode one pytest run collects every selected testdata.csv row as a parameter of each
+TC test, so interpreter startup, plugin loading, collection and report setup are paid once
+instead of once per scenario:
+
+    pytest --scenario-select all
+    pytest --scenario-select first:3
+    pytest --scenario-select last:2
+    pytest --scenario-select range:2-4
+    pytest --scenario-select list:1,3,5
+
+Tests run grouped by scenario (positive before negative within each group, as usual). The
+shared browser re-logs in when the next scenario uses a different account (after
+shared_driver.reset_state() wiped the previous one's state), and --maxfail
+applies per scenario: after a scenario reaches it, its remaining tests are skipped and the
+next scenario still runs.
+"""
+import json
+import os
+
+import pytest
+
+from tests.data_store import load_test_data
+
+_current = {}
+_config = None
+
+
+def get_current_scenario_data():
+    """Data row of the scenario whose test is running, or {} outside parametrized runs."""
+    return _current.get('data', {})
+
+
+def select_scenarios(spec, scenarios):
+    """Return [(1-based index, row), ...] for a selection spec; raises ValueError on a bad spec."""
+    total = len(scenarios)
+    kind, _, value = spec.partition(':')
+    kind = kind.strip().lower()
+    if kind == 'all':
+        indices = range(1, total + 1)
+    elif kind == 'first':
+        indices = range(1, min(int(value), total) + 1)
+    elif kind == 'last':
+        indices = range(max(1, total - int(value) + 1), total + 1)
+    elif kind == 'range':
+        start, end = map(int, value.split('-'))
+        indices = range(max(1, start), min(total, end) + 1)
+    elif kind == 'list':
+        indices = [int(x) for x in value.split(',') if x.strip()]
+        indices = [i for i in indices if 1 <= i <= total]
+    else:
+        raise ValueError(f"Invalid --scenario-select value: {spec}")
+    return [(i, scenarios[i - 1]) for i in indices]
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("scenarios")
+    group.addoption("--scenario-select", metavar="SPEC", default=None,
+                    help="Run selected testdata.csv scenarios in this process: all, first:N, last:N, "
+                         "range:A-B or list:1,3,7")
+    group.addoption("--scenario-results", metavar="PATH", default=None,
+                    help="Write per-scenario pass/fail counts as JSON (used by run_scenarios_selective.py)")
+
+
+def pytest_configure(config):
+    spec = config.getoption("scenario_select")
+    if not spec:
+        config._scenarios = None
+        return
+    try:
+        config._scenarios = select_scenarios(spec, load_test_data())
+    except ValueError as e:
+        raise pytest.UsageError(str(e))
+    if not config._scenarios:
+        raise pytest.UsageError(f"--scenario-select {spec} matched no scenarios in testdata.csv")
+    # --maxfail counts per scenario in this mode; see pytest_runtest_setup
+    config._scenario_maxfail = config.option.maxfail
+    config.option.maxfail = 0
+    config._scenario_results = {
+        index: {'name': row.get('scenario_name', f'Scenario_{index}'), 'passed': 0, 'failed': 0, 'skipped': 0,
+                'rerun': 0}
+        for index, row in config._scenarios
+    }
+
+
+@pytest.fixture(autouse=True)
+def scenario_row(request):
+    """Activate the scenario this test instance was parametrized with (no-op in normal runs)."""
+    param = getattr(request, 'param', None)
+    if param is None:
+        yield None
+        return
+    index, data = param
+    _activate(index, data)
+    yield data
+
+
+def _activate(index, data):
+    if _current.get('index') == index:
+        return
+    _current['index'] = index
+    _current['data'] = data
+    os.environ['CURRENT_SCENARIO'] = str(index)
+    username = data.get('username') or os.environ.get('TEST_USERNAME', 'alexsingh')
+    password = data.get('password') or os.environ.get('TEST_PASSWORD', 'demo123')
+    os.environ['TEST_USERNAME'] = username
+    os.environ['TEST_PASSWORD'] = password
+    import shared_driver
+    shared_driver.ensure_login(username, password)
+
+
+def pytest_generate_tests(metafunc):
+    scenarios = getattr(metafunc.config, '_scenarios', None)
+    if scenarios and 'scenario_row' in metafunc.fixturenames:
+        ids = [row.get('scenario_name') or f'Scenario_{index}' for index, row in scenarios]
+        metafunc.parametrize('scenario_row', scenarios, ids=ids, indirect=True)
+
+
+def _scenario_index(item):
+    callspec = getattr(item, 'callspec', None)
+    if callspec is None or 'scenario_row' not in callspec.params:
+        return None
+    return callspec.params['scenario_row'][0]
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config, items):
+    """Group tests by scenario in selection order; the stable sort keeps conftest's order inside each group."""
+    if getattr(config, '_scenarios', None):
+        position = {index: pos for pos, (index, _) in enumerate(config._scenarios)}
+        items.sort(key=lambda item: position.get(_scenario_index(item), 0))
+
+
+def pytest_runtest_setup(item):
+    config = item.config
+    index = _scenario_index(item)
+    if index is None or not config._scenario_maxfail:
+        return
+    result = config._scenario_results[index]
+    if result['failed'] >= config._scenario_maxfail:
+        pytest.skip(f"{result['name']}: stopped after {result['failed']} failure(s) (--maxfail)")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+    index = _scenario_index(item)
+    if index is not None:
+        report.scenario = item.config._scenario_results[index]['name']
+        report.scenario_index = index
+
+
+def pytest_runtest_logreport(report):
+    index = getattr(report, 'scenario_index', None)
+    results = getattr(_config, '_scenario_results', None)
+    if index is None or results is None:
+        return
+    if report.when == 'call' or report.outcome != 'passed':
+        results[index][report.outcome] += 1
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_sessionstart(session):
+    global _config
+    _config = session.config
+
+
+def pytest_sessionfinish(session):
+    path = session.config.getoption("scenario_results")
+    results = getattr(session.config, '_scenario_results', None)
+    # Under pytest-xdist the controller sees every worker's reports and writes the file
+    if path and results is not None and not os.environ.get('PYTEST_XDIST_WORKER'):
+        with open(path, 'w', encoding='utf-8') as fh:
+            json.dump(results, fh, indent=2)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_html_results_table_header(cells):
+    if _config is not None and _config._scenarios:
+        cells.insert(1, '<th class="sortable" data-column-type="scenario">Scenario</th>')
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_html_results_table_row(report, cells):
+    if _config is not None and _config._scenarios:
+        cells.insert(1, f'<td class="col-scenario">{getattr(report, "scenario", "")}</td>')
@@ -0,0 +1,153 @@
+"""History-driven test ordering for a fast first failure.
+
+Loaded from conftest.py as a pytest plugin; conftest's pytest_collection_modifyitems calls
+reorder() after its positive-before-negative sort. Within each of those groups, tests are
+ordered by failure probability per second of runtime, highest first. For --maxfail=1 runs
+this order gives the shortest expected time to the first failure. Both numbers come from
+each test's recent results in the report_store history:
+
+    score = (failures + 1) / (runs + 2) / median seconds
+
+The +1/+2 smoothing gives tests with little or no history a 50% prior, so new tests run early
+rather than last. Tests without any recorded duration are assumed to take the median one.
+
+FAILED_FIRST (run_scenarios_selective.py --failed-first) still puts tests that failed in
+their last run ahead of the rest of their group. Dependencies declared with
+``@pytest.mark.after("test_name", ...)`` are always honoured: a test never runs before the
+tests it names (function name or node id suffix) in the same scenario. The positive group
+always runs before the negative one.
+
+--no-history-order or HISTORY_ORDER=0 keeps the plain positive/negative, file-name order.
+
+Under pytest-xdist every worker collects and orders the tests itself, and xdist requires the
+same order everywhere, so the controller hands all workers the same history cut-off run id.
+dependency_groups() names the xdist_group each test joins for ``--dist loadgroup``.
+"""
+import os
+import re
+import statistics
+
+import pytest
+
+import report_store
+
+HISTORY_RUNS = int(os.environ.get('HISTORY_ORDER_RUNS', 10))  # recent results per test that count
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("ordering")
+    group.addoption("--no-history-order", action="store_true", default=False,
+                    help="Do not reorder tests by recorded failure rate and duration")
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """xdist controller: pin the history every worker orders by."""
+    node.workerinput['history_up_to'] = report_store.latest_run_id()
+
+
+def _up_to(config):
+    workerinput = getattr(config, 'workerinput', None)
+    return workerinput.get('history_up_to') if workerinput else None
+
+
+def enabled(config):
+    if config.getoption("no_history_order", default=False):
+        return False
+    return os.environ.get('HISTORY_ORDER', '1').lower() not in ('0', 'false', 'no')
+
+
+def dependencies(item):
+    """Names given to the item's ``after`` markers."""
+    return [name for marker in item.iter_markers("after") for name in marker.args]
+
+
+def _matches(item, name):
+    return getattr(item, 'originalname', item.name) == name or item.nodeid.split('[')[0].endswith(name)
+
+
+def _score(item, scenario, stats, default_seconds):
+    test_id = report_store.base_nodeid(item.nodeid, scenario)
+    failures, runs, seconds = stats.get((scenario, test_id)) or stats.get((None, test_id)) or (0, 0, None)
+    seconds = max(seconds if seconds is not None else default_seconds, 0.01)
+    return (failures + 1) / (runs + 2) / seconds
+
+
+def _place(group, rank, scenario_of):
+    """Order ``group`` by ``rank`` (lower first) without running a test before its dependencies."""
+    needs = {}
+    for item in group:
+        names = dependencies(item)
+        if names:
+            needs[id(item)] = {id(other) for other in group if other is not item
+                               and scenario_of(other) == scenario_of(item)
+                               and any(_matches(other, name) for name in names)}
+    pending = sorted(group, key=rank)
+    placed, done = [], set()
+    while pending:
+        # First ranked test whose dependencies have run; on a dependency cycle keep the ranked order
+        position = next((pos for pos, item in enumerate(pending) if needs.get(id(item), set()) <= done), 0)
+        item = pending.pop(position)
+        placed.append(item)
+        done.add(id(item))
+    return placed
+
+
+def reorder(items, config, group_of, scenario_of):
+    """Reorder ``items`` in place; ``group_of`` gives the positive/negative group, ``scenario_of`` the scenario."""
+    history = enabled(config)
+    up_to = _up_to(config)
+    stats = report_store.test_stats(HISTORY_RUNS, up_to=up_to) if history else {}
+    failed_last = {}
+    if os.environ.get('FAILED_FIRST'):
+        failed_last = report_store.last_outcomes(up_to=up_to)
+    durations = [seconds for (scenario, _), (_, _, seconds) in stats.items() if scenario is None]
+    default_seconds = statistics.median(durations) if durations else 1.0
+    position = {id(item): pos for pos, item in enumerate(items)}
+
+    def rank(item):
+        scenario = scenario_of(item)
+        test_id = report_store.base_nodeid(item.nodeid, scenario)
+        failed_before = failed_last.get(scenario, {}).get(test_id) == 'failed'
+        score = _score(item, scenario, stats, default_seconds) if history else 0.0
+        return (not failed_before, -score, position[id(item)])
+
+    groups = {}
+    for item in items:
+        groups.setdefault(group_of(item), []).append(item)
+    ordered = []
+    for key in sorted(groups):
+        ordered.extend(_place(groups[key], rank, scenario_of))
+    items[:] = ordered
+
+
+def dependency_groups(items, scenario_of, by_scenario):
+    """{id(item): xdist group name} for ``--dist loadgroup``.
+
+    With ``by_scenario`` every scenario is one group. Otherwise each set of tests linked by
+    ``after`` markers within a scenario is a group, and independent tests get their own.
+    """
+    parent = {id(item): id(item) for item in items}
+
+    def root(key):
+        while parent[key] != key:
+            parent[key] = parent[parent[key]]
+            key = parent[key]
+        return key
+
+    if not by_scenario:
+        for item in items:
+            for name in dependencies(item):
+                for other in items:
+                    if other is not item and scenario_of(other) == scenario_of(item) and _matches(other, name):
+                        parent[root(id(other))] = root(id(item))
+    first = {}
+    for item in items:
+        first.setdefault(root(id(item)), item)
+    groups = {}
+    for item in items:
+        scenario = scenario_of(item) or 'default'
+        lead = first[root(id(item))]
+        name = scenario if by_scenario else f"{scenario}-{getattr(lead, 'originalname', lead.name)}"
+        groups[id(item)] = 'xg-' + re.sub(r'\W+', '_', name)
+    return groups
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Live Events - per-test progress stream and consolidated run dashboard
+
+When EVENT_STREAM names a file (run_scenarios_selective.py --live sets it), the runner and
+every pytest process append one JSON line per event as it happens:
+
+    run_start / run_end            runner: selected scenarios, mode
+    scenario_start / scenario_end  runner: scenario index, name, exit code, duration
+    session_start                  conftest: number of collected tests in that pytest process
+    test_start / test_end          conftest: nodeid, scenario, outcome, duration, failure message,
+                                   retries after transient failures (recovery.py)
+
+Dashboard follows the stream from its last read offset, folds only the new lines into its
+totals and rewrites one auto-refreshing HTML page with throughput, ETA, per-scenario status,
+the slowest tests, retried tests and all failures so far, so it stays cheap however long the run gets.
+
+Usage Examples:
+    python live_events.py reports/events_20260101_120000.jsonl --html reports/live.html
+"""
+import argparse
+import html
+import json
+import os
+import sys
+import threading
+import time
+
+SLOWEST = 10
+
+_stream = None
+_stream_lock = threading.Lock()
+
+
+def enabled():
+    return bool(os.environ.get('EVENT_STREAM'))
+
+
+def emit(kind, **fields):
+    """Append one event to EVENT_STREAM (no-op when it is unset)."""
+    global _stream
+    path = os.environ.get('EVENT_STREAM')
+    if not path:
+        return
+    fields.update(event=kind, time=time.time(), pid=os.getpid())
+    line = json.dumps(fields, default=str) + '\n'
+    with _stream_lock:
+        if _stream is None or _stream.name != path:
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            _stream = open(path, 'a', encoding='utf-8')
+        # One write per line so concurrent pytest processes never interleave within a line
+        _stream.write(line)
+        _stream.flush()
+
+
+class Dashboard:
+    """Incrementally folds an event stream into run totals and renders them as HTML."""
+
+    def __init__(self, stream_path, html_path):
+        self.stream_path = stream_path
+        self.html_path = html_path
+        self.offset = 0
+        self.started = None
+        self.last_time = None
+        self.finished = False
+        self.single_process = False
+        self.scenarios_total = 0
+        self.sessions = 0
+        self.collected = 0
+        self.counts = {'passed': 0, 'failed': 0, 'skipped': 0}
+        self.scenarios = {}
+        self.running = {}
+        self.slowest = []
+        self.failures = []
+        self.retried = []
+
+    def poll(self):
+        """Read and apply events appended since the last poll; returns how many were applied."""
+        try:
+            with open(self.stream_path, 'rb') as fh:
+                fh.seek(self.offset)
+                chunk = fh.read()
+        except OSError:
+            return 0
+        # Only consume complete lines; a line still being written is picked up next time
+        complete = chunk[:chunk.rfind(b'\n') + 1]
+        self.offset += len(complete)
+        applied = 0
+        for line in complete.decode('utf-8', errors='replace').splitlines():
+            try:
+                self.apply(json.loads(line))
+                applied += 1
+            except (ValueError, KeyError):
+                continue
+        return applied
+
+    def apply(self, event):
+        kind = event['event']
+        now = event['time']
+        if self.started is None:
+            self.started = now
+        self.last_time = now
+        if kind == 'run_start':
+            self.started = now
+            self.scenarios_total = event.get('scenarios', 0)
+            self.single_process = event.get('mode') == 'single-process'
+        elif kind == 'run_end':
+            self.finished = True
+        elif kind == 'scenario_start':
+            self.scenarios[event['index']] = {'name': event['name'], 'status': 'running', 'duration': None}
+        elif kind == 'scenario_end':
+            entry = self.scenarios.setdefault(event['index'], {'name': event['name']})
+            entry.update(status='passed' if event.get('returncode') == 0 else 'failed',
+                         duration=event.get('duration'))
+        elif kind == 'session_start':
+            self.sessions += 1
+            self.collected += event.get('tests', 0)
+        elif kind == 'test_start':
+            self.running[(event['pid'], event['nodeid'])] = now
+        elif kind == 'test_end':
+            self.running.pop((event['pid'], event['nodeid']), None)
+            outcome = event.get('outcome', 'failed')
+            self.counts[outcome] = self.counts.get(outcome, 0) + 1
+            label = f"{event['nodeid']}" + (f" [{event['scenario']}]" if event.get('scenario') else "")
+            self.slowest.append((event.get('duration', 0.0), label))
+            self.slowest.sort(reverse=True)
+            del self.slowest[SLOWEST:]
+            if outcome == 'failed':
+                self.failures.append((label, event.get('message') or ''))
+            if event.get('reruns'):
+                self.retried.append((label, event['reruns'], outcome))
+
+    def progress(self):
+        """(done, estimated total, tests per minute, ETA seconds or None)."""
+        done = sum(self.counts.values())
+        total = self.collected
+        if not self.single_process and self.sessions and self.scenarios_total > self.sessions:
+            # Scenarios that have not collected yet are assumed to be as large as the average one
+            total += (self.scenarios_total - self.sessions) * self.collected / self.sessions
+        total = max(total, done)
+        elapsed = (self.last_time or 0) - (self.started or 0)
+        rate = done * 60.0 / elapsed if elapsed > 0 and done else 0.0
+        eta = (total - done) * 60.0 / rate if rate else None
+        return done, int(round(total)), rate, eta
+
+    def render(self):
+        done, total, rate, eta = self.progress()
+        esc = html.escape
+        eta_text = 'done' if self.finished else (f"{eta:.0f}s" if eta is not None else '…')
+        parts = [
+            '<!doctype html><html><head><meta charset="utf-8">',
+            '' if self.finished else '<meta http-equiv="refresh" content="2">',
+            '<title>Live Test Run</title>',
+            '<style>body{font-family:sans-serif;margin:2em}table{border-collapse:collapse}'
+            'td,th{border:1px solid #ccc;padding:4px 8px;text-align:left}'
+            '.failed{color:#b00}.passed{color:#080}</style></head><body>',
+            f"<h1>{'Finished' if self.finished else 'Running'}: {done}/{total} tests</h1>",
+            f"<p>✅ {self.counts['passed']} passed &nbsp; ❌ {self.counts['failed']} failed &nbsp; "
+            f"⏭️ {self.counts['skipped']} skipped &nbsp; 🔁 {len(self.retried)} retried &nbsp; | &nbsp; {rate:.1f} tests/min &nbsp; | &nbsp; ETA {eta_text}</p>",
+        ]
+        if self.scenarios:
+            parts.append('<h2>Scenarios</h2><table><tr><th>#</th><th>Scenario</th><th>Status</th><th>Duration</th></tr>')
+            for index in sorted(self.scenarios):
+                entry = self.scenarios[index]
+                duration = f"{entry['duration']:.1f}s" if entry.get('duration') is not None else ''
+                parts.append(f"<tr><td>{index}</td><td>{esc(str(entry['name']))}</td>"
+                             f"<td class=\"{entry['status']}\">{entry['status']}</td><td>{duration}</td></tr>")
+            parts.append('</table>')
+        if self.running:
+            parts.append('<h2>Running now</h2><ul>')
+            now = self.last_time or time.time()
+            for (_, nodeid), started in sorted(self.running.items(), key=lambda item: item[1]):
+                parts.append(f"<li>{esc(nodeid)} ({now - started:.1f}s)</li>")
+            parts.append('</ul>')
+        if self.slowest:
+            parts.append(f'<h2>Slowest tests</h2><table><tr><th>Seconds</th><th>Test</th></tr>')
+            for seconds, label in self.slowest:
+                parts.append(f"<tr><td>{seconds:.2f}</td><td>{esc(label)}</td></tr>")
+            parts.append('</table>')
+        if self.retried:
+            parts.append(f'<h2>Retried after transient failures ({len(self.retried)})</h2>'
+                         '<table><tr><th>Test</th><th>Retries</th><th>Final outcome</th></tr>')
+            for label, reruns, outcome in self.retried:
+                parts.append(f"<tr><td>{esc(label)}</td><td>{reruns}</td><td class=\"{outcome}\">{outcome}</td></tr>")
+            parts.append('</table>')
+        if self.failures:
+            parts.append(f'<h2>Failures ({len(self.failures)})</h2><table><tr><th>Test</th><th>Message</th></tr>')
+            for label, message in self.failures:
+                parts.append(f"<tr><td class=\"failed\">{esc(label)}</td><td><code>{esc(message)}</code></td></tr>")
+            parts.append('</table>')
+        parts.append('</body></html>')
+        os.makedirs(os.path.dirname(self.html_path) or '.', exist_ok=True)
+        tmp_path = f"{self.html_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as fh:
+            fh.write('\n'.join(parts))
+        os.replace(tmp_path, self.html_path)
+
+
+def follow(stream_path, html_path, interval=2.0, stop=None):
+    """Keep the dashboard up to date until run_end arrives or ``stop`` (an Event) is set."""
+    dashboard = Dashboard(stream_path, html_path)
+    while True:
+        if dashboard.poll() or not os.path.exists(html_path):
+            dashboard.render()
+        if dashboard.finished or (stop is not None and stop.is_set()):
+            break
+        if stop is None:
+            time.sleep(interval)
+        else:
+            stop.wait(interval)
+    dashboard.poll()
+    dashboard.render()
+    return dashboard
+
+
+def follow_in_background(stream_path, html_path, interval=2.0):
+    """Run follow() in a daemon thread; returns a function that stops it after a final render."""
+    stop = threading.Event()
+    thread = threading.Thread(target=follow, args=(stream_path, html_path, interval, stop), daemon=True)
+    thread.start()
+
+    def finish():
+        stop.set()
+        thread.join(timeout=10)
+    return finish
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build a live dashboard from an EVENT_STREAM file")
+    parser.add_argument('stream', help='JSONL event stream written during a run')
+    parser.add_argument('--html', default=os.path.join('reports', 'live.html'), help='Dashboard output path')
+    parser.add_argument('--interval', type=float, default=2.0, help='Seconds between updates')
+    args = parser.parse_args()
+    print(f"📡 Following {args.stream} -> {args.html} (Ctrl+C to stop)")
+    try:
+        dashboard = follow(args.stream, args.html, args.interval)
+    except KeyboardInterrupt:
+        return 0
+    done, total, rate, _ = dashboard.progress()
+    print(f"🏁 {done}/{total} tests, {dashboard.counts['failed']} failed, {rate:.1f} tests/min")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,237 @@
+"""In-session recovery from transient failures, retrying only the failed test.
+
+Loaded from conftest.py as a pytest plugin. When a test's call phase fails, the failure is
+classified from its exception (and the exceptions it was raised from):
+
+    stale element     StaleElementReferenceException
+    slow page         TimeoutException while the browser is on a known-slow page
+    session expired   the app sent the browser back to the login page
+    browser lost      the WebDriver session itself is gone
+
+Anything else is a real failure and is reported as usual. For a transient failure the shared
+browser is brought back to a known state (shared_driver.recover: a new login when the session
+expired, a new browser only when it was lost, then the dashboard) and the test runs again;
+its module and session fixtures stay up. The failed attempt is reported, as soon as it
+fails, with the outcome ``rerun`` (an ``R`` in the terminal, "Reruns" in the HTML report,
+``reruns`` in the run history), so flaky tests stay visible.
+
+RECOVERY_RETRIES (default 1) caps the retries of one test and RECOVERY_BUDGET (default 3)
+the retries of a whole pytest session (of each pytest-xdist worker). Known-slow pages are the
+page objects with ``SLOW = True`` unless RECOVERY_SLOW_PAGES lists paths (comma-separated).
+--no-recovery or RECOVERY=0 turns retries off.
+"""
+import bdb
+import os
+import unittest
+from urllib.parse import urlparse
+
+import pytest
+
+RETRIES = int(os.environ.get('RECOVERY_RETRIES', 1))
+BUDGET = int(os.environ.get('RECOVERY_BUDGET', 3))
+
+_spent = {'retries': 0}
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("recovery")
+    group.addoption("--no-recovery", action="store_true", default=False,
+                    help="Do not retry tests that failed for a transient reason")
+
+
+def enabled(config):
+    if config.getoption("no_recovery", default=False) or RETRIES < 1:
+        return False
+    return os.environ.get('RECOVERY', '1').lower() not in ('0', 'false', 'no')
+
+
+def slow_pages():
+    """URL paths on which a timeout counts as transient."""
+    configured = os.environ.get('RECOVERY_SLOW_PAGES')
+    if configured is not None:
+        return {path.strip().rstrip('/') or '/' for path in configured.split(',') if path.strip()}
+    from tests.pages import Page
+    pending, paths = list(Page.__subclasses__()), set()
+    while pending:
+        page = pending.pop()
+        pending.extend(page.__subclasses__())
+        if page.SLOW and page.PATH:
+            paths.add(page.PATH)
+    return paths
+
+
+def _chain(exc):
+    """``exc`` and the exceptions it was raised from or while handling."""
+    seen = []
+    while exc is not None and exc not in seen:
+        seen.append(exc)
+        exc = exc.__cause__ or exc.__context__
+    return seen
+
+
+def _current_path(driver):
+    return urlparse(driver.current_url).path.rstrip('/') or '/'
+
+
+def classify(excinfo):
+    """Name of the transient failure ``excinfo`` shows, or None for a real failure."""
+    import shared_driver
+    from selenium.common.exceptions import (InvalidSessionIdException, NoSuchWindowException,
+                                            StaleElementReferenceException, TimeoutException,
+                                            WebDriverException)
+    from tests.pages import LoginPage
+    chain = _chain(excinfo.value)
+    if any(isinstance(e, (InvalidSessionIdException, NoSuchWindowException)) for e in chain):
+        return 'browser lost'
+    driver = shared_driver.active_driver()
+    if driver is None:
+        return None
+    try:
+        path = _current_path(driver)
+    except WebDriverException:
+        return 'browser lost'
+    if path == LoginPage.PATH and shared_driver.current_user() is not None:
+        return 'session expired'
+    if any(isinstance(e, StaleElementReferenceException) for e in chain):
+        return 'stale element'
+    if any(isinstance(e, TimeoutException) for e in chain) and path in slow_pages():
+        return 'slow page'
+    return None
+
+
+def _reraise(config):
+    """Exceptions that end the run instead of failing the test (pytest's own choice)."""
+    if config.getoption("usepdb", False):
+        return (pytest.exit.Exception,)
+    return (pytest.exit.Exception, KeyboardInterrupt)
+
+
+def _interactive(call, report):
+    """Whether --pdb and other pytest_exception_interact hooks should see this failure."""
+    if call.excinfo is None or hasattr(report, 'wasxfail'):
+        return False
+    return not isinstance(call.excinfo.value, (pytest.skip.Exception, unittest.SkipTest, bdb.BdbQuit))
+
+
+def _run_phase(item, when, log=True, **kwargs):
+    """Run one phase through the runtest hooks and log its report as soon as it is made."""
+    hook = getattr(item.ihook, f"pytest_runtest_{when}")
+    call = pytest.CallInfo.from_call(lambda: hook(item=item, **kwargs), when=when,
+                                     reraise=_reraise(item.config))
+    report = item.ihook.pytest_runtest_makereport(item=item, call=call)
+    if log:
+        item.ihook.pytest_runtest_logreport(report=report)
+    if _interactive(call, report):
+        item.ihook.pytest_exception_interact(node=item, call=call, report=report)
+    return report
+
+
+def _show_item(item, add_space):
+    """The --setup-show line for the test, as pytest writes it."""
+    tw = item.config.get_terminal_writer()
+    tw.line()
+    tw.write(" " * 8 + item.nodeid)
+    if getattr(item, 'fixturenames', None):
+        tw.write(f" (fixtures used: {', '.join(sorted(item.fixturenames))})")
+    if add_space:
+        tw.write(" ")
+    tw.flush()
+
+
+def _run_once(item, nextitem):
+    """One setup/call/teardown round; returns the transient failure to retry, or None.
+
+    Whether to retry is decided when the call report is made (pytest_runtest_makereport),
+    so a test that will be retried is torn down to its parent only and module and session
+    fixtures (the browser and its login) carry over to the next attempt. That teardown
+    report is not logged: pytest-html and JUnit XML close a test at its first logged
+    teardown, as with pytest-rerunfailures.
+    """
+    if hasattr(item, '_request') and not item._request:
+        item._initrequest()  # a re-run item needs a fresh fixture request, as in runtestprotocol
+    state = item._recovery
+    state['reason'] = None
+    try:
+        if _run_phase(item, 'setup').passed:
+            setup_only = item.config.getoption("setuponly", False)
+            if item.config.getoption("setupshow", False):
+                _show_item(item, add_space=not setup_only)
+            if not setup_only:
+                _run_phase(item, 'call')
+        if item.session.shouldfail or item.session.shouldstop:
+            nextitem = None
+        retry = state['reason']
+        _run_phase(item, 'teardown', log=not retry, nextitem=item.parent if retry else nextitem)
+    finally:
+        if hasattr(item, '_request'):
+            item._request = False
+            item.funcargs = None
+    return retry
+
+
+def _decide(item, state, excinfo):
+    """The transient failure a failed call should be retried for, or None."""
+    if not state['recovered'] or state['attempt'] >= RETRIES or _spent['retries'] >= BUDGET:
+        return None
+    if item.session.shouldfail or item.session.shouldstop:
+        return None
+    try:
+        return classify(excinfo)
+    except Exception:
+        return None
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_protocol(item, nextitem):
+    if not enabled(item.config):
+        return None
+    item.ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+    state = item._recovery = {'attempt': 0, 'recovered': True, 'reason': None, 'note': None}
+    while True:
+        reason = _run_once(item, nextitem)
+        if reason is None:
+            break
+        state['attempt'] += 1
+        _spent['retries'] += 1
+        # Carried by the next attempt's reports, e.g. into JUnit XML properties
+        item.user_properties[:] = [p for p in item.user_properties if p[0] != 'reruns'] + \
+            [('reruns', state['attempt'])]
+        try:
+            import shared_driver
+            action = shared_driver.recover(reason)
+        except Exception as e:
+            # Still run the test once more so it reports the failure the broken state causes
+            state['recovered'] = False
+            action = f"recovery failed ({type(e).__name__}: {e})"
+        state['note'] = f"{reason}: {action}; retry {state['attempt']} of {RETRIES}"
+    item.ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+    return True
+
+
+@pytest.hookimpl(hookwrapper=True, tryfirst=True)
+def pytest_runtest_makereport(item, call):
+    """Mark a call that failed for a transient reason as a ``rerun`` before it is logged.
+
+    Runs outermost, so other makereport wrappers (failure artifacts) still see the failure.
+    """
+    outcome = yield
+    state = getattr(item, '_recovery', None)
+    if state is None:
+        return
+    report = outcome.get_result()
+    report.rerun = state['attempt']
+    if call.when == 'setup' and state['note']:
+        report.sections.append(("recovery", state['note']))
+        state['note'] = None
+    if call.when == 'call' and report.failed:
+        state['reason'] = _decide(item, state, call.excinfo)
+        if state['reason']:
+            report.outcome = 'rerun'
+            report.sections.append(("recovery", f"transient failure ({state['reason']}); "
+                                                f"retrying ({state['attempt'] + 1} of {RETRIES})"))
+
+
+def pytest_report_teststatus(report):
+    if report.outcome == 'rerun':
+        return 'rerun', 'R', ('RERUN', {'yellow': True})
+    return None
@@ -0,0 +1,525 @@
+#!/usr/bin/env python3
+"""
+Run History & Report Store - compact history of test runs and retention for reports/
+
+Every pytest run records one row per test (outcome, duration, scenario) in a SQLite database
+(REPORT_HISTORY_DB, default reports/history.sqlite); conftest.py does this at the end of the
+session. HTML reports written into reports/ are archived as they are produced:
+
+- the large inline CSS/JS that every pytest-html report repeats is moved to
+  reports/assets/<sha256>.css|.js and shared between reports (content-addressed dedup)
+- the newest REPORT_KEEP_PLAIN reports stay plain HTML, older ones are gzipped (.html.gz)
+- reports older than REPORT_MAX_AGE_DAYS days or beyond the newest REPORT_MAX_COUNT are deleted
+- reports/index.html gets one line added or removed per change instead of a directory rescan
+
+The database also serializes concurrent pytest processes (parallel workers) while they update
+the index.
+
+Usage Examples:
+    python report_store.py --import-existing   # adopt reports written before the store existed
+    python report_store.py --prune             # apply the retention policy now
+    python report_store.py --rebuild-index
+    python report_store.py --history 10
+    python report_store.py --compare-profiles  # A/B timings of the fast and faithful browser profiles
+    python report_store.py --flaky             # tests that only passed after a retry
+    python report_store.py --latest-run        # id to pin sharding to (--shard-history-up-to)
+"""
+import argparse
+import gzip
+import hashlib
+import html
+import os
+import re
+import shutil
+import sqlite3
+import statistics
+import sys
+import time
+from datetime import datetime
+
+REPORTS_DIR = os.environ.get('REPORTS_DIR', 'reports')
+DB_PATH = os.environ.get('REPORT_HISTORY_DB', os.path.join(REPORTS_DIR, 'history.sqlite'))
+KEEP_PLAIN = int(os.environ.get('REPORT_KEEP_PLAIN', 20))
+MAX_COUNT = int(os.environ.get('REPORT_MAX_COUNT', 500))        # 0 = no count limit
+MAX_AGE_DAYS = float(os.environ.get('REPORT_MAX_AGE_DAYS', 30))  # 0 = no age limit
+MIN_ASSET_BYTES = 1024  # smaller inline blocks are report-specific and stay inline
+
+INDEX_MARKER = '<!-- reports -->'
+_INLINE_ASSET = re.compile(r'<(style)[^>]*>(.*?)</style>|<(script)>(.*?)</script>', re.S)
+_TIMESTAMP = re.compile(r'(\d{8}_\d{6})')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started REAL, duration REAL, scenario TEXT, report TEXT, exitstatus INTEGER,
+    passed INTEGER, failed INTEGER, skipped INTEGER, profile TEXT);
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER, nodeid TEXT, scenario TEXT, outcome TEXT, duration REAL, reruns INTEGER DEFAULT 0);
+CREATE INDEX IF NOT EXISTS results_nodeid ON results (nodeid, run_id);
+CREATE TABLE IF NOT EXISTS reports (
+    name TEXT PRIMARY KEY, created REAL, compressed INTEGER DEFAULT 0, summary TEXT);
+CREATE TABLE IF NOT EXISTS report_assets (report TEXT, digest TEXT);
+"""
+
+
+def connect(db_path=None):
+    """Open (and create if needed) the history database."""
+    db_path = db_path or DB_PATH
+    os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+    conn = sqlite3.connect(db_path, timeout=30, isolation_level=None)
+    conn.executescript(_SCHEMA)
+    if 'profile' not in {row[1] for row in conn.execute('PRAGMA table_info(runs)')}:
+        conn.execute('ALTER TABLE runs ADD COLUMN profile TEXT')  # databases created before browser profiles
+    if 'reruns' not in {row[1] for row in conn.execute('PRAGMA table_info(results)')}:
+        conn.execute('ALTER TABLE results ADD COLUMN reruns INTEGER DEFAULT 0')  # ... and before recovery.py
+    return conn
+
+
+def record_run(results, started, duration, exitstatus=None, scenario=None, report=None, profile=None,
+               db_path=None):
+    """Store one pytest run; ``results`` is a list of {nodeid, scenario, outcome, duration} dicts.
+
+    A result's optional ``reruns`` counts the failed attempts recovery.py retried before its outcome.
+
+    ``profile`` is the browser profile the run used (browser_profiles.py), for A/B comparisons.
+    """
+    counts = {'passed': 0, 'failed': 0, 'skipped': 0}
+    for result in results:
+        if result['outcome'] in counts:
+            counts[result['outcome']] += 1
+    conn = connect(db_path)
+    try:
+        conn.execute('BEGIN IMMEDIATE')
+        cursor = conn.execute(
+            'INSERT INTO runs (started, duration, scenario, report, exitstatus, passed, failed, skipped, profile) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            (started, duration, scenario, report and os.path.basename(report), exitstatus,
+             counts['passed'], counts['failed'], counts['skipped'], profile))
+        run_id = cursor.lastrowid
+        conn.executemany(
+            'INSERT INTO results (run_id, nodeid, scenario, outcome, duration, reruns) VALUES (?, ?, ?, ?, ?, ?)',
+            [(run_id, r['nodeid'], r.get('scenario'), r['outcome'], r['duration'], r.get('reruns', 0))
+             for r in results])
+        conn.execute('COMMIT')
+        return run_id
+    finally:
+        conn.close()
+
+
+def base_nodeid(nodeid, scenario):
+    """Test id without the scenario parameter single-process runs append (``...[Scenario_1]``)."""
+    suffix = f"[{scenario}]"
+    if scenario and nodeid.endswith(suffix):
+        return nodeid[:-len(suffix)]
+    return nodeid
+
+
+def latest_run_id(db_path=None):
+    """Id of the newest recorded run (0 when there is none)."""
+    db_path = db_path or DB_PATH
+    if not os.path.exists(db_path):
+        return 0
+    conn = connect(db_path)
+    try:
+        return conn.execute('SELECT COALESCE(MAX(id), 0) FROM runs').fetchone()[0]
+    finally:
+        conn.close()
+
+
+def last_outcomes(db_path=None, up_to=None):
+    """{scenario: {test id: outcome}} from the most recent run of every scenario/test pair.
+
+    ``up_to`` ignores runs recorded after that run id, so processes reading at different times agree.
+    """
+    db_path = db_path or DB_PATH
+    if not os.path.exists(db_path):
+        return {}
+    conn = connect(db_path)
+    try:
+        # SQLite returns the outcome of the row holding MAX(run_id) for each group
+        rows = conn.execute('SELECT scenario, nodeid, outcome, MAX(run_id) FROM results WHERE run_id <= ? '
+                            'GROUP BY scenario, nodeid',
+                            (up_to if up_to is not None else sys.maxsize,)).fetchall()
+    finally:
+        conn.close()
+    latest = {}
+    for scenario, nodeid, outcome, run_id in rows:
+        key = (scenario, base_nodeid(nodeid, scenario))
+        if key not in latest or run_id > latest[key][1]:
+            latest[key] = (outcome, run_id)
+    outcomes = {}
+    for (scenario, nodeid), (outcome, _) in latest.items():
+        outcomes.setdefault(scenario, {})[nodeid] = outcome
+    return outcomes
+
+
+def test_stats(last_runs=10, db_path=None, up_to=None):
+    """Per-test history for ordering: {(scenario, test id): (failures, runs, median seconds)}.
+
+    Only each test's last ``last_runs`` passed/failed results count (runs after ``up_to`` are
+    ignored). The same numbers are also returned under (None, test id), aggregated over all
+    scenarios, for scenarios with no history.
+    """
+    db_path = db_path or DB_PATH
+    if not os.path.exists(db_path):
+        return {}
+    conn = connect(db_path)
+    try:
+        rows = conn.execute("SELECT scenario, nodeid, outcome, duration FROM results "
+                            "WHERE outcome IN ('passed', 'failed') AND run_id <= ? ORDER BY run_id DESC",
+                            (up_to if up_to is not None else sys.maxsize,)).fetchall()
+    finally:
+        conn.close()
+    recent = {}
+    for scenario, nodeid, outcome, duration in rows:
+        test_id = base_nodeid(nodeid, scenario)
+        for key in ((scenario, test_id), (None, test_id)):
+            entries = recent.setdefault(key, [])
+            if len(entries) < last_runs:
+                entries.append((outcome == 'failed', duration))
+    return {key: (sum(failed for failed, _ in entries), len(entries), statistics.median(d for _, d in entries))
+            for key, entries in recent.items()}
+
+
+def scenario_durations(last_runs=5, db_path=None, up_to=None):
+    """{scenario: median seconds} over each scenario's last ``last_runs`` recorded runs.
+
+    A run's duration for a scenario is the sum of its test durations, so per-scenario and
+    single-process runs are measured the same way. Runs after ``up_to`` are ignored.
+    """
+    db_path = db_path or DB_PATH
+    if not os.path.exists(db_path):
+        return {}
+    conn = connect(db_path)
+    try:
+        rows = conn.execute('SELECT scenario, run_id, SUM(duration) FROM results WHERE scenario IS NOT NULL '
+                            'AND run_id <= ? GROUP BY scenario, run_id ORDER BY scenario, run_id DESC',
+                            (up_to if up_to is not None else sys.maxsize,)).fetchall()
+    finally:
+        conn.close()
+    recent = {}
+    for scenario, _, seconds in rows:
+        runs = recent.setdefault(scenario, [])
+        if len(runs) < last_runs:
+            runs.append(seconds)
+    return {scenario: statistics.median(runs) for scenario, runs in recent.items()}
+
+
+def flaky_tests(last_runs=20, db_path=None):
+    """Tests that needed a retry in the last ``last_runs`` runs, most retried first.
+
+    Returns [(test id, scenario, retried results, passed after retry, results), ...].
+    """
+    db_path = db_path or DB_PATH
+    if not os.path.exists(db_path):
+        return []
+    conn = connect(db_path)
+    try:
+        rows = conn.execute("SELECT nodeid, scenario, SUM(reruns > 0), SUM(reruns > 0 AND outcome = 'passed'), "
+                            "COUNT(*) FROM results WHERE run_id > (SELECT COALESCE(MAX(id), 0) FROM runs) - ? "
+                            "GROUP BY nodeid, scenario HAVING SUM(reruns) > 0",
+                            (last_runs,)).fetchall()
+    finally:
+        conn.close()
+    return sorted(((base_nodeid(nodeid, scenario), scenario, retried, recovered, total)
+                   for nodeid, scenario, retried, recovered, total in rows),
+                  key=lambda row: (-row[2], row[0]))
+
+
+def compare_profiles(last_runs=20, db_path=None):
+    """Median test durations per browser profile over each profile's last ``last_runs`` runs.
+
+    Returns {profile: {'runs': n, 'tests': {test id: (median seconds, failed, total)}}}.
+    """
+    conn = connect(db_path)
+    try:
+        profiles = [p for (p,) in conn.execute('SELECT DISTINCT profile FROM runs WHERE profile IS NOT NULL')]
+        comparison = {}
+        for profile in profiles:
+            run_ids = [r for (r,) in conn.execute('SELECT id FROM runs WHERE profile = ? ORDER BY id DESC LIMIT ?',
+                                                  (profile, last_runs))]
+            marks = ','.join('?' * len(run_ids))
+            tests = {}
+            for nodeid, scenario, outcome, duration in conn.execute(
+                    f'SELECT nodeid, scenario, outcome, duration FROM results WHERE run_id IN ({marks})', run_ids):
+                tests.setdefault(base_nodeid(nodeid, scenario), []).append((outcome, duration))
+            comparison[profile] = {'runs': len(run_ids), 'tests': {
+                test: (statistics.median(d for _, d in entries),
+                       sum(1 for o, _ in entries if o == 'failed'), len(entries))
+                for test, entries in tests.items()}}
+        return comparison
+    finally:
+        conn.close()
+
+
+# --- report archiving ---
+
+def _dedup_assets(path, reports_dir):
+    """Move large inline <style>/<script> blocks into content-addressed files; returns their digests."""
+    with open(path, 'r', encoding='utf-8') as fh:
+        content = fh.read()
+    assets_dir = os.path.join(reports_dir, 'assets')
+    digests = []
+
+    def replace(match):
+        kind = 'css' if match.group(1) else 'js'
+        body = match.group(2) if match.group(1) else match.group(4)
+        if len(body) < MIN_ASSET_BYTES:
+            return match.group(0)
+        digest = hashlib.sha256(body.encode('utf-8')).hexdigest()
+        name = f"{digest}.{kind}"
+        asset_path = os.path.join(assets_dir, name)
+        if not os.path.exists(asset_path):
+            os.makedirs(assets_dir, exist_ok=True)
+            tmp_path = f"{asset_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as fh:
+                fh.write(body)
+            os.replace(tmp_path, asset_path)
+        digests.append(name)
+        if kind == 'css':
+            return f'<link rel="stylesheet" href="assets/{name}"/>'
+        return f'<script src="assets/{name}"></script>'
+
+    new_content = _INLINE_ASSET.sub(replace, content)
+    if digests:
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as fh:
+            fh.write(new_content)
+        os.replace(tmp_path, path)
+    return digests
+
+
+def _index_line(name, summary):
+    note = f" &mdash; {html.escape(summary)}" if summary else ""
+    return f'<li data-report="{html.escape(name)}"><a href="{html.escape(name)}">{html.escape(name)}</a>{note}</li>'
+
+
+def _write_index(reports_dir, lines):
+    with open(os.path.join(reports_dir, 'index.html'), 'w', encoding='utf-8') as fh:
+        fh.write('\n'.join([
+            '<!doctype html>', '<html>',
+            '<head><meta charset="utf-8"><title>Test Reports</title></head>', '<body>',
+            '<h1>Available Test Reports</h1>',
+            '<p>Older reports are gzipped (.html.gz); open them after <code>gzip -d</code>.</p>',
+            '<ul>', INDEX_MARKER] + lines + ['</ul>', '</body>', '</html>', '']))
+
+
+def rebuild_index(conn, reports_dir=REPORTS_DIR):
+    """Rewrite index.html from the reports table (no directory scan)."""
+    rows = conn.execute('SELECT name, compressed, summary FROM reports ORDER BY created DESC').fetchall()
+    _write_index(reports_dir, [_index_line(name + ('.gz' if compressed else ''), summary)
+                               for name, compressed, summary in rows])
+
+
+def _update_index(conn, reports_dir, added=None, removed=(), compressed=()):
+    """Insert/remove/rename single index lines; falls back to a rebuild if the index is missing or foreign."""
+    index_path = os.path.join(reports_dir, 'index.html')
+    try:
+        with open(index_path, 'r', encoding='utf-8') as fh:
+            content = fh.read()
+    except OSError:
+        content = ''
+    if INDEX_MARKER not in content:
+        rebuild_index(conn, reports_dir)
+        return
+    lines = content.split('\n')
+    drop = {f'data-report="{html.escape(n)}"' for n in removed}
+    drop |= {f'data-report="{html.escape(n + ".gz")}"' for n in removed}
+    if added:
+        drop.add(f'data-report="{html.escape(added[0])}"')  # re-archived report: replace its line
+    renamed = {f'data-report="{html.escape(n)}"': n for n in compressed}
+    out = []
+    for line in lines:
+        key = line[line.find('data-report="'):].split('>', 1)[0] if 'data-report="' in line else None
+        if key in drop:
+            continue
+        if key in renamed:
+            name = renamed[key]
+            line = line.replace(f'"{html.escape(name)}"', f'"{html.escape(name + ".gz")}"')
+            line = line.replace(f'>{html.escape(name)}</a>', f'>{html.escape(name + ".gz")}</a>')
+        out.append(line)
+        if line == INDEX_MARKER and added:
+            out.append(_index_line(*added))
+    tmp_path = f"{index_path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as fh:
+        fh.write('\n'.join(out))
+    os.replace(tmp_path, index_path)
+
+
+def _remove_unused_assets(conn, reports_dir, digests):
+    for digest in digests:
+        (refs,) = conn.execute('SELECT COUNT(*) FROM report_assets WHERE digest = ?', (digest,)).fetchone()
+        if not refs:
+            try:
+                os.remove(os.path.join(reports_dir, 'assets', digest))
+            except OSError:
+                pass
+
+
+def _apply_retention(conn, reports_dir, now=None):
+    """Delete reports over the age/count limits and gzip the ones past the plain-HTML window.
+
+    Returns (removed names, compressed names).
+    """
+    now = now or time.time()
+    rows = conn.execute('SELECT name, created, compressed FROM reports ORDER BY created DESC').fetchall()
+    removed, compressed, orphaned = [], [], set()
+    for position, (name, created, is_compressed) in enumerate(rows):
+        path = os.path.join(reports_dir, name)
+        too_old = MAX_AGE_DAYS and now - created > MAX_AGE_DAYS * 86400
+        too_many = MAX_COUNT and position >= MAX_COUNT
+        if too_old or too_many:
+            for candidate in (path, path + '.gz'):
+                if os.path.exists(candidate):
+                    os.remove(candidate)
+            orphaned.update(d for (d,) in conn.execute('SELECT digest FROM report_assets WHERE report = ?', (name,)))
+            conn.execute('DELETE FROM reports WHERE name = ?', (name,))
+            conn.execute('DELETE FROM report_assets WHERE report = ?', (name,))
+            removed.append(name)
+        elif position >= KEEP_PLAIN and not is_compressed and os.path.exists(path):
+            with open(path, 'rb') as src, gzip.open(path + '.gz', 'wb') as dst:
+                shutil.copyfileobj(src, dst)
+            os.remove(path)
+            conn.execute('UPDATE reports SET compressed = 1 WHERE name = ?', (name,))
+            compressed.append(name)
+    _remove_unused_assets(conn, reports_dir, orphaned)
+    return removed, compressed
+
+
+def _created_time(path):
+    match = _TIMESTAMP.search(os.path.basename(path))
+    if match:
+        try:
+            return datetime.strptime(match.group(1), '%Y%m%d_%H%M%S').timestamp()
+        except ValueError:
+            pass
+    return os.path.getmtime(path)
+
+
+def archive(path, summary=None, reports_dir=REPORTS_DIR, db_path=None):
+    """Adopt an HTML report in ``reports_dir``: dedup its assets, index it and apply retention."""
+    name = os.path.basename(path)
+    digests = _dedup_assets(path, reports_dir)
+    conn = connect(db_path)
+    try:
+        conn.execute('BEGIN IMMEDIATE')  # one process at a time touches index.html
+        conn.execute('INSERT OR REPLACE INTO reports (name, created, compressed, summary) VALUES (?, ?, 0, ?)',
+                     (name, _created_time(path), summary))
+        conn.execute('DELETE FROM report_assets WHERE report = ?', (name,))
+        conn.executemany('INSERT INTO report_assets (report, digest) VALUES (?, ?)',
+                         [(name, d) for d in set(digests)])
+        removed, compressed = _apply_retention(conn, reports_dir)
+        added = None if name in removed else (name + ('.gz' if name in compressed else ''), summary)
+        _update_index(conn, reports_dir, added=added, removed=removed,
+                      compressed=[n for n in compressed if n != name])
+        conn.execute('COMMIT')
+    except Exception:
+        conn.execute('ROLLBACK')
+        raise
+    finally:
+        conn.close()
+
+
+def prune(reports_dir=REPORTS_DIR, db_path=None):
+    conn = connect(db_path)
+    try:
+        conn.execute('BEGIN IMMEDIATE')
+        removed, compressed = _apply_retention(conn, reports_dir)
+        _update_index(conn, reports_dir, removed=removed, compressed=compressed)
+        conn.execute('COMMIT')
+        return removed, compressed
+    except Exception:
+        conn.execute('ROLLBACK')
+        raise
+    finally:
+        conn.close()
+
+
+def import_existing(reports_dir=REPORTS_DIR, db_path=None):
+    """One-time scan adopting plain HTML reports the store does not know yet; returns how many."""
+    conn = connect(db_path)
+    known = {name for (name,) in conn.execute('SELECT name FROM reports')}
+    conn.close()
+    names = sorted(n for n in os.listdir(reports_dir)
+                   if n.lower().endswith('.html') and n not in known and n not in ('index.html', 'report.html'))
+    names.sort(key=lambda n: _created_time(os.path.join(reports_dir, n)))
+    for name in names:
+        archive(os.path.join(reports_dir, name), reports_dir=reports_dir, db_path=db_path)
+    return len(names)
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description="Manage the run history and archived HTML reports")
+    parser.add_argument('--import-existing', action='store_true', help='Adopt reports already in reports/')
+    parser.add_argument('--prune', action='store_true', help='Apply the retention policy now')
+    parser.add_argument('--rebuild-index', action='store_true', help='Rewrite reports/index.html from the store')
+    parser.add_argument('--history', type=int, metavar='N', help='Show the last N runs')
+    parser.add_argument('--latest-run', action='store_true',
+                        help='Print the id of the newest recorded run (for --shard-history-up-to)')
+    parser.add_argument('--flaky', type=int, nargs='?', const=20, metavar='N',
+                        help='List tests retried after transient failures in the last N runs (default: 20)')
+    parser.add_argument('--compare-profiles', type=int, nargs='?', const=20, metavar='N',
+                        help='Compare median test durations between browser profiles over their last N runs (default: 20)')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_arguments()
+    if args.import_existing:
+        print(f"📥 Imported {import_existing()} report(s)")
+    if args.prune:
+        removed, compressed = prune()
+        print(f"🧹 Removed {len(removed)} report(s), compressed {len(compressed)}")
+    if args.rebuild_index:
+        conn = connect()
+        rebuild_index(conn)
+        conn.close()
+        print(f"📄 Rebuilt {os.path.join(REPORTS_DIR, 'index.html')}")
+    if args.latest_run:
+        print(latest_run_id())
+    if args.history:
+        conn = connect()
+        rows = conn.execute('SELECT id, started, duration, scenario, passed, failed, skipped, profile, '
+                            '(SELECT COALESCE(SUM(reruns), 0) FROM results WHERE run_id = runs.id) FROM runs '
+                            'ORDER BY id DESC LIMIT ?', (args.history,)).fetchall()
+        conn.close()
+        for run_id, started, duration, scenario, passed, failed, skipped, profile, reruns in rows:
+            when = datetime.fromtimestamp(started).strftime('%Y-%m-%d %H:%M:%S')
+            status = "✅" if not failed else "❌"
+            print(f"{status} #{run_id} {when} {duration:7.1f}s  {scenario or '-':15} {profile or '-':9} "
+                  f"{passed} passed, {failed} failed, {skipped} skipped" + (f", {reruns} rerun(s)" if reruns else ""))
+    if args.flaky:
+        flaky = flaky_tests(args.flaky)
+        if not flaky:
+            print(f"✅ No retried tests in the last {args.flaky} runs")
+        for test_id, scenario, retried, recovered, total in flaky:
+            print(f"🔁 {test_id} [{scenario or '-'}]: retried in {retried}/{total} runs, passed after retry {recovered}")
+    if args.compare_profiles:
+        comparison = compare_profiles(args.compare_profiles)
+        if len(comparison) < 2:
+            print("ℹ️  Need runs from at least two browser profiles to compare "
+                  "(run_scenarios_selective.py --browser-profile fast|faithful)")
+            return 0
+        profiles = sorted(comparison)
+        print("Median seconds per test (failures/runs)")
+        headers = [f"{p} ({comparison[p]['runs']} runs)" for p in profiles]
+        print(f"{'test':60} " + ' '.join(f"{h:>22}" for h in headers))
+        tests = sorted(set().union(*(comparison[p]['tests'] for p in profiles)))
+        totals = dict.fromkeys(profiles, 0.0)
+        for test in tests:
+            cells = []
+            for p in profiles:
+                entry = comparison[p]['tests'].get(test)
+                if entry is None:
+                    cells.append(f"{'-':>22}")
+                    continue
+                median, failed, total = entry
+                totals[p] += median
+                cells.append(f"{f'{median:.2f}s ({failed}/{total})':>22}")
+            print(f"{test[-60:]:60} " + ' '.join(cells))
+        print(f"{'total of medians':60} " + ' '.join(f"{f'{totals[p]:.1f}s':>22}" for p in profiles))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
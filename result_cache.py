@@ -0,0 +1,87 @@
+"""Input-hash result cache for run_scenarios_selective.py.
+
+A scenario's fingerprint combines its testdata.csv row, the contents of the code a scenario
+can execute (every top-level module, the tests package and pytest.ini) and the
+app build identifier given with --app-build / APP_BUILD. When a scenario passed with the same
+fingerprint less than RESULT_CACHE_TTL seconds ago it is skipped. Any change to its row, the
+test code or the build produces a new fingerprint, so it runs again.
+
+The cache is only consulted when a build identifier is given; --no-cache turns it off.
+"""
+import glob
+import hashlib
+import json
+import os
+import threading
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+RESULT_CACHE_PATH = os.environ.get('RESULT_CACHE_PATH', os.path.join(PROJECT_ROOT, '.result_cache.json'))
+RESULT_CACHE_TTL = int(os.environ.get('RESULT_CACHE_TTL', 24 * 3600))  # seconds
+
+# Besides every *.py at the top level and under tests/ (globbed, so new modules count too)
+CONFIG_FILES = ('pytest.ini',)
+
+_lock = threading.Lock()
+_code_hash = None
+
+
+def code_hash():
+    """Hash of the test code and configuration (computed once per process)."""
+    global _code_hash
+    if _code_hash is None:
+        paths = sorted(glob.glob(os.path.join(PROJECT_ROOT, '*.py')))
+        paths += sorted(glob.glob(os.path.join(PROJECT_ROOT, 'tests', '**', '*.py'), recursive=True))
+        paths += [os.path.join(PROJECT_ROOT, name) for name in CONFIG_FILES]
+        digest = hashlib.sha256()
+        for path in paths:
+            if not os.path.isfile(path):
+                continue
+            digest.update(os.path.relpath(path, PROJECT_ROOT).replace(os.sep, '/').encode('utf-8'))
+            with open(path, 'rb') as fh:
+                digest.update(hashlib.sha256(fh.read()).digest())
+        _code_hash = digest.hexdigest()
+    return _code_hash
+
+
+def fingerprint(scenario_data, app_build):
+    row = json.dumps(scenario_data, sort_keys=True)
+    return hashlib.sha256(f"{row}\0{code_hash()}\0{app_build}".encode('utf-8')).hexdigest()
+
+
+def _load():
+    try:
+        with open(RESULT_CACHE_PATH, 'r', encoding='utf-8') as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save(entries):
+    tmp_path = f"{RESULT_CACHE_PATH}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as fh:
+        json.dump(entries, fh, indent=1)
+    os.replace(tmp_path, RESULT_CACHE_PATH)
+
+
+def lookup(scenario_data, app_build, ttl=None):
+    """Time of a recent pass with the same fingerprint, or None."""
+    ttl = RESULT_CACHE_TTL if ttl is None else ttl
+    entry = _load().get(scenario_data.get('scenario_name', ''))
+    if entry and entry['fingerprint'] == fingerprint(scenario_data, app_build) \
+            and time.time() - entry['passed_at'] <= ttl:
+        return entry['passed_at']
+    return None
+
+
+def record(scenario_data, app_build, passed):
+    """Remember a pass (or forget the scenario after a failure)."""
+    name = scenario_data.get('scenario_name', '')
+    with _lock:
+        entries = _load()
+        if passed:
+            entries[name] = {'fingerprint': fingerprint(scenario_data, app_build),
+                             'passed_at': time.time(), 'app_build': app_build}
+        elif entries.pop(name, None) is None:
+            return
+        _save(entries)
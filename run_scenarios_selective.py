@@ -14,16 +14,32 @@ Usage Examples:
     python run_scenarios_selective.py --last 3
     python run_scenarios_selective.py --range 2-5
     python run_scenarios_selective.py --scenarios 1,3,7,10
+    python run_scenarios_selective.py --workers 4
+    python run_scenarios_selective.py --single-process --first 5
+    python run_scenarios_selective.py --shard 2/4 --headless
+    python run_scenarios_selective.py --merge-shards "reports/shard_*_of_4.json"
+    python run_scenarios_selective.py --profile-startup
     python run_scenarios_selective.py  # Run all
 """
 import os
 import sys
+import json
 import subprocess
 import argparse
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 import shutil
-from tests.helpers import load_test_data
-from tests.helpers import GLOBAL_DELAY  # ✅ loads the global delay patch
+import tempfile
+import live_events
+import report_store
+import result_cache
+import shards
+from browser_profiles import BROWSER_PROFILES
+# Selenium-free imports only: selection, listing and validation never load the browser stack
+from tests.data_store import load_test_data
+from tests.pacing import PACING_MODES
 
 
 def parse_arguments():
@@ -37,6 +53,10 @@ Examples:
   %(prog)s --last 3            # Run last 3 scenarios  
   %(prog)s --range 2-5         # Run scenarios 2 through 5
   %(prog)s --scenarios 1,3,7   # Run specific scenarios 1, 3, and 7
+  %(prog)s --workers 4         # Run 4 scenarios at the same time
+  %(prog)s --single-process    # Run all scenarios in one pytest process
+  %(prog)s --failed-only       # Rerun only what failed last time
+  %(prog)s --app-build 1.4.2   # Skip scenarios that already passed against this build
   %(prog)s                     # Run all scenarios
         """
     )
@@ -51,12 +71,66 @@ Examples:
     group.add_argument('--scenarios', type=str, metavar='LIST',
                       help='Run specific scenarios (e.g., 1,3,7)')
     
+    history = parser.add_mutually_exclusive_group()
+    history.add_argument('--failed-only', action='store_true',
+                        help='Rerun only scenarios that failed last time, skipping their tests that passed')
+    history.add_argument('--failed-first', action='store_true',
+                        help='Run the whole selection, scenarios and tests that failed last time first')
+    
+    parser.add_argument('--app-build', metavar='ID', default=os.environ.get('APP_BUILD'),
+                       help='Build/version of the app under test; enables skipping scenarios that already '
+                            'passed with the same data, test code and build (default: $APP_BUILD)')
+    parser.add_argument('--cache-ttl', type=float, metavar='HOURS',
+                       help='How long a cached pass stays valid (default: RESULT_CACHE_TTL or 24h)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Run every selected scenario even if a cached pass matches')
+    
     parser.add_argument('--headless', action='store_true',
                        help='Run tests in headless mode')
     parser.add_argument('--verbose', '-v', action='store_true',
                        help='Verbose output')
+    parser.add_argument('--pacing', choices=PACING_MODES, default='adaptive',
+                       help='Pause after clicks/typing: adaptive (wait for page to settle), '
+                            'off, or demo (fixed delay for watching a run). Default: adaptive')
+    parser.add_argument('--browser-profile', choices=sorted(BROWSER_PROFILES),
+                       help='Chrome session profile: faithful (real page loads) or fast (eager loads, '
+                            'images/fonts/trackers blocked). Default: BROWSER_PROFILE or faithful')
+    parser.add_argument('--auth-cache', action='store_true',
+                       help='Reuse cached login sessions (cookies/localStorage) instead of the login form')
+    parser.add_argument('--timeline', action='store_true',
+                       help='Record a WebDriver command timeline per scenario (reports/timeline_*.json)')
+    parser.add_argument('--live', action='store_true',
+                       help='Stream per-test events and keep a live dashboard (reports/live_*.html) during the run')
+    parser.add_argument('--junit-dir', metavar='DIR',
+                       help='Also write a JUnit XML result file per scenario into DIR')
+    parser.add_argument('--workers', type=int, default=1, metavar='N',
+                       help='Run up to N scenarios in parallel, one browser per worker (default: 1); '
+                            'with --single-process, N pytest-xdist workers')
+    
+    parser.add_argument('--single-process', action='store_true',
+                       help='Run all selected scenarios in one pytest process (one browser, one report)')
+    parser.add_argument('--shard', metavar='I/N',
+                       help='Run only partition I of N of the selection, balanced by recorded scenario durations')
+    parser.add_argument('--shard-history-up-to', type=int, metavar='RUN_ID',
+                       default=int(os.environ['SHARD_HISTORY_UP_TO']) if os.environ.get('SHARD_HISTORY_UP_TO') else None,
+                       help='Plan shards (and --failed-only/--failed-first) from history runs up to this id only, '
+                            'so every node computes the same split; see report_store.py --latest-run')
+    parser.add_argument('--shard-results', metavar='PATH',
+                       help='Where --shard writes its results (default: reports/shard_I_of_N.json)')
+    parser.add_argument('--merge-shards', nargs='+', metavar='PATH',
+                       help='Combine shard result files (globs allowed) into one summary and exit code, then exit')
+    parser.add_argument('--profile-startup', action='store_true',
+                       help='Report import times of this runner and of one scenario\'s pytest process, then exit')
     
-    return parser.parse_args()
+    args = parser.parse_args()
+    if args.workers < 1:
+        parser.error('--workers must be a positive integer')
+    if args.shard:
+        try:
+            args.shard = shards.parse_spec(args.shard)
+        except ValueError as e:
+            parser.error(str(e))
+    return args
 
 def select_scenarios(scenarios, args):
     """Select scenarios based on command line arguments."""
@@ -117,19 +191,142 @@ def select_scenarios(scenarios, args):
     
     return selected_scenarios
 
-def run_tests_for_scenario(scenario_data, scenario_index, scenario_name, args):
-    """Run the complete test suite for a single scenario."""
+def apply_history(selected_scenarios, args):
+    """Filter (--failed-only) or reorder (--failed-first) the selection using the last recorded outcomes.
+
+    Sets ``args.deselect`` to {scenario index: [test ids]} for tests that passed last time,
+    which --failed-only leaves out of the rerun.
+    """
+    args.deselect = {}
+    if not (args.failed_only or args.failed_first):
+        return selected_scenarios
+    outcomes = report_store.last_outcomes(up_to=args.shard_history_up_to)
+    
+    def failed_tests(scenario_data):
+        tests = outcomes.get(scenario_data.get('scenario_name'), {})
+        return [nodeid for nodeid, outcome in tests.items() if outcome == 'failed']
+    
+    failing = [(index, data) for index, data in selected_scenarios if failed_tests(data)]
+    if args.failed_first:
+        print(f"⏮️  Running {len(failing)} previously failing scenario(s) first")
+        return failing + [item for item in selected_scenarios if item not in failing]
+    
+    for index, data in failing:
+        tests = outcomes.get(data.get('scenario_name'), {})
+        args.deselect[index] = sorted(nodeid for nodeid, outcome in tests.items() if outcome == 'passed')
+        print(f"🔁 Scenario {index}: rerunning {len(failed_tests(data))} failed test(s), "
+              f"skipping {len(args.deselect[index])} that passed")
+    return failing
+
+def skip_cached_passes(selected_scenarios, args):
+    """Drop scenarios whose fingerprint matches a recent pass; returns (to run, skipped)."""
+    if not args.app_build or args.no_cache:
+        return selected_scenarios, []
+    ttl = args.cache_ttl * 3600 if args.cache_ttl is not None else None
+    to_run, skipped = [], []
+    for scenario_index, scenario_data in selected_scenarios:
+        passed_at = result_cache.lookup(scenario_data, args.app_build, ttl)
+        if passed_at is None:
+            to_run.append((scenario_index, scenario_data))
+            continue
+        skipped.append((scenario_index, scenario_data))
+        when = datetime.fromtimestamp(passed_at).strftime('%Y-%m-%d %H:%M')
+        print(f"⏭️  Scenario {scenario_index} ({scenario_data.get('scenario_name', '')}): "
+              f"unchanged since it passed at {when} on build {args.app_build} - skipped")
+    return to_run, skipped
+
+def select_shard(selected_scenarios, args):
+    """Keep this node's partition of the selection (--shard I/N); returns (partition, plan digest)."""
+    shard, count = args.shard
+    partitions, estimates = shards.plan(selected_scenarios, count, up_to=args.shard_history_up_to)
+    plan_digest = shards.digest(partitions)
+    if estimates is None:
+        print(f"🧩 Shard {shard}/{count}: no recorded durations, splitting round-robin (plan {plan_digest})")
+    else:
+        loads = ', '.join(f"{sum(estimates[i] for i, _ in part):.0f}s" for part in partitions)
+        print(f"🧩 Shard {shard}/{count}: balanced by recorded durations, estimated {loads} (plan {plan_digest})")
+    partition = partitions[shard - 1]
+    print(f"🔢 This shard runs scenarios: {[num for num, _ in partition]}")
+    return partition, plan_digest
+
+def write_shard_results(args, plan_digest, outcomes, cached_scenarios, started):
+    """Write this shard's result file for --merge-shards (no-op without --shard)."""
+    if not args.shard:
+        return
+    shard, count = args.shard
+    path = args.shard_results or os.path.join('reports', f'shard_{shard}_of_{count}.json')
+    scenarios = [{'index': index, 'name': data.get('scenario_name', f'Scenario_{index}'),
+                  'returncode': returncode, 'cached': False} for (index, data), returncode in outcomes]
+    scenarios += [{'index': index, 'name': data.get('scenario_name', f'Scenario_{index}'),
+                   'returncode': 0, 'cached': True} for index, data in cached_scenarios]
+    shards.write_result(path, shard, count, plan_digest, scenarios, time.time() - started)
+    print(f"🧩 Shard results: {path}")
+
+def merge_shard_results(patterns):
+    """Print the combined summary of --shard runs; exit code 1 on failures or missing shards."""
+    summary, problems = shards.merge(patterns)
     print(f"\n{'='*60}")
-    print(f"RUNNING SCENARIO {scenario_index}: {scenario_name}")
+    print(f"MERGED SHARD SUMMARY")
     print(f"{'='*60}")
-    
-    # Set environment variables for this scenario
-    os.environ['CURRENT_SCENARIO'] = str(scenario_index)
-    os.environ['TEST_USERNAME'] = scenario_data.get('username', 'alexsingh')
-    os.environ['TEST_PASSWORD'] = scenario_data.get('password', 'demo123')
-    os.environ['GLOBAL_DELAY'] = "1"
+    for result in summary['shards']:
+        failed = sum(1 for s in result['scenarios'] if s['returncode'] != 0)
+        status = "✅" if not failed else "❌"
+        print(f"{status} Shard {result['shard']}/{result['shards']}: {len(result['scenarios'])} scenario(s), "
+              f"{failed} failed, {result['duration']:.1f}s")
+    for scenario in summary['scenarios']:
+        if scenario['returncode'] != 0:
+            print(f"   ❌ Scenario {scenario['index']}: {scenario['name']}")
+    print(f"Selected Scenarios: {len(summary['scenarios'])}")
+    print(f"✅ Passed: {summary['passed']}")
+    print(f"❌ Failed: {summary['failed']}")
+    if summary['cached']:
+        print(f"⏭️  Skipped (cached pass): {summary['cached']}")
+    for problem in problems:
+        print(f"❌ {problem}")
+    if problems or summary['failed']:
+        return 1
+    print(f"\n🎉 ALL SHARDS COMPLETED SUCCESSFULLY!")
+    return 0
+
+def build_scenario_env(scenario_data, scenario_index, args):
+    """Build the environment for one scenario's pytest process.
+
+    Each scenario gets its own copy so parallel workers never share
+    CURRENT_SCENARIO/TEST_USERNAME through os.environ.
+    """
+    env = os.environ.copy()
+    env['CURRENT_SCENARIO'] = str(scenario_index)
+    env['TEST_USERNAME'] = scenario_data.get('username', 'alexsingh')
+    env['TEST_PASSWORD'] = scenario_data.get('password', 'demo123')
+    env['PACING_MODE'] = args.pacing
+    if args.browser_profile:
+        env['BROWSER_PROFILE'] = args.browser_profile
     if args.headless:
-        os.environ['HEADLESS'] = '1'
+        env['HEADLESS'] = '1'
+    if args.auth_cache:
+        env['AUTH_CACHE'] = '1'
+    if args.timeline:
+        env['WEBDRIVER_TIMELINE'] = '1'
+    if args.failed_first:
+        env['FAILED_FIRST'] = '1'
+    return env
+
+_print_lock = threading.Lock()
+
+def run_tests_for_scenario(scenario_data, scenario_index, scenario_name, args):
+    """Run the complete test suite for a single scenario.
+
+    With --workers > 1 the pytest output is captured and printed as one block
+    when the scenario finishes, so parallel scenarios do not interleave.
+    """
+    parallel = args.workers > 1
+    lines = [
+        f"\n{'='*60}",
+        f"RUNNING SCENARIO {scenario_index}: {scenario_name}",
+        f"{'='*60}",
+    ]
+    
+    env = build_scenario_env(scenario_data, scenario_index, args)
     
     # Create scenario-specific report name
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -146,26 +343,209 @@ def run_tests_for_scenario(scenario_data, scenario_index, scenario_name, args):
         cmd.append('-v')
     else:
         cmd.append('-q')
+    if args.junit_dir:
+        cmd.append(f"--junitxml={os.path.join(args.junit_dir, f'scenario_{scenario_index}_{scenario_name}.xml')}")
+    for nodeid in args.deselect.get(scenario_index, []):
+        cmd.append(f"--deselect={nodeid}")
+    
+    lines.append(f"Executing: {' '.join(cmd)}")
+    live_events.emit('scenario_start', index=scenario_index, name=scenario_name)
+    started = time.time()
+    if not parallel:
+        print('\n'.join(lines))
+        lines = []
     
     try:
-        print(f"Executing: {' '.join(cmd)}")
-        result = subprocess.run(cmd, check=False)
+        if parallel:
+            result = subprocess.run(cmd, check=False, env=env, stdout=subprocess.PIPE,
+                                    stderr=subprocess.STDOUT, text=True, errors='replace')
+            lines.append(result.stdout.rstrip())
+        else:
+            result = subprocess.run(cmd, check=False, env=env)
         
         if result.returncode == 0:
-            print(f"✅ Scenario {scenario_index}: ALL TESTS PASSED")
+            lines.append(f"✅ Scenario {scenario_index}: ALL TESTS PASSED")
         else:
-            print(f"❌ Scenario {scenario_index}: SOME TESTS FAILED")
-            
-        return result.returncode
+            lines.append(f"❌ Scenario {scenario_index}: SOME TESTS FAILED")
+        returncode = result.returncode
         
     except Exception as e:
-        print(f"❌ Scenario {scenario_index}: ERROR - {e}")
-        return 1
+        lines.append(f"❌ Scenario {scenario_index}: ERROR - {e}")
+        returncode = 1
+    live_events.emit('scenario_end', index=scenario_index, name=scenario_name,
+                     returncode=returncode, duration=time.time() - started)
+    
+    with _print_lock:
+        print('\n'.join(lines), flush=True)
+    return returncode
+
+def run_selected_scenarios(selected_scenarios, total_available, args):
+    """Run the selected scenarios and return their pytest exit codes in selection order.
+
+    Every scenario is its own pytest process (own Chrome, own environment, own
+    report), so a pool of ``args.workers`` threads is enough to keep that many
+    scenario processes running at once.
+    """
+    def announce(scenario_index, scenario_data, scenario_name):
+        print(f"\n📋 Scenario {scenario_index}/{total_available}: {scenario_name}")
+        if args.verbose:
+            print(f"   Username: {scenario_data.get('username', 'N/A')}")
+            print(f"   Estimate CPT: {scenario_data.get('estimate_cpt', 'N/A')}")
+            print(f"   Claim CPT: {scenario_data.get('claim_cpt', 'N/A')}")
+            print(f"   Provider Specialty: {scenario_data.get('provider_specialty', 'N/A')}")
+
+    jobs = []
+    for scenario_index, scenario_data in selected_scenarios:
+        scenario_name = scenario_data.get('scenario_name', f'Scenario_{scenario_index}')
+        jobs.append((scenario_index, scenario_data, scenario_name))
+
+    if args.workers == 1:
+        results = []
+        for scenario_index, scenario_data, scenario_name in jobs:
+            announce(scenario_index, scenario_data, scenario_name)
+            results.append(run_tests_for_scenario(scenario_data, scenario_index, scenario_name, args))
+        return results
+
+    workers = min(args.workers, len(jobs))
+    print(f"⚡ Running with {workers} parallel workers")
+    results = [1] * len(jobs)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {}
+        for position, (scenario_index, scenario_data, scenario_name) in enumerate(jobs):
+            with _print_lock:
+                announce(scenario_index, scenario_data, scenario_name)
+            future = pool.submit(run_tests_for_scenario, scenario_data, scenario_index, scenario_name, args)
+            futures[future] = position
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    return results
+
+def scenario_select_spec(selected_scenarios):
+    """conftest_parametrized's --scenario-select value for the final selection.
+
+    Always the exact list: history filters, cached passes and shards change the selection
+    after it was parsed from --first/--last/--range, so those cannot be passed through.
+    """
+    return "list:" + ",".join(str(num) for num, _ in selected_scenarios)
+
+def run_scenarios_in_one_process(selected_scenarios, args):
+    """Run every selected scenario as parameters of a single pytest run.
+
+    Startup, collection and report setup are paid once; conftest_parametrized
+    writes per-scenario results, which are mapped back to one exit code per
+    scenario so the summary matches the one-process-per-scenario mode.
+    """
+    spec = scenario_select_spec(selected_scenarios)
+    # Log in as the first scenario's user up front; later scenarios re-login only on a user change
+    first_index, first_data = selected_scenarios[0]
+    env = build_scenario_env(first_data, first_index, args)
+    env.pop('CURRENT_SCENARIO')
+    
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    report_name = f"scenarios_{timestamp}.html"
+    results_path = os.path.join('reports', f".scenario_results_{timestamp}.json")
+    
+    cmd = [
+        sys.executable, '-m', 'pytest',
+        '--scenario-select', spec,
+        f'--scenario-results={results_path}',
+        '--html', f'reports/{report_name}',
+        '--self-contained-html',
+        '-v' if args.verbose else '-q',
+    ]
+    if args.junit_dir:
+        cmd.append(f"--junitxml={os.path.join(args.junit_dir, 'scenarios.xml')}")
+    if args.workers > 1:
+        # pytest-xdist: each worker has its own browser; loadgroup keeps every scenario on one worker
+        cmd += ['-n', str(args.workers), '--dist', 'loadgroup']
+    for scenario_index, scenario_data in selected_scenarios:
+        scenario_id = scenario_data.get('scenario_name') or f'Scenario_{scenario_index}'
+        for nodeid in args.deselect.get(scenario_index, []):
+            cmd.append(f"--deselect={nodeid}[{scenario_id}]")
+    
+    print(f"\n{'='*60}")
+    print(f"RUNNING {len(selected_scenarios)} SCENARIOS IN ONE PROCESS")
+    print(f"{'='*60}")
+    print(f"Executing: {' '.join(cmd)}")
+    try:
+        subprocess.run(cmd, check=False, env=env)
+        with open(results_path, 'r', encoding='utf-8') as fh:
+            results = json.load(fh)
+    except Exception as e:
+        print(f"❌ Single-process run: ERROR - {e}")
+        results = {}
+    finally:
+        if os.path.exists(results_path):
+            os.remove(results_path)
+    
+    returncodes = []
+    for scenario_index, scenario_data in selected_scenarios:
+        counts = results.get(str(scenario_index))
+        retried = f" ({counts['rerun']} retried after transient failures)" if counts and counts.get('rerun') else ""
+        if counts is not None and counts['failed'] == 0 and counts['passed'] > 0:
+            print(f"✅ Scenario {scenario_index}: ALL TESTS PASSED{retried}")
+            returncodes.append(0)
+        else:
+            print(f"❌ Scenario {scenario_index}: SOME TESTS FAILED{retried}")
+            returncodes.append(1)
+        live_events.emit('scenario_end', index=scenario_index,
+                         name=scenario_data.get('scenario_name', f'Scenario_{scenario_index}'),
+                         returncode=returncodes[-1], duration=None)
+    return returncodes
+
+STARTUP_TOP = 12  # imports listed per process by --profile-startup
+
+def _import_times(cmd, env):
+    """Run ``cmd`` under ``-X importtime``; returns (wall seconds, {top-level module: cumulative us}, all modules)."""
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, '-X', 'importtime'] + cmd, env=env, check=False,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    wall = time.perf_counter() - start
+    top_level, modules = {}, set()
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|', 2)
+        if not cumulative.strip().isdigit():
+            continue  # header line
+        module = name.strip()
+        modules.add(module)
+        # -X importtime indents nested imports by two spaces per level
+        if len(name) - len(name.lstrip()) == 1:
+            top_level[module] = top_level.get(module, 0) + int(cumulative)
+    return wall, top_level, modules
+
+def profile_startup(args):
+    """Print where startup time goes for the runner and for one scenario's pytest process."""
+    first = (load_test_data() or [{}])[0]
+    env = build_scenario_env(first, 1, args)
+    with tempfile.TemporaryDirectory() as tmp:
+        runs = [
+            ('runner (selection, listing, validation)', ['-c', 'import run_scenarios_selective']),
+            # -s: test modules are imported under pytest's output capture, which would swallow the timings
+            ('pytest process (startup + collection)',
+             ['-m', 'pytest', '--collect-only', '-q', '-s', '-p', 'no:cacheprovider',
+              f"--html={os.path.join(tmp, 'startup.html')}"]),
+        ]
+        for label, cmd in runs:
+            wall, top_level, modules = _import_times(cmd, env)
+            print(f"\n⏱️  {label}: {wall:.2f}s wall, {sum(top_level.values()) / 1e6:.2f}s in imports, "
+                  f"{len(modules)} modules")
+            selenium = 'selenium' in {m.split('.')[0] for m in modules}
+            print(f"   Selenium imported: {'yes' if selenium else 'no'}")
+            for module, micros in sorted(top_level.items(), key=lambda item: -item[1])[:STARTUP_TOP]:
+                print(f"   {micros / 1000:8.1f} ms  {module}")
+    return 0
 
 def main():
     """Main execution function."""
     args = parse_arguments()
     
+    if args.profile_startup:
+        return profile_startup(args)
+    if args.merge_shards:
+        return merge_shard_results(args.merge_shards)
+    
     print("🔍 Loading test scenarios from testdata.csv...")
     
     # Load all scenarios
@@ -182,6 +562,22 @@ def main():
         print("❌ No scenarios selected")
         return 1
     
+    selected_scenarios = apply_history(selected_scenarios, args)
+    plan_digest = None
+    if args.shard:
+        selected_scenarios, plan_digest = select_shard(selected_scenarios, args)
+    run_started = time.time()
+    if not selected_scenarios:
+        print("🎉 No failures recorded for the selected scenarios; nothing to rerun" if not args.shard
+              else "🎉 Nothing to run in this shard")
+        write_shard_results(args, plan_digest, [], [], run_started)
+        return 0
+    selected_scenarios, cached_scenarios = skip_cached_passes(selected_scenarios, args)
+    if not selected_scenarios:
+        print(f"\n🎉 All {len(cached_scenarios)} selected scenarios passed before with the same inputs (--no-cache to rerun)")
+        write_shard_results(args, plan_digest, [], cached_scenarios, run_started)
+        return 0
+    
     # Create reports directory
     os.makedirs('reports', exist_ok=True)
     
@@ -191,24 +587,40 @@ def main():
     failed_scenarios = 0
     
     print(f"\n🚀 Starting execution of {total_scenarios} scenarios...")
+    if args.browser_profile:
+        print(f"🌐 Browser profile: {args.browser_profile}")
+    
+    stop_dashboard = None
+    if args.live:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        os.environ['EVENT_STREAM'] = os.path.join('reports', f'events_{timestamp}.jsonl')
+        dashboard_path = os.path.join('reports', f'live_{timestamp}.html')
+        live_events.emit('run_start', scenarios=total_scenarios,
+                         mode='single-process' if args.single_process else 'per-scenario')
+        stop_dashboard = live_events.follow_in_background(os.environ['EVENT_STREAM'], dashboard_path)
+        print(f"📡 Live dashboard: {dashboard_path}")
     
     # Run tests for each selected scenario
-    for scenario_index, scenario_data in selected_scenarios:
-        scenario_name = scenario_data.get('scenario_name', f'Scenario_{scenario_index}')
-        
-        print(f"\n📋 Scenario {scenario_index}/{len(scenarios)}: {scenario_name}")
-        if args.verbose:
-            print(f"   Username: {scenario_data.get('username', 'N/A')}")
-            print(f"   Estimate CPT: {scenario_data.get('estimate_cpt', 'N/A')}")
-            print(f"   Claim CPT: {scenario_data.get('claim_cpt', 'N/A')}")
-            print(f"   Provider Specialty: {scenario_data.get('provider_specialty', 'N/A')}")
-        
-        result = run_tests_for_scenario(scenario_data, scenario_index, scenario_name, args)
-        
+    try:
+        if args.single_process:
+            results = run_scenarios_in_one_process(selected_scenarios, args)
+        else:
+            results = run_selected_scenarios(selected_scenarios, len(scenarios), args)
+    finally:
+        if stop_dashboard:
+            live_events.emit('run_end')
+            stop_dashboard()
+    for (scenario_index, scenario_data), result in zip(selected_scenarios, results):
         if result == 0:
             passed_scenarios += 1
         else:
             failed_scenarios += 1
+        # A --failed-only rerun skipped the tests that passed before, so its pass is not a
+        # pass of the whole scenario on this build; its failure still invalidates the cache
+        partial = bool(args.deselect.get(scenario_index))
+        if args.app_build and not (partial and result == 0):
+            result_cache.record(scenario_data, args.app_build, passed=result == 0)
+    write_shard_results(args, plan_digest, list(zip(selected_scenarios, results)), cached_scenarios, run_started)
     
     # Summary
     print(f"\n{'='*60}")
@@ -217,6 +629,8 @@ def main():
     print(f"Selected Scenarios: {total_scenarios}")
     print(f"✅ Passed: {passed_scenarios}")
     print(f"❌ Failed: {failed_scenarios}")
+    if cached_scenarios:
+        print(f"⏭️  Skipped (cached pass): {len(cached_scenarios)}")
     
     if failed_scenarios == 0:
         print(f"\n🎉 ALL SELECTED SCENARIOS COMPLETED SUCCESSFULLY!")
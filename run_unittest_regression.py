@@ -3,10 +3,11 @@ import sys
 import subprocess
 from datetime import datetime
 import shutil
+import report_store
 
 
 def archive_report(src_path: str, reports_dir: str = "reports"):
-    """Move/copy pytest-generated report.html into reports/ with a timestamped filename and update an index."""
+    """Copy pytest-generated report.html into reports/ with a timestamped filename and add it to the report store."""
     if not os.path.exists(src_path):
         print(f"No report found at {src_path}; skipping archive.")
         return
@@ -25,18 +26,11 @@ def archive_report(src_path: str, reports_dir: str = "reports"):
     latest = os.path.join(reports_dir, "report.html")
     shutil.copy2(src_path, latest)
 
-    # regenerate a simple index
+    # index the archived copy (asset dedup, retention, incremental index.html; see report_store.py)
     try:
-        files = [n for n in os.listdir(reports_dir) if n.lower().endswith('.html')]
-        files.sort(reverse=True)
-        lines = ['<!doctype html>', '<html>', '<head><meta charset="utf-8"><title>Test Reports</title></head>', '<body>', '<h1>Available Test Reports</h1>', '<ul>']
-        for fn in files:
-            lines.append(f'<li><a href="{fn}">{fn}</a></li>')
-        lines += ['</ul>', f'<p>Latest: <a href="{os.path.basename(latest)}">{os.path.basename(latest)}</a></p>', '</body>', '</html>']
-        with open(os.path.join(reports_dir, 'index.html'), 'w', encoding='utf-8') as idx:
-            idx.write('\n'.join(lines))
+        report_store.archive(dest_path)
     except Exception as e:
-        print(f"Failed to generate reports index: {e}")
+        print(f"Failed to update reports index: {e}")
 
 
 if __name__ == "__main__":
@@ -45,19 +39,19 @@ if __name__ == "__main__":
     # Use the same Python executable to run pytest
     cmd = [sys.executable, '-m', 'pytest']
 
-    # Allow optional parallelism via environment variable. By default we do NOT enable xdist to
-    # prevent multiple webdriver instances opening when tests share a session-scoped driver.
-    # Set PYTEST_WORKERS to 'auto' or a positive integer to enable -n.
+    # Optional pytest-xdist parallelism: set PYTEST_WORKERS to 'auto' or a positive integer.
+    # Every worker starts its own browser and logs in itself (see conftest.shared_session);
+    # --dist loadgroup keeps tests linked by @pytest.mark.after on the same worker.
     workers = os.environ.get('PYTEST_WORKERS', '').strip()
     if workers:
         # Validate workers value: allow 'auto' or a positive integer
         if workers.lower() == 'auto':
-            cmd += ['-n', 'auto']
+            cmd += ['-n', 'auto', '--dist', 'loadgroup']
         else:
             try:
                 w = int(workers)
                 if w > 0:
-                    cmd += ['-n', str(w)]
+                    cmd += ['-n', str(w), '--dist', 'loadgroup']
             except ValueError:
                 print(f"Ignoring invalid PYTEST_WORKERS value: {workers}")
     try:
@@ -0,0 +1,261 @@
+"""HTTP fast path for test preconditions.
+
+Tests that need existing data (an estimate in the history, a submitted claim) or a logged-in
+session can create it with plain HTTP requests instead of driving the forms in the browser.
+The client reads each form from the app's own page once (action, method, hidden fields, field
+names behind the element IDs the TC files use, select option values) and posts it the way the
+browser would, over one pooled keep-alive requests.Session per process.
+
+Cookies are shared with the browser both ways: for_driver() replaces the HTTP cookies with
+the browser's session (so it never carries over another user's login), and sync_to_driver()
+hands an HTTP login to the browser. for_driver() keeps one client per app, so the forms it
+read stay cached until the browser's cookies change.
+
+    client = setup_client.for_driver(driver)
+    client.create_estimate('99213', 'Clinic', 'In-Network')
+"""
+import threading
+from datetime import datetime
+from html.parser import HTMLParser
+from urllib.parse import urljoin, urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from tests.data_store import DATE_FORMAT
+
+ESTIMATE_PAGE = '/estimate'
+CLAIM_PAGE = '/claims/new'
+TIMEOUT = 15  # seconds per request
+
+# Submit button id that identifies each form, and logical field -> element id (or name)
+ESTIMATE_FORM = {'submit': 'est_submit', 'cpt': 'cpt', 'site': 'est_site',
+                 'network': ('est_inn_true', 'est_inn_false')}
+CLAIM_FORM = {'submit': 'claim_submit', 'cpt': 'claim_cpt', 'site': 'claim_site',
+              'amount': 'claim_billed_amount', 'date': 'claim_service_date',
+              'network': ('claim_network_true', 'claim_network_false')}
+
+_session = None
+_session_lock = threading.Lock()
+_clients = {}  # base URL -> SetupClient
+
+
+class SetupError(Exception):
+    """A precondition could not be created over HTTP."""
+
+
+def session():
+    """The process-wide pooled keep-alive session."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+            _session.mount('http://', adapter)
+            _session.mount('https://', adapter)
+    return _session
+
+
+class _FormParser(HTMLParser):
+    """Collects every form with its fields (inputs, selects with options, textareas, buttons)."""
+
+    def __init__(self):
+        super().__init__()
+        self.forms = []
+        self._form = None
+        self._select = None
+        self._option = None
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == 'form':
+            self._form = {'action': attrs.get('action', ''), 'method': attrs.get('method', 'get').lower(),
+                          'fields': [], 'buttons': []}
+            self.forms.append(self._form)
+        elif self._form is None:
+            return
+        elif tag in ('input', 'textarea'):
+            self._form['fields'].append(dict(attrs, tag=tag))
+        elif tag == 'select':
+            self._select = dict(attrs, tag='select', options=[])
+            self._form['fields'].append(self._select)
+        elif tag == 'option' and self._select is not None:
+            self._option = {'value': attrs.get('value'), 'text': '', 'selected': 'selected' in attrs}
+            self._select['options'].append(self._option)
+        elif tag == 'button':
+            self._form['buttons'].append(attrs)
+
+    def handle_data(self, data):
+        if self._option is not None:
+            self._option['text'] += data
+
+    def handle_endtag(self, tag):
+        if tag == 'form':
+            self._form = None
+        elif tag == 'select':
+            self._select = None
+        elif tag == 'option':
+            self._option = None
+
+
+class Form:
+    """One parsed form: defaults as the browser would submit them, fields addressable by id or name."""
+
+    def __init__(self, spec, page_url):
+        self.url = urljoin(page_url, spec['action'] or page_url)
+        self.method = spec['method']
+        self.fields = spec['fields']
+        self.data = {}
+        for field in self.fields:
+            name = field.get('name')
+            if not name or 'disabled' in field:
+                continue
+            if field['tag'] == 'select':
+                options = field['options']
+                chosen = next((o for o in options if o['selected']), options[0] if options else None)
+                if chosen:
+                    self.data[name] = chosen['value'] if chosen['value'] is not None else chosen['text'].strip()
+            elif field.get('type') in ('radio', 'checkbox'):
+                if 'checked' in field:
+                    self.data[name] = field.get('value', 'on')
+            elif field.get('type') not in ('submit', 'button', 'image', 'reset', 'file'):
+                self.data[name] = field.get('value', '')
+
+    def field(self, key):
+        for field in self.fields:
+            if field.get('id') == key:
+                return field
+        for field in self.fields:
+            if field.get('name') == key:
+                return field
+        raise SetupError(f"Form {self.url} has no field '{key}'")
+
+    def set(self, key, value):
+        """Fill a text field or pick a select option by value, visible text, or text containing it."""
+        field = self.field(key)
+        if field['tag'] == 'select':
+            value = str(value)
+            options = field['options']
+            match = (next((o for o in options if o['value'] == value), None)
+                     or next((o for o in options if o['text'].strip() == value), None)
+                     or next((o for o in options if value in o['text']), None))
+            if match is None:
+                raise SetupError(f"'{value}' is not an option of {key}")
+            value = match['value'] if match['value'] is not None else match['text'].strip()
+        elif field.get('type') == 'date':
+            # The CSV holds DD-MM-YYYY; a date input submits ISO dates
+            value = datetime.strptime(value, DATE_FORMAT).strftime('%Y-%m-%d')
+        self.data[field['name']] = str(value)
+
+    def check(self, key):
+        field = self.field(key)
+        self.data[field['name']] = field.get('value', 'on')
+
+
+class SetupClient:
+    def __init__(self, base_url, http=None):
+        parsed = urlparse(base_url)
+        self.base_url = f"{parsed.scheme}://{parsed.netloc}"
+        self.http = http or session()
+        self._forms = {}
+        self._synced = None
+
+    # --- cookies shared with the browser ---
+
+    def sync_from_driver(self, driver):
+        """Replace the session's cookies with the browser's.
+
+        Cached forms (and the hidden tokens in them) are dropped when the browser's cookies
+        changed since the last sync, e.g. after a logout or a user switch.
+        """
+        cookies = driver.get_cookies()
+        synced = sorted((c['name'], c['value'], c.get('domain', ''), c.get('path', '/')) for c in cookies)
+        if synced != self._synced:
+            self._forms.clear()
+            self._synced = synced
+        self.http.cookies.clear()
+        for cookie in cookies:
+            self.http.cookies.set(cookie['name'], cookie['value'],
+                                  domain=cookie.get('domain', '').lstrip('.') or urlparse(self.base_url).hostname,
+                                  path=cookie.get('path', '/'))
+        return self
+
+    def sync_to_driver(self, driver):
+        """Copy the session's cookies into the browser (which must be on the app's origin)."""
+        for cookie in self.http.cookies:
+            entry = {'name': cookie.name, 'value': cookie.value, 'path': cookie.path or '/'}
+            if cookie.secure:
+                entry['secure'] = True
+            driver.add_cookie(entry)
+
+    # --- requests ---
+
+    def _request(self, method, url, **kwargs):
+        try:
+            response = self.http.request(method, url, timeout=TIMEOUT, **kwargs)
+        except requests.RequestException as e:
+            raise SetupError(f"{method.upper()} {url} failed: {e}")
+        if response.status_code >= 400:
+            raise SetupError(f"{method.upper()} {url} returned HTTP {response.status_code}")
+        return response
+
+    def form(self, page, submit_id):
+        """The form on ``page`` containing the button ``submit_id`` (cached per page)."""
+        key = (page, submit_id)
+        if key not in self._forms:
+            url = urljoin(self.base_url, page)
+            response = self._request('get', url)
+            parser = _FormParser()
+            parser.feed(response.text)
+            spec = next((f for f in parser.forms if any(b.get('id') == submit_id for b in f['buttons'])), None)
+            if spec is None:
+                raise SetupError(f"No form with button '{submit_id}' on {response.url} (not logged in?)")
+            self._forms[key] = spec, response.url
+        spec, url = self._forms[key]
+        return Form(spec, url)
+
+    def submit(self, form):
+        if form.method == 'post':
+            return self._request('post', form.url, data=form.data)
+        return self._request('get', form.url, params=form.data)
+
+    # --- preconditions ---
+
+    def login(self, login_url, username, password):
+        """Log in over HTTP; True when the app accepted the credentials."""
+        response = self._request('get', login_url)
+        parser = _FormParser()
+        parser.feed(response.text)
+        spec = next((f for f in parser.forms
+                     if any(field.get('id') == 'password' for field in f['fields'])), None)
+        if spec is None:
+            raise SetupError(f"No login form on {response.url}")
+        form = Form(spec, response.url)
+        form.set('username', username)
+        form.set('password', password)
+        landed = self.submit(form)
+        return 'id="password"' not in landed.text
+
+    def create_estimate(self, cpt, site, network):
+        form = self.form(ESTIMATE_PAGE, ESTIMATE_FORM['submit'])
+        form.set(ESTIMATE_FORM['cpt'], cpt)
+        form.set(ESTIMATE_FORM['site'], site)
+        form.check(ESTIMATE_FORM['network'][0 if 'In-Network' in network else 1])
+        return self.submit(form)
+
+    def create_claim(self, cpt, site, network, amount, service_date):
+        form = self.form(CLAIM_PAGE, CLAIM_FORM['submit'])
+        form.set(CLAIM_FORM['cpt'], cpt)
+        form.set(CLAIM_FORM['site'], site)
+        form.set(CLAIM_FORM['amount'], amount)
+        form.set(CLAIM_FORM['date'], service_date)
+        form.check(CLAIM_FORM['network'][0 if 'In-Network' in network else 1])
+        return self.submit(form)
+
+
+def for_driver(driver):
+    """The client for the app the browser is on, authenticated with the browser's cookies."""
+    client = SetupClient(driver.current_url)
+    with _session_lock:
+        client = _clients.setdefault(client.base_url, client)
+    return client.sync_from_driver(driver)
@@ -0,0 +1,113 @@
+"""Deterministic sharding of a scenario selection across CI nodes.
+
+run_scenarios_selective.py --shard I/N runs partition I of N. Partitions are balanced by each
+scenario's recorded duration (median of its recent runs in the report_store history) with the
+longest-processing-time-first rule: scenarios are taken longest first and each goes to the
+currently lightest shard. Scenarios without history count as the median known scenario. With
+no history at all the selection is dealt round-robin.
+
+The split depends only on the selection and the durations, so every node computes the same
+plan as long as they read the same history: the same database (REPORT_HISTORY_DB) pinned to
+the same newest run (--shard-history-up-to, e.g. ``report_store.py --latest-run`` taken once
+before the nodes start), so runs another shard records meanwhile do not change it. Each shard writes
+its results with the plan's digest; merge() checks that all shards ran the same plan and that
+none is missing, and combines them into one summary and exit code.
+"""
+import glob
+import hashlib
+import json
+import os
+import statistics
+import time
+
+import report_store
+
+
+def parse_spec(spec):
+    """'2/4' -> (2, 4); raises ValueError unless 1 <= I <= N."""
+    shard, _, count = spec.partition('/')
+    shard, count = int(shard), int(count)
+    if count < 1 or not 1 <= shard <= count:
+        raise ValueError(f"invalid shard {spec}: use I/N with 1 <= I <= N")
+    return shard, count
+
+
+def _name(index, row):
+    return row.get('scenario_name') or f'Scenario_{index}'
+
+
+def plan(selected, count, durations=None, up_to=None):
+    """Split [(index, row), ...] into ``count`` partitions, each kept in selection order.
+
+    Durations come from the history up to run id ``up_to`` unless ``durations`` is given.
+
+    Returns (partitions, estimates); ``estimates`` maps scenario index to the seconds assumed
+    for it, or is None when the round-robin fallback was used.
+    """
+    if durations is None:
+        durations = report_store.scenario_durations(up_to=up_to)
+    known = [durations[_name(i, row)] for i, row in selected if _name(i, row) in durations]
+    if not known:
+        return [selected[shard::count] for shard in range(count)], None
+    default = statistics.median(known)
+    estimates = {i: durations.get(_name(i, row), default) for i, row in selected}
+    partitions = [[] for _ in range(count)]
+    loads = [0.0] * count
+    for item in sorted(selected, key=lambda item: (-estimates[item[0]], item[0])):
+        shard = min(range(count), key=lambda s: (loads[s], s))
+        partitions[shard].append(item)
+        loads[shard] += estimates[item[0]]
+    position = {i: pos for pos, (i, _) in enumerate(selected)}
+    for partition in partitions:
+        partition.sort(key=lambda item: position[item[0]])
+    return partitions, estimates
+
+
+def digest(partitions):
+    """Short fingerprint of a plan; shards of one run must agree on it."""
+    layout = [[i for i, _ in partition] for partition in partitions]
+    return hashlib.sha256(json.dumps(layout).encode('utf-8')).hexdigest()[:12]
+
+
+def write_result(path, shard, count, plan_digest, scenarios, duration):
+    """Store one shard's outcome; ``scenarios`` is a list of {index, name, returncode, cached} dicts."""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as fh:
+        json.dump({'shard': shard, 'shards': count, 'plan': plan_digest, 'finished': time.time(),
+                   'duration': duration, 'scenarios': scenarios}, fh, indent=2)
+
+
+def merge(patterns):
+    """Combine shard result files (paths or glob patterns); returns (summary dict, problems list)."""
+    paths = sorted({p for pattern in patterns for p in (glob.glob(pattern) or [pattern])})
+    shards, problems = {}, []
+    for path in paths:
+        try:
+            with open(path, 'r', encoding='utf-8') as fh:
+                result = json.load(fh)
+        except (OSError, ValueError) as e:
+            problems.append(f"{path}: unreadable ({e})")
+            continue
+        if result['shard'] in shards:
+            problems.append(f"{path}: shard {result['shard']} given twice")
+            continue
+        shards[result['shard']] = result
+    if not shards:
+        problems.append("no shard results found")
+    counts = {r['shards'] for r in shards.values()}
+    plans = {r['plan'] for r in shards.values()}
+    if len(counts) > 1 or len(plans) > 1:
+        problems.append("shard results come from different plans (selection or history differed between nodes)")
+    count = max(counts) if counts else 0
+    missing = [s for s in range(1, count + 1) if s not in shards]
+    if missing:
+        problems.append(f"missing shard(s): {', '.join(map(str, missing))} of {count}")
+    scenarios = sorted((s for r in shards.values() for s in r['scenarios']), key=lambda s: s['index'])
+    summary = {
+        'shards': [shards[s] for s in sorted(shards)],
+        'scenarios': scenarios,
+        'passed': sum(1 for s in scenarios if s['returncode'] == 0 and not s.get('cached')),
+        'failed': sum(1 for s in scenarios if s['returncode'] != 0),
+        'cached': sum(1 for s in scenarios if s.get('cached')),
+    }
+    return summary, problems
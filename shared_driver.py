@@ -1,33 +1,158 @@
 from selenium import webdriver
-from selenium.webdriver.common.by import By
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import os
-import time
+from urllib.parse import urlparse
+import auth_cache
+import browser_profiles
+import webdriver_timeline
+from tests import pacing
+from tests.helpers import install_settle_hooks
+from tests.pages.base import Page
+from tests.pages.dashboard import DashboardPage
+from tests.pages.login import LoginPage
 
 _driver = None
 _wait = None
-_login_url = "http://ec2-13-203-252-128.ap-south-1.compute.amazonaws.com:32794/login"
+_logged_in_as = None
+# TEST_LOGIN_URL points the suite at another deployment, e.g. the local stand-in app in benchmarks/
+_login_url = os.environ.get('TEST_LOGIN_URL',
+                            "http://ec2-13-203-252-128.ap-south-1.compute.amazonaws.com:32794/login")
+# Everything an origin can keep in the browser, for Storage.clearDataForOrigin
+_ORIGIN_STORAGE = 'cookies,local_storage,indexeddb,websql,file_systems,cache_storage,service_workers'
+
+# Clears the current page's Web Storage (sessionStorage is per tab and survives navigation),
+# then reports what the page's origin still holds
+_PAGE_STORAGE_JS = r"""
+var callback = arguments[arguments.length - 1], left = [];
+try { localStorage.clear(); sessionStorage.clear(); } catch (e) {}
+try { if (localStorage.length || sessionStorage.length) left.push('web storage'); } catch (e) {}
+var checks = [];
+if (navigator.serviceWorker) {
+  checks.push(navigator.serviceWorker.getRegistrations().then(function (r) { if (r.length) left.push('service workers'); }));
+}
+if (window.caches) {
+  checks.push(caches.keys().then(function (k) { if (k.length) left.push('cache storage'); }));
+}
+Promise.all(checks).then(function () { callback(left); }, function () { callback(left); });
+"""
+
+
+class BrowserStateError(Exception):
+    """reset_state() found state it could not clear."""
+
+def create_chrome(headless=False, profile=None):
+    """Launch a new local Chrome with the suite's standard options and settle hooks installed.
+
+    ``profile`` names an entry of browser_profiles.BROWSER_PROFILES (default: BROWSER_PROFILE env).
+    """
+    profile = profile or browser_profiles.current_profile_name()
+    settings = browser_profiles.BROWSER_PROFILES[profile]
+    options = webdriver.ChromeOptions()
+    # If headless not explicitly provided, read from env var HEADLESS
+    if headless is False:
+        headless_env = os.environ.get('HEADLESS', 'false').lower()
+        headless = headless_env in ('1', 'true', 'yes')
+    if headless:
+        # Use new headless mode when available; fall back to legacy where needed
+        try:
+            options.add_argument('--headless=new')
+        except Exception:
+            options.add_argument('--headless')
+        options.add_argument('--disable-gpu')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    for argument in settings['arguments']:
+        options.add_argument(argument)
+    if settings['window_size']:
+        options.add_argument('--window-size=%d,%d' % settings['window_size'])
+    options.page_load_strategy = settings['page_load_strategy']
+    # Keep the browser console readable for failure artifacts (artifacts.py)
+    options.set_capability('goog:loggingPrefs', {'browser': 'ALL'})
+    driver = webdriver.Chrome(options=options)
+    if not settings['window_size']:
+        driver.maximize_window()
+    if settings['blocked_urls']:
+        # Blocking lasts for the whole session, across navigations
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': settings['blocked_urls']})
+    install_settle_hooks(driver)
+    return driver
+
+def _headless():
+    return os.environ.get('HEADLESS', 'false').lower() in ('1', 'true', 'yes')
+
+def _cdp(driver, cmd, params=None):
+    if hasattr(driver, 'execute_cdp_cmd'):
+        return driver.execute_cdp_cmd(cmd, params or {})
+    # Pooled sessions are Remote drivers; chromedriver serves CDP to them as a vendor command
+    return driver.execute('executeCdpCommand', {'cmd': cmd, 'params': params or {}})['value']
+
+def _origin(url):
+    """Origin as the browser serializes it (default port left out), or None for about:blank etc."""
+    parts = urlparse(url)
+    if parts.scheme not in ('http', 'https'):
+        return None
+    port = parts.port if parts.port not in (None, {'http': 80, 'https': 443}[parts.scheme]) else None
+    return f"{parts.scheme}://{parts.hostname}" + (f":{port}" if port else "")
+
+def reset_state(driver=None):
+    """Leave the browser as clean as a new one without restarting it (milliseconds instead of seconds).
+
+    Closes every window but the first, clears cookies and the HTTP cache, and clears the app's
+    and the current page's origin storage (local/session storage, IndexedDB, cache storage,
+    service workers) through CDP, then checks that none of it is left and parks the window on
+    about:blank. Raises BrowserStateError when something could not be cleared; the browser
+    should then be replaced. Without ``driver`` it resets the shared driver, which is then
+    logged out.
+    """
+    global _logged_in_as
+    d = driver or get_driver()
+    if driver is None or driver is _driver:
+        _logged_in_as = None
+    try:
+        handles = d.window_handles
+        # The first window keeps the CDP setup (settle hooks, blocked URLs) made when it opened
+        for handle in handles[1:]:
+            d.switch_to.window(handle)
+            d.close()
+        d.switch_to.window(handles[0])
+        current = _origin(d.current_url)
+        _cdp(d, 'Network.clearBrowserCookies')
+        _cdp(d, 'Network.clearBrowserCache')
+        for origin in {_origin(_login_url), current} - {None}:
+            _cdp(d, 'Storage.clearDataForOrigin', {'origin': origin, 'storageTypes': _ORIGIN_STORAGE})
+        left = d.execute_async_script(_PAGE_STORAGE_JS) if current else []
+        d.get('about:blank')
+        if _cdp(d, 'Network.getAllCookies').get('cookies'):
+            left.append('cookies')
+        if len(d.window_handles) != 1:
+            left.append('windows')
+    except WebDriverException as e:
+        raise BrowserStateError(f"browser state reset failed: {e.msg or e}") from e
+    if left:
+        raise BrowserStateError(f"browser state reset left {', '.join(left)} behind")
 
 def start_driver(headless=False):
+    """Start the shared driver.
+
+    When BROWSER_POOL is set (host:port of a running ``browser_pool.py`` daemon) a warm
+    pooled session is leased instead of launching Chrome; ``quit_driver`` hands it back.
+    """
     global _driver, _wait
     if _driver is None:
-        options = webdriver.ChromeOptions()
-        # If headless not explicitly provided, read from env var HEADLESS
-        if headless is False:
-            headless_env = os.environ.get('HEADLESS', 'false').lower()
-            headless = headless_env in ('1', 'true', 'yes')
-        if headless:
-            # Use new headless mode when available; fall back to legacy where needed
-            try:
-                options.add_argument('--headless=new')
-            except Exception:
-                options.add_argument('--headless')
-            options.add_argument('--disable-gpu')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        _driver = webdriver.Chrome(options=options)
-        _driver.maximize_window()
+        pacing.install()
+        pool_address = os.environ.get('BROWSER_POOL', '').strip()
+        if pool_address:
+            import browser_pool
+            # The run is recorded under this process's profile, so the pooled session must match it
+            _driver = browser_pool.attach(browser_pool.lease(pool_address,
+                                                             profile=browser_profiles.current_profile_name()))
+        else:
+            _driver = create_chrome(headless=headless)
+        if webdriver_timeline.enabled():
+            webdriver_timeline.instrument(_driver)
         _driver.implicitly_wait(10)
         _wait = WebDriverWait(_driver, 15)
     return _driver
@@ -37,49 +162,117 @@ def get_driver():
         return start_driver()
     return _driver
 
+def active_driver():
+    """The running shared driver, or None (never starts one)."""
+    return _driver
+
 def get_wait():
     return _wait
 
 def login(username: str = None, password: str = None):
-    """Perform a login using the shared driver. Username/password default to env vars TEST_USERNAME/TEST_PASSWORD."""
+    """Perform a login using the shared driver. Username/password default to env vars TEST_USERNAME/TEST_PASSWORD.
+
+    With AUTH_CACHE enabled a cached session for the user is restored first and the
+    login form is only used when that fails; a successful form login refreshes the cache.
+    """
+    global _logged_in_as
     if username is None:
         username = os.environ.get('TEST_USERNAME', 'alexsingh')
     if password is None:
         password = os.environ.get('TEST_PASSWORD', 'demo123')
     d = get_driver()
     w = get_wait()
-    d.get(_login_url)
-    username_field = w.until(EC.presence_of_element_located((By.ID, "username")))
-    password_field = d.find_element(By.ID, "password")
-    username_field.clear()
-    username_field.send_keys(username)
-    password_field.clear()
-    password_field.send_keys(password)
-    # click sign in (tries several possible buttons)
-    try:
-        d.find_element(By.XPATH, '//button[normalize-space()="Sign In"]').click()
-    except Exception:
+    use_cache = auth_cache.enabled()
+    if use_cache:
         try:
-            d.find_element(By.XPATH, "//button[@type='submit']").click()
-        except Exception:
-            d.find_element(By.XPATH, "//button").click()
-    # small wait for dashboard
-    time.sleep(2)
+            if auth_cache.restore(d, _login_url, username):
+                _logged_in_as = username
+                return True
+        except WebDriverException as e:
+            # A broken entry (cookie rejected, navigation error, probe timeout) must not stop the
+            # form login; forget it and whatever it injected
+            print(f"⚠️  Auth cache restore failed, using the login form: {e.msg or e}")
+            auth_cache.discard(_login_url, username, 'error')
+            try:
+                d.delete_all_cookies()
+            except WebDriverException:
+                pass
+    d.get(_login_url)
+    w.until(EC.presence_of_element_located(LoginPage.USERNAME))
+    LoginPage(d).sign_in(username, password)
+    if use_cache:
+        auth_cache.save(d, _login_url, username)
+    _logged_in_as = username
     return True
 
+def ensure_login(username: str = None, password: str = None):
+    """Log the shared driver in as ``username`` unless it already is; returns True when it logged in.
+
+    Every pytest process (each pytest-xdist worker included) has its own driver and login, so
+    this is what the session fixture and scenario switches call.
+    """
+    if username is None:
+        username = os.environ.get('TEST_USERNAME', 'alexsingh')
+    if _driver is not None and _logged_in_as == username:
+        return False
+    if _logged_in_as is not None:
+        # Another user's session: wipe it rather than logging out through the UI
+        try:
+            reset_state()
+        except BrowserStateError as e:
+            print(f"⚠️  {e}; starting a new browser")
+            quit_driver()
+            start_driver(headless=_headless())
+    return login(username, password)
+
+def recover(reason):
+    """Bring the shared driver back to a known state after a transient failure (see recovery.py).
+
+    A lost browser is replaced and an expired session logged in again; either way the browser
+    ends on the dashboard. Returns what was done, for the test report.
+    """
+    global _logged_in_as
+    steps = []
+    if reason == 'browser lost':
+        quit_driver()
+        start_driver(headless=_headless())
+        steps.append('started a new browser')
+    elif reason == 'session expired':
+        _logged_in_as = None
+    if ensure_login():
+        steps.append('logged in again')
+    DashboardPage(get_driver()).open(reload=not steps)
+    steps.append('back on the dashboard')
+    return ', '.join(steps)
+
+def current_user():
+    """Username of the last successful login on the shared driver, or None."""
+    return _logged_in_as
+
 def logout():
+    global _logged_in_as
+    _logged_in_as = None
     d = get_driver()
     w = get_wait()
+    if auth_cache.enabled():
+        # Keep the server-side session alive for the cache; only drop this browser's copy of it
+        try:
+            d.delete_all_cookies()
+            d.execute_script('try { localStorage.clear(); sessionStorage.clear(); } catch (e) {}')
+        except Exception:
+            pass
+        return
     try:
-        btn = w.until(EC.element_to_be_clickable((By.XPATH, "//a[contains(text(),'Logout') or normalize-space()='Logout']")))
+        btn = w.until(EC.element_to_be_clickable(Page.LOGOUT_LINK))
         btn.click()
-        w.until(EC.presence_of_element_located((By.ID, "username")))
+        w.until(EC.presence_of_element_located(LoginPage.USERNAME))
     except Exception:
         # best-effort logout; ignore failures
         pass
 
 def quit_driver():
-    global _driver, _wait
+    """Quit the shared driver; a pooled driver is reset and returned to the pool instead."""
+    global _driver, _wait, _logged_in_as
     if _driver is not None:
         try:
             _driver.quit()
@@ -87,3 +280,4 @@ def quit_driver():
             pass
     _driver = None
     _wait = None
+    _logged_in_as = None
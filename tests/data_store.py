@@ -0,0 +1,221 @@
+"""Cached, indexed access to testdata/testdata.csv.
+
+The CSV is parsed and validated once per process and kept in memory until the file's
+mtime or size changes, so the per-test get_current_scenario_data() call is a stat and a
+dict lookup instead of a re-parse. Rows are indexed by 1-based position (CURRENT_SCENARIO)
+and by scenario_name. iter_rows() streams rows one at a time for files too large to keep
+in memory.
+
+Validation runs at load time and reports every bad cell at once (TestDataError). Empty
+cells are allowed; the TC files fail with a clear message when they need a missing value.
+Rows are shared between callers: treat them as read-only.
+"""
+import csv
+import os
+import re
+import threading
+from datetime import datetime
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'testdata', 'testdata.csv')
+
+CPT_PATTERN = re.compile(r'^\d{4}[0-9FTU]$')  # 99213, plus Category II/III codes like 0001F, 0042T
+DATE_FORMAT = '%d-%m-%Y'
+NETWORKS = ('In-Network', 'Out-of-Network')
+PROVIDER_NETWORKS = ('In-Network Only', 'Out-of-Network', 'Any')
+YES_NO = ('Yes', 'No', 'Any')
+
+_cache = {}
+_lock = threading.Lock()
+
+
+class TestDataError(ValueError):
+    """testdata.csv is missing required columns or has cells that fail validation."""
+
+    def __init__(self, path, problems):
+        self.path = path
+        self.problems = problems
+        super().__init__(f"{path}: {len(problems)} problem(s)\n  " + "\n  ".join(problems))
+
+
+def _check_cpt(value):
+    return CPT_PATTERN.match(value) is not None
+
+
+def _check_amount(value):
+    try:
+        return float(value) >= 0
+    except ValueError:
+        return False
+
+
+def _check_date(value):
+    try:
+        datetime.strptime(value, DATE_FORMAT)
+        return True
+    except ValueError:
+        return False
+
+
+def _one_of(choices):
+    return lambda value: value in choices
+
+
+# column -> (check, description used in the error message)
+SCHEMA = {
+    'estimate_cpt': (_check_cpt, '5-character CPT code'),
+    'claim_cpt': (_check_cpt, '5-character CPT code'),
+    'claim_amount': (_check_amount, 'non-negative number'),
+    'claim_date': (_check_date, 'date as DD-MM-YYYY'),
+    'estimate_network': (_one_of(NETWORKS), ' / '.join(NETWORKS)),
+    'claim_network': (_one_of(NETWORKS), ' / '.join(NETWORKS)),
+    'provider_network': (_one_of(PROVIDER_NETWORKS), ' / '.join(PROVIDER_NETWORKS)),
+    'provider_accepting': (_one_of(YES_NO), ' / '.join(YES_NO)),
+}
+REQUIRED_COLUMNS = ('scenario_name',)
+
+
+def _validate(row, line):
+    problems = []
+    for column, (check, expected) in SCHEMA.items():
+        value = row.get(column, '')
+        if value and not check(value):
+            problems.append(f"line {line}, {column}={value!r}: expected {expected}")
+    return problems
+
+
+def _parse(path, on_problem):
+    """Yield cleaned rows from ``path``; calls on_problem(message) for each validation failure."""
+    with open(path, 'r', encoding='utf-8', newline='') as file:
+        reader = csv.DictReader(file)
+        missing = [column for column in REQUIRED_COLUMNS if column not in (reader.fieldnames or ())]
+        if missing:
+            on_problem(f"missing column(s): {', '.join(missing)}")
+            return
+        for row in reader:
+            # Skip empty rows
+            if not any(row.values()):
+                continue
+            cleaned = {key: value.strip() if value else '' for key, value in row.items() if key is not None}
+            for problem in _validate(cleaned, reader.line_num):
+                on_problem(problem)
+            yield cleaned
+
+
+def iter_rows(path=DEFAULT_PATH):
+    """Stream validated rows without caching them; raises TestDataError at the first bad cell."""
+    def fail(problem):
+        raise TestDataError(path, [problem])
+    yield from _parse(path, fail)
+
+
+def _load(path):
+    problems = []
+    rows = list(_parse(path, problems.append))
+    by_name = {}
+    for position, row in enumerate(rows, start=1):
+        name = row.get('scenario_name')
+        if not name:
+            problems.append(f"row {position}: empty scenario_name")
+        elif name in by_name:
+            problems.append(f"row {position}: duplicate scenario_name {name!r}")
+        else:
+            by_name[name] = row
+    if problems:
+        raise TestDataError(path, problems)
+    return rows, by_name
+
+
+def _entry(path):
+    stat = os.stat(path)
+    key = (stat.st_mtime_ns, stat.st_size)
+    entry = _cache.get(path)
+    if entry is None or entry[0] != key:
+        with _lock:
+            entry = _cache.get(path)
+            if entry is None or entry[0] != key:
+                entry = (key,) + _load(path)
+                _cache[path] = entry
+    return entry
+
+
+def rows(path=DEFAULT_PATH):
+    """All rows in file order (cached)."""
+    return _entry(path)[1]
+
+
+def get_row(index, path=DEFAULT_PATH):
+    """Row at 1-based position ``index``, or None when out of range."""
+    data = rows(path)
+    if 1 <= index <= len(data):
+        return data[index - 1]
+    return None
+
+
+def get_by_name(scenario_name, path=DEFAULT_PATH):
+    """Row whose scenario_name matches, or None."""
+    return _entry(path)[2].get(scenario_name)
+
+
+def clear_cache():
+    _cache.clear()
+
+
+def load_test_data(scenario_filter=None):
+    """Load test data from testdata.csv file.
+    
+    Rows are parsed and validated once per process and cached until the file changes.
+    
+    Args:
+        scenario_filter: Optional string to filter by scenario_name column
+        
+    Returns:
+        List of dictionaries containing test data rows
+    """
+    try:
+        if scenario_filter:
+            row = get_by_name(scenario_filter)
+            return [row] if row else []
+        return list(rows())
+    except FileNotFoundError:
+        print(f"Warning: testdata.csv not found at {DEFAULT_PATH}")
+        return []
+    except Exception as e:
+        print(f"Error reading testdata.csv: {e}")
+        return []
+
+
+def get_current_scenario_data():
+    """Get the current scenario data. 
+    
+    Returns:
+        Dictionary with test data or empty dict if not found
+    """
+    # Check if we're running a specific scenario via environment variable
+    scenario_index = os.environ.get('CURRENT_SCENARIO')
+    if scenario_index:
+        try:
+            index = int(scenario_index)
+        except ValueError:
+            index = None
+        if index is not None:
+            try:
+                row = get_row(index)
+                if row:
+                    return row
+            except (OSError, TestDataError) as e:
+                print(f"Error reading testdata.csv: {e}")
+                return {}
+    
+    # Try to get from parametrized conftest first
+    try:
+        from conftest_parametrized import get_current_scenario_data as get_param_data
+        result = get_param_data()
+        # If parametrized conftest returns empty, use fallback
+        if result:
+            return result
+    except ImportError:
+        pass
+    
+    # Fallback to first scenario for non-parametrized runs
+    data = load_test_data()
+    return data[0] if data else {}
@@ -2,11 +2,17 @@
 
 Keep helpers small and UI-agnostic; prefer to add selectors in page-specific modules if needed.
 """
-import csv
 import os
+import time
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import (JavascriptException, StaleElementReferenceException,
+                                        TimeoutException)
+import webdriver_timeline
+# Selenium-free, so the runner and conftest.py can use them without importing this module
+from tests.data_store import load_test_data, get_current_scenario_data  # noqa: F401
+from tests.pacing import PACING_MODES, configure_pacing, get_pacing_report  # noqa: F401
 
 
 def wait_for_element(driver, locator, timeout=15):
@@ -23,85 +29,298 @@ def click_when_clickable(driver, locator, timeout=15):
 
 
 def get_text_safe(element):
+    """Text of one element (up to two round trips); use extract_table/extract_repeated for many."""
     if element is None:
         return ""
     return (element.text or element.get_attribute('innerText') or "").strip()
 
 
-def load_test_data(scenario_filter=None):
-    """Load test data from testdata.csv file.
-    
-    Args:
-        scenario_filter: Optional string to filter by scenario_name column
-        
-    Returns:
-        List of dictionaries containing test data rows
-    """
-    # Get the project root directory (parent of tests directory)
-    current_dir = os.path.dirname(__file__)  # tests directory
-    project_root = os.path.dirname(current_dir)  # project root
-    csv_path = os.path.join(project_root, 'testdata', 'testdata.csv')
-    test_data = []
-    
-    try:
-        with open(csv_path, 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                # Skip empty rows
-                if not any(row.values()):
-                    continue
-                    
-                # Filter by scenario if specified
-                if scenario_filter and row.get('scenario_name', '').strip() != scenario_filter:
-                    continue
-                    
-                # Clean up empty string values
-                cleaned_row = {}
-                for key, value in row.items():
-                    cleaned_row[key] = value.strip() if value else ''
-                    
-                test_data.append(cleaned_row)
-                
-    except FileNotFoundError:
-        print(f"Warning: testdata.csv not found at {csv_path}")
-        return []
-    except Exception as e:
-        print(f"Error reading testdata.csv: {e}")
-        return []
-        
-    return test_data
+# --- Page-settled wait engine ---
+# Instead of fixed sleeps or 500 ms WebDriverWait polling, a small script is injected into every
+# page that counts in-flight fetch/XHR requests and timestamps the last DOM mutation. A single
+# execute_async_script call then polls those counters in the browser and returns as soon as the
+# page is quiet, so each wait costs one round trip and only as long as the page actually needs.
 
+SETTLE_QUIET_MS = int(os.environ.get("SETTLE_QUIET_MS", 250))
+SETTLE_SCRIPT_TIMEOUT = 60  # seconds; upper bound for any single settle wait
+# How drivers report that the document went away under a running script
+_NAVIGATION_ERRORS = ('unloaded', 'navigat', 'execution context was destroyed', 'detached')
 
-def get_current_scenario_data():
-    """Get the current scenario data. 
-    
-    Returns:
-        Dictionary with test data or empty dict if not found
+_SETTLE_HOOKS_JS = r"""
+(function () {
+  if (window.__settle) { return; }
+  var s = window.__settle = {pending: 0, lastMutation: Date.now()};
+  var done = function () { s.pending = Math.max(0, s.pending - 1); };
+  if (window.fetch) {
+    var origFetch = window.fetch;
+    window.fetch = function () {
+      s.pending++;
+      try {
+        return origFetch.apply(this, arguments).then(
+          function (r) { done(); return r; },
+          function (e) { done(); throw e; });
+      } catch (e) { done(); throw e; }
+    };
+  }
+  var origSend = XMLHttpRequest.prototype.send;
+  XMLHttpRequest.prototype.send = function () {
+    s.pending++;
+    this.addEventListener('loadend', done);
+    try { return origSend.apply(this, arguments); } catch (e) { done(); throw e; }
+  };
+  new MutationObserver(function () { s.lastMutation = Date.now(); })
+    .observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+})();
+"""
+
+_SETTLE_WAIT_JS = _SETTLE_HOOKS_JS + r"""
+var target = arguments[0], quietMs = arguments[1], timeoutMs = arguments[2];
+var callback = arguments[arguments.length - 1];
+var s = window.__settle, start = Date.now(), lastRect = null;
+function find() {
+  if (!target) { return null; }
+  if (target[0] === 'xpath') {
+    return document.evaluate(target[1], document, null,
+      XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+  }
+  return document.querySelector(target[1]);
+}
+function stable(el) {
+  if (!target) { return true; }
+  if (!el) { return false; }
+  var r = el.getBoundingClientRect();
+  var rect = [r.top, r.left, r.width, r.height].join(',');
+  var same = rect === lastRect;
+  lastRect = rect;
+  return same;
+}
+(function poll() {
+  var now = Date.now(), el = find();
+  var settled = document.readyState === 'complete' && s.pending === 0 &&
+    now - s.lastMutation >= quietMs && stable(el);
+  if (settled || now - start >= timeoutMs) {
+    callback({settled: settled, elapsed: now - start, pending: s.pending,
+              path: location.pathname, element: el});
+  } else {
+    setTimeout(poll, 50);
+  }
+})();
+"""
+
+_settle_log = []
+
+
+def _locator_to_js(locator):
+    """Translate a Selenium (By, value) locator into the (kind, selector) pair the settle script understands."""
+    if locator is None:
+        return None
+    by, value = locator
+    if by == By.XPATH:
+        return ['xpath', value]
+    if by == By.ID:
+        return ['css', '[id="%s"]' % value]
+    if by == By.NAME:
+        return ['css', '[name="%s"]' % value]
+    if by == By.CLASS_NAME:
+        return ['css', '.' + value]
+    if by == By.TAG_NAME:
+        return ['css', value]
+    if by == By.CSS_SELECTOR:
+        return ['css', value]
+    raise ValueError(f"Unsupported locator strategy for settle wait: {by}")
+
+
+def install_settle_hooks(driver):
+    """Register the fetch/XHR/MutationObserver hooks on every new document (Chrome only).
+
+    Without this the hooks are installed lazily by the first settle wait on each page,
+    which misses requests started before that point.
     """
-    # Check if we're running a specific scenario via environment variable
-    scenario_index = os.environ.get('CURRENT_SCENARIO')
-    if scenario_index:
-        try:
-            data = load_test_data()
-            index = int(scenario_index) - 1  # Convert to 0-based index
-            if 0 <= index < len(data):
-                return data[index]
-        except (ValueError, IndexError):
-            pass
-    
-    # Try to get from parametrized conftest first
     try:
-        from conftest_parametrized import get_current_scenario_data as get_param_data
-        result = get_param_data()
-        # If parametrized conftest returns empty, use fallback
-        if result:
-            return result
-    except ImportError:
+        driver.set_script_timeout(SETTLE_SCRIPT_TIMEOUT)
+        driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': _SETTLE_HOOKS_JS})
+    except Exception:
+        # Non-Chrome or remote drivers without CDP: fall back to lazy installation
         pass
-    
-    # Fallback to first scenario for non-parametrized runs
-    data = load_test_data()
-    return data[0] if data else {}
+
+
+def _is_navigation_error(error):
+    return any(marker in (error.msg or '').lower() for marker in _NAVIGATION_ERRORS)
+
+
+def _run_settle_script(driver, target, quiet_ms, timeout):
+    """Run the settle script until it reports back; returns (result dict or None, elapsed seconds)."""
+    timeout = min(timeout, SETTLE_SCRIPT_TIMEOUT - 1)
+    start = time.perf_counter()
+    deadline = start + timeout
+    result = None
+    while True:
+        remaining_ms = int((deadline - time.perf_counter()) * 1000)
+        if remaining_ms <= 0:
+            break
+        try:
+            result = driver.execute_async_script(_SETTLE_WAIT_JS, target, quiet_ms, remaining_ms)
+            break
+        except (TimeoutException, StaleElementReferenceException):
+            # Script timeout, or the found element was replaced on the way back; poll again
+            time.sleep(0.05)
+        except JavascriptException as e:
+            if not _is_navigation_error(e):
+                raise
+            # The page navigated away while the script was running; poll again on the new document
+            time.sleep(0.05)
+    return result, time.perf_counter() - start
+
+
+def settle_page(driver, quiet_ms=None, timeout=15):
+    """Wait until the page has settled, without a locator or an entry in the wait report.
+
+    Returns the URL path of the settled page, or None when it did not settle within ``timeout``
+    seconds. For waits that are accounted elsewhere, e.g. action pacing.
+    """
+    if quiet_ms is None:
+        quiet_ms = SETTLE_QUIET_MS
+    result, _ = _run_settle_script(driver, None, quiet_ms, timeout)
+    return result.get('path') if result else None
+
+
+def wait_for_page_settled(driver, locator=None, quiet_ms=None, timeout=15, label=None, replaces=None):
+    """Wait until the page has settled and return the located element (or None).
+
+    Settled means: document loaded, no pending fetch/XHR, no DOM mutation for ``quiet_ms``
+    and, when ``locator`` is given, the target element present with a stable position.
+    Raises TimeoutException only when ``locator`` is given and never appears; otherwise
+    returns after ``timeout`` seconds even if the page is still busy.
+
+    ``label`` and ``replaces`` (the fixed sleep this wait replaced, in seconds) are only used
+    for the wait report, see ``get_settle_report``.
+    """
+    if quiet_ms is None:
+        quiet_ms = SETTLE_QUIET_MS
+    with webdriver_timeline.span('explicit', 'wait_for_page_settled', label):
+        result, elapsed = _run_settle_script(driver, _locator_to_js(locator), quiet_ms, timeout)
+    settled = bool(result and result.get('settled'))
+    element = result.get('element') if result else None
+    _settle_log.append({
+        'label': label or (locator[1] if locator else 'page'),
+        'elapsed': elapsed,
+        'settled': settled,
+        'replaces': replaces,
+        'path': result.get('path') if result else None,
+    })
+    if locator is not None and element is None:
+        raise TimeoutException(f"Element {locator} not present after {timeout}s of settle wait")
+    return element
+
+
+def get_settle_report():
+    """Summarize the settle waits of this process: count, total/max wait time and time saved vs. the sleeps they replaced."""
+    total = sum(rec['elapsed'] for rec in _settle_log)
+    replaced = [rec for rec in _settle_log if rec['replaces']]
+    saved = sum(rec['replaces'] - rec['elapsed'] for rec in replaced)
+    return {
+        'count': len(_settle_log),
+        'unsettled': sum(1 for rec in _settle_log if not rec['settled']),
+        'total': total,
+        'max': max((rec['elapsed'] for rec in _settle_log), default=0.0),
+        'saved': saved,
+        'waits': list(_settle_log),
+    }
+
+
+# --- Bulk DOM extraction ---
+# Reading a table cell by cell costs one WebDriver round trip per .text/get_attribute call.
+# These helpers read a whole table (or any repeated structure) in the browser and return plain
+# dicts from a single execute_async_script call, which also waits for the rows to appear.
+
+_EXTRACT_JS = r"""
+var target = arguments[0], spec = arguments[1], minRows = arguments[2], timeoutMs = arguments[3];
+var callback = arguments[arguments.length - 1], start = Date.now();
+function findAll(t, root) {
+  if (t[0] === 'xpath') {
+    var snap = document.evaluate(t[1], root || document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    var out = [];
+    for (var i = 0; i < snap.snapshotLength; i++) { out.push(snap.snapshotItem(i)); }
+    return out;
+  }
+  return Array.prototype.slice.call((root || document).querySelectorAll(t[1]));
+}
+function text(el) { return el ? (el.innerText || el.textContent || '').trim() : ''; }
+function link(el) { var a = el && (el.tagName === 'A' ? el : el.querySelector('a[href]')); return a ? a.href : null; }
+function table(el) {
+  var headRow = el.querySelector('thead tr') || el.querySelector('tr');
+  var headers = [], seen = {};
+  Array.prototype.forEach.call(headRow ? headRow.children : [], function (cell, i) {
+    var name = text(cell) || ('col_' + (i + 1));
+    if (seen[name]) { name = name + '_' + (i + 1); }
+    seen[name] = true;
+    headers.push(name);
+  });
+  var rows = el.tBodies && el.tBodies.length ? el.querySelectorAll('tbody tr') : el.querySelectorAll('tr');
+  var out = [];
+  Array.prototype.forEach.call(rows, function (tr) {
+    if (tr === headRow) { return; }
+    var row = {};
+    Array.prototype.forEach.call(tr.children, function (cell, i) {
+      var name = headers[i] || ('col_' + (i + 1));
+      row[name] = text(cell);
+      if (spec.links) { var href = link(cell); if (href) { row[name + '.href'] = href; } }
+    });
+    out.push(row);
+  });
+  return out;
+}
+function repeated(items) {
+  return items.map(function (item) {
+    var row = {};
+    for (var name in spec.fields) {
+      var parts = spec.fields[name].split('@'), sel = parts[0], attr = parts[1];
+      var el = sel ? item.querySelector(sel) : item;
+      row[name] = !el ? null : attr ? el.getAttribute(attr) : text(el);
+    }
+    return row;
+  });
+}
+(function poll() {
+  var found = findAll(target), rows = null;
+  if (spec.fields) { rows = repeated(found); } else if (found.length) { rows = table(found[0]); }
+  if ((rows && rows.length >= minRows) || Date.now() - start >= timeoutMs) {
+    callback(rows || []);
+  } else {
+    setTimeout(poll, 50);
+  }
+})();
+"""
+
+
+def _extract(driver, locator, spec, min_rows, timeout):
+    timeout = min(timeout, SETTLE_SCRIPT_TIMEOUT - 1)
+    with webdriver_timeline.span('explicit', 'extract', locator[1]):
+        rows = driver.execute_async_script(_EXTRACT_JS, _locator_to_js(locator), spec, min_rows,
+                                           int(timeout * 1000))
+    if len(rows) < min_rows:
+        raise TimeoutException(f"{locator} had {len(rows)} row(s) after {timeout}s, expected at least {min_rows}")
+    return rows
+
+
+def extract_table(driver, locator, min_rows=1, timeout=10, links=False):
+    """Return the rows of the table at ``locator`` as dicts keyed by header text, in one round trip.
+
+    Waits in the browser until the table has at least ``min_rows`` body rows (TimeoutException
+    otherwise). Columns without header text are keyed ``col_N``; with ``links`` a cell that
+    contains a link also gets a ``"<header>.href"`` entry.
+    """
+    return _extract(driver, locator, {'links': links}, min_rows, timeout)
+
+
+def extract_repeated(driver, item_locator, fields, min_rows=1, timeout=10):
+    """Return one dict per element matching ``item_locator``, in one round trip.
+
+    ``fields`` maps names to a CSS selector relative to each item ("" for the item itself),
+    optionally suffixed with ``@attribute`` to read an attribute instead of the text, e.g.
+    ``{'title': 'h3', 'url': 'a@href'}``. Missing elements give None.
+    """
+    return _extract(driver, item_locator, {'fields': fields}, min_rows, timeout)
 
 
 def get_test_data_for_case(testcase):
@@ -114,30 +333,3 @@ def get_test_data_for_case(testcase):
         Dictionary with test data or empty dict if not found
     """
     return get_current_scenario_data()
-
-# ✅ Global delay for all Selenium actions
-import os
-import time
-from selenium.webdriver.remote.webelement import WebElement
-
-GLOBAL_DELAY = float(os.environ.get("GLOBAL_DELAY", 0))  # Default = 0 seconds
-
-# --- Patch send_keys() ---
-_original_send_keys = WebElement.send_keys
-def delayed_send_keys(self, *args, **kwargs):
-    result = _original_send_keys(self, *args, **kwargs)
-    if GLOBAL_DELAY > 0:
-        time.sleep(GLOBAL_DELAY)
-    return result
-
-WebElement.send_keys = delayed_send_keys
-
-# --- Patch click() ---
-_original_click = WebElement.click
-def delayed_click(self, *args, **kwargs):
-    result = _original_click(self, *args, **kwargs)
-    if GLOBAL_DELAY > 0:
-        time.sleep(GLOBAL_DELAY)
-    return result
-
-WebElement.click = delayed_click
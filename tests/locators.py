@@ -0,0 +1,123 @@
+"""Self-learning locator resolution.
+
+find_first() takes a ranked list of candidate locators for one element and checks all of
+them in the browser with a single injected script that polls until one matches, instead of
+trying them one after another with a WebDriverWait or implicit wait each. The locator that
+matched is remembered per key ("page/element") in LOCATOR_CACHE (default
+.locator_cache.json) and tried first on later runs, so a page whose markup changed pays the
+fallback cost once.
+
+Probing runs entirely in the page, so it never waits in the driver's implicit wait.
+"""
+import json
+import os
+import threading
+import time
+
+from selenium.common.exceptions import (JavascriptException, NoSuchElementException,
+                                        StaleElementReferenceException, TimeoutException)
+
+import webdriver_timeline
+from tests.helpers import SETTLE_SCRIPT_TIMEOUT, _is_navigation_error, _locator_to_js
+
+LOCATOR_CACHE = os.environ.get('LOCATOR_CACHE', '.locator_cache.json')
+
+_winners = None
+_lock = threading.Lock()
+
+_PROBE_JS = r"""
+var targets = arguments[0], withText = arguments[1], timeoutMs = arguments[2];
+var callback = arguments[arguments.length - 1], start = Date.now();
+function find(target) {
+  if (target[0] === 'xpath') {
+    return document.evaluate(target[1], document, null,
+      XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+  }
+  return document.querySelector(target[1]);
+}
+(function poll() {
+  for (var i = 0; i < targets.length; i++) {
+    var el = null;
+    try { el = find(targets[i]); } catch (e) { el = null; }
+    if (el && (!withText || (el.innerText || el.textContent || '').trim())) {
+      callback([el, i]);
+      return;
+    }
+  }
+  if (Date.now() - start >= timeoutMs) { callback(null); } else { setTimeout(poll, 50); }
+})();
+"""
+
+
+def _load():
+    global _winners
+    if _winners is None:
+        try:
+            with open(LOCATOR_CACHE, 'r', encoding='utf-8') as fh:
+                _winners = json.load(fh)
+        except (OSError, ValueError):
+            _winners = {}
+    return _winners
+
+
+def _remember(key, locator):
+    winners = _load()
+    if winners.get(key) == list(locator):
+        return
+    with _lock:
+        winners[key] = list(locator)
+        tmp_path = f"{LOCATOR_CACHE}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as fh:
+                json.dump(winners, fh, indent=1, sort_keys=True)
+            os.replace(tmp_path, LOCATOR_CACHE)
+        except OSError:
+            pass
+
+
+def ranked(key, candidates):
+    """``candidates`` with the locator that last matched for ``key`` moved to the front."""
+    candidates = [tuple(c) for c in candidates]
+    winner = _load().get(key)
+    if winner and tuple(winner) in candidates:
+        candidates.remove(tuple(winner))
+        candidates.insert(0, tuple(winner))
+    return candidates
+
+
+def find_first(driver, key, candidates, timeout=10, with_text=False):
+    """Return (element, locator) for the first candidate present on the page.
+
+    All candidates are probed in one round trip, best-ranked first, and the probe keeps
+    polling in the browser until one matches or ``timeout`` seconds pass (then
+    TimeoutException). With ``with_text`` an element only counts once it has visible text.
+    Only a script timeout, a replaced element or a navigation is probed again; any other
+    WebDriver error (a lost session, a bad selector) is raised as is.
+    """
+    order = ranked(key, candidates)
+    targets = [_locator_to_js(locator) for locator in order]
+    deadline = time.perf_counter() + min(timeout, SETTLE_SCRIPT_TIMEOUT - 1)
+    result = last_error = None
+    with webdriver_timeline.span('explicit', 'find_first', key):
+        while True:
+            remaining_ms = int((deadline - time.perf_counter()) * 1000)
+            if remaining_ms <= 0:
+                break
+            try:
+                result = driver.execute_async_script(_PROBE_JS, targets, with_text, remaining_ms)
+                break
+            except (TimeoutException, NoSuchElementException, StaleElementReferenceException) as e:
+                last_error = e
+                time.sleep(0.05)
+            except JavascriptException as e:
+                if not _is_navigation_error(e):
+                    raise
+                # The page navigated away while probing; probe again on the new document
+                last_error = e
+                time.sleep(0.05)
+    if not result:
+        raise TimeoutException(f"None of {len(order)} locators for '{key}' matched within {timeout}s") \
+            from last_error
+    element, index = result
+    _remember(key, order[index])
+    return element, order[index]
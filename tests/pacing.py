@@ -0,0 +1,148 @@
+"""Adaptive action pacing.
+
+Every WebElement.click/send_keys is followed by a pause chosen per action type and per page.
+PACING_MODE selects the strategy:
+  adaptive (default) - pause only until the page has settled, capped at PACING_CAP seconds
+  off                - no pause at all
+  demo               - fixed PACING_DEMO_DELAY pause after every action (slow, for watching a run)
+The legacy GLOBAL_DELAY variable still selects demo mode with that delay when PACING_MODE is unset.
+
+Adaptive pauses follow PACING_ACTIONS unless PACING_PAGES has a rule for the page, e.g.
+  PACING_PAGES="/estimate:send_keys=settle;/claims/new:click=settle,send_keys=0.2"
+(pages separated by ';', each a URL path prefix and its action=pause rules, where a pause is
+'settle' or seconds).
+
+Importing this module does not import Selenium; install() applies the WebElement wrappers
+when a driver is started.
+"""
+import os
+import time
+from urllib.parse import urlparse
+
+import webdriver_timeline
+
+PACING_MODES = ('adaptive', 'off', 'demo')
+
+_legacy_delay = float(os.environ.get("GLOBAL_DELAY", 0))
+PACING_MODE = os.environ.get("PACING_MODE", "demo" if _legacy_delay > 0 else "adaptive").lower()
+PACING_CAP = float(os.environ.get("PACING_CAP", 2))
+PACING_QUIET_MS = int(os.environ.get("PACING_QUIET_MS", 100))
+PACING_DEMO_DELAY = float(os.environ.get("PACING_DEMO_DELAY", _legacy_delay or 1))
+if PACING_MODE not in PACING_MODES:
+    print(f"Warning: unknown PACING_MODE '{PACING_MODE}', using 'adaptive'")
+    PACING_MODE = 'adaptive'
+
+# Pause per action in adaptive mode: 'settle' waits for the page to settle, a number is a fixed pause
+PACING_ACTIONS = {'click': 'settle', 'send_keys': 0}
+# Per-page overrides keyed by URL path prefix, e.g. {'/estimate': {'send_keys': 'settle'}}
+PACING_PAGES = {}
+
+_pacing_totals = {}
+
+
+def configure_pacing(mode=None, cap=None, actions=None, pages=None):
+    """Adjust pacing at runtime; ``actions``/``pages`` are merged into the current rules."""
+    global PACING_MODE, PACING_CAP
+    if mode is not None:
+        if mode not in PACING_MODES:
+            raise ValueError(f"Unknown pacing mode: {mode} (expected one of {', '.join(PACING_MODES)})")
+        PACING_MODE = mode
+    if cap is not None:
+        PACING_CAP = float(cap)
+    if actions:
+        PACING_ACTIONS.update(actions)
+    if pages:
+        for prefix, rules in pages.items():
+            PACING_PAGES.setdefault(prefix, {}).update(rules)
+
+
+def parse_page_rules(text):
+    """Parse PACING_PAGES syntax into {path prefix: {action: 'settle' or seconds}}; raises ValueError."""
+    pages = {}
+    for entry in filter(None, (part.strip() for part in text.split(';'))):
+        prefix, sep, rules = entry.partition(':')
+        if not sep or not prefix.startswith('/'):
+            raise ValueError(f"expected '/path:action=pause,...', got '{entry}'")
+        for rule in filter(None, (part.strip() for part in rules.split(','))):
+            action, sep, pause = (part.strip() for part in rule.partition('='))
+            if not sep or action not in PACING_ACTIONS:
+                raise ValueError(f"expected one of {', '.join(PACING_ACTIONS)}=pause, got '{rule}'")
+            pages.setdefault(prefix.strip(), {})[action] = pause if pause == 'settle' else float(pause)
+    return pages
+
+
+try:
+    configure_pacing(pages=parse_page_rules(os.environ.get("PACING_PAGES", "")))
+except ValueError as e:
+    print(f"Warning: ignoring PACING_PAGES: {e}")
+
+
+def _pacing_rule(action, path):
+    """Return the pacing rule for ``action`` on page ``path`` (longest matching page prefix wins)."""
+    if path:
+        for prefix in sorted(PACING_PAGES, key=len, reverse=True):
+            if path.startswith(prefix) and action in PACING_PAGES[prefix]:
+                return PACING_PAGES[prefix][action]
+    return PACING_ACTIONS.get(action, 0)
+
+
+def _pace(element, action):
+    if PACING_MODE == 'off':
+        return
+    with webdriver_timeline.span('pacing', action):
+        _pace_action(element, action)
+
+
+def _pace_action(element, action):
+    driver = element.parent
+    start = time.perf_counter()
+    path = None
+    if PACING_MODE == 'demo':
+        time.sleep(PACING_DEMO_DELAY)
+    else:
+        if PACING_PAGES:
+            # Costs one extra round trip, so only done when page-specific rules exist
+            path = urlparse(driver.current_url).path
+        rule = _pacing_rule(action, path)
+        if rule == 'settle':
+            from tests.helpers import settle_page
+            path = path or settle_page(driver, PACING_QUIET_MS, PACING_CAP)
+        elif rule:
+            time.sleep(min(float(rule), PACING_CAP))
+    totals = _pacing_totals.setdefault((action, path or '?'), [0, 0.0])
+    totals[0] += 1
+    totals[1] += time.perf_counter() - start
+
+
+def get_pacing_report():
+    """Summarize the time spent pacing actions in this process, per action and page."""
+    return {
+        'mode': PACING_MODE,
+        'count': sum(count for count, _ in _pacing_totals.values()),
+        'total': sum(seconds for _, seconds in _pacing_totals.values()),
+        'by_action': {f"{action} {path}": {'count': count, 'seconds': seconds}
+                      for (action, path), (count, seconds) in sorted(_pacing_totals.items())},
+    }
+
+
+def install():
+    """Wrap WebElement.click/send_keys with the pacing pause; shared_driver.start_driver calls it (idempotent)."""
+    from selenium.webdriver.remote.webelement import WebElement
+    if getattr(WebElement.click, '_paced', False):
+        return
+    original_send_keys = WebElement.send_keys
+    original_click = WebElement.click
+
+    def paced_send_keys(self, *args, **kwargs):
+        result = original_send_keys(self, *args, **kwargs)
+        _pace(self, 'send_keys')
+        return result
+
+    def paced_click(self, *args, **kwargs):
+        result = original_click(self, *args, **kwargs)
+        _pace(self, 'click')
+        return result
+
+    paced_send_keys._paced = paced_click._paced = True
+    WebElement.send_keys = paced_send_keys
+    WebElement.click = paced_click
@@ -0,0 +1,15 @@
+"""Page objects for the healthcare app.
+
+Tests reach their page with ``XxxPage(driver).open()`` and use the page's class-level
+locators; see tests/pages/base.py for how navigation is chosen.
+"""
+from tests.pages.base import Page, navigation_mode
+from tests.pages.claims import ClaimsPage, SubmitClaimPage
+from tests.pages.dashboard import DashboardPage
+from tests.pages.estimate import EstimatePage
+from tests.pages.estimates import EstimatesPage
+from tests.pages.login import LoginPage
+from tests.pages.providers import ProvidersPage
+
+__all__ = ['Page', 'navigation_mode', 'LoginPage', 'DashboardPage', 'EstimatePage',
+           'SubmitClaimPage', 'ClaimsPage', 'EstimatesPage', 'ProvidersPage']
@@ -0,0 +1,107 @@
+"""Base page object and the navigation between pages.
+
+Each page declares its URL ``PATH``, the sidebar link that leads to it (``NAV_LINK``), the
+element that shows it is ready (``READY``) and its other locators as class-level tuples, so
+they are built once when the class is defined rather than in every test.
+
+``open()`` is the navigation graph's edge into a page. From the login page every page is
+reached through the dashboard; from any page inside the app the sidebar leads to every
+section, and a direct ``driver.get()`` of the page URL gets there in one request. Tests that
+are not about navigation use the direct URL (the default); ``PAGE_NAVIGATION=ui`` or
+``open(via_ui=True)`` clicks the sidebar instead. When the browser is already on the page
+nothing is loaded at all, unless the page still shows the outcome of an earlier submit
+(``USED``), in which case it is reloaded for a clean form.
+"""
+import os
+from urllib.parse import urljoin
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from tests.helpers import _locator_to_js, wait_for_page_settled
+
+NAV_TIMEOUT = 15
+LOGIN_PATH = '/login'
+
+# One round trip: the current path and whether the page shows leftovers of an earlier use
+_STATE_JS = r"""
+var target = arguments[0], used = false;
+if (target) {
+  try {
+    used = !!(target[0] === 'xpath'
+      ? document.evaluate(target[1], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+      : document.querySelector(target[1]));
+  } catch (e) { used = false; }
+}
+return [location.pathname, used];
+"""
+
+
+def navigation_mode():
+    """'url' (default) to open pages by address, 'ui' to click through the sidebar."""
+    mode = os.environ.get('PAGE_NAVIGATION', 'url').lower()
+    return mode if mode in ('url', 'ui') else 'url'
+
+
+def _normalize(path):
+    return path.rstrip('/') or '/'
+
+
+def sidebar_link(path):
+    """Locator of the sidebar entry for ``path``; the dashboard has other links to the same pages."""
+    return (By.XPATH, f"//ul[@class='sidebar-nav']//a[@href='{path}']")
+
+
+class Page:
+    NAME = 'page'
+    PATH = None
+    NAV_LINK = None
+    READY = None
+    USED = None
+    OPEN_REPLACES = None  # fixed sleep the open wait replaced, for the settle report
+    SLOW = False          # server-side work; recovery.py retries timeouts here as transient
+
+    ACTIVE_LINK = (By.XPATH, "//a[@class='active']")
+    LOGOUT_LINK = (By.XPATH, "//a[contains(text(),'Logout') or normalize-space()='Logout']")
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    @classmethod
+    def url(cls):
+        # Relative to the configured login page, so TEST_LOGIN_URL moves every page with it
+        import shared_driver
+        return urljoin(shared_driver._login_url, cls.PATH)
+
+    def _state(self):
+        path, used = self.driver.execute_script(_STATE_JS, _locator_to_js(self.USED))
+        return _normalize(path), used
+
+    def is_current(self):
+        """True when the browser shows this page, ready for a fresh use."""
+        path, used = self._state()
+        return path == _normalize(self.PATH) and not used
+
+    def open(self, via_ui=None, reload=False):
+        """Navigate here unless already here; returns self.
+
+        ``reload`` loads the page even when the browser is on it, for data changed behind the
+        browser's back (e.g. seeded over HTTP).
+        """
+        if via_ui is None:
+            via_ui = navigation_mode() == 'ui'
+        path, used = self._state()
+        if path == _normalize(self.PATH) and not used and not reload:
+            return self
+        if via_ui and self.NAV_LINK is not None:
+            if path == LOGIN_PATH:
+                # Signed out: the sidebar only exists inside the app, behind the login
+                import shared_driver
+                shared_driver.login()
+            WebDriverWait(self.driver, NAV_TIMEOUT).until(EC.element_to_be_clickable(self.NAV_LINK)).click()
+        else:
+            self.driver.get(self.url())
+        wait_for_page_settled(self.driver, self.READY, timeout=NAV_TIMEOUT,
+                              label=f"{self.NAME}: open", replaces=self.OPEN_REPLACES)
+        return self
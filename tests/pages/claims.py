@@ -0,0 +1,34 @@
+"""Claim submission form and the claims list."""
+from selenium.webdriver.common.by import By
+
+from tests.pages.base import Page, sidebar_link
+
+
+class SubmitClaimPage(Page):
+    NAME = 'submit claim'
+    PATH = '/claims/new'
+    NAV_LINK = sidebar_link('/claims/new')
+    READY = (By.ID, "claim_cpt")
+    USED = (By.XPATH, "//div[@class='result-summary'] | //div[contains(@class,'alert')]")
+    SLOW = True
+
+    CPT = (By.ID, "claim_cpt")
+    SITE = (By.ID, "claim_site")
+    BILLED_AMOUNT = (By.ID, "claim_billed_amount")
+    SERVICE_DATE = (By.ID, "claim_service_date")
+    IN_NETWORK = (By.ID, "claim_network_true")
+    OUT_OF_NETWORK = (By.ID, "claim_network_false")
+    SUBMIT = (By.ID, "claim_submit")
+    RESULT = (By.XPATH, "//div[@class='result-summary']")
+
+    @classmethod
+    def network_option(cls, network_status):
+        return cls.IN_NETWORK if 'In-Network' in network_status else cls.OUT_OF_NETWORK
+
+
+class ClaimsPage(Page):
+    NAME = 'claims'
+    PATH = '/claims'
+    NAV_LINK = sidebar_link('/claims')
+    TABLE = (By.XPATH, "//table[.//th[normalize-space()='Claim #']]")
+    READY = TABLE
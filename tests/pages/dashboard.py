@@ -0,0 +1,20 @@
+"""Dashboard, the landing page after login."""
+from selenium.webdriver.common.by import By
+
+from tests.pages.base import Page, sidebar_link
+
+
+class DashboardPage(Page):
+    NAME = 'dashboard'
+    PATH = '/dashboard'
+    NAV_LINK = sidebar_link('/dashboard')
+    READY = Page.ACTIVE_LINK
+
+    # The personalized greeting differs between app builds; probed together with find_first
+    WELCOME = [
+        (By.XPATH, "//h2[contains(translate(., 'WELCOME', 'welcome'), 'welcome') ]"),
+        (By.XPATH, "//h2[contains(., 'Welcome') or contains(., 'welcome') ]"),
+        (By.XPATH, "//div[contains(@class,'user') or contains(@class,'welcome')]"),
+        (By.XPATH, "//span[@id='user-name']"),
+        (By.XPATH, "//header//div[contains(., 'Welcome') or contains(., 'welcome')]"),
+    ]
@@ -0,0 +1,35 @@
+"""Cost estimator form."""
+from selenium.webdriver.common.by import By
+
+from tests.pages.base import Page, sidebar_link
+
+
+class EstimatePage(Page):
+    NAME = 'estimate'
+    PATH = '/estimate'
+    NAV_LINK = sidebar_link('/estimate')
+    READY = (By.NAME, "cpt")
+    USED = (By.XPATH, "//div[@aria-live='polite']//div")
+    OPEN_REPLACES = 2
+    SLOW = True
+
+    CPT = (By.NAME, "cpt")
+    SITE = (By.ID, "est_site")
+    IN_NETWORK = (By.ID, "est_inn_true")
+    OUT_OF_NETWORK = (By.ID, "est_inn_false")
+    SUBMIT = (By.ID, "est_submit")
+    ESTIMATED_COST = (By.XPATH, "//div[@aria-live='polite']//div[1]")
+    PLAN_PAYMENT = (By.XPATH, "//div[@aria-live='polite']//div[2]")
+    ERROR = (By.XPATH, "//div[contains(@class,'alert') and contains(@class,'error')]")
+
+    @staticmethod
+    def site_option(value):
+        return (By.XPATH, f"//option[@value='{value}']")
+
+    @staticmethod
+    def site_option_text(text):
+        return (By.XPATH, f"//option[normalize-space()='{text}']")
+
+    @classmethod
+    def network_option(cls, network_status):
+        return cls.IN_NETWORK if 'In-Network' in network_status else cls.OUT_OF_NETWORK
@@ -0,0 +1,15 @@
+"""Estimate history and the details of one estimate."""
+from selenium.webdriver.common.by import By
+
+from tests.pages.base import Page, sidebar_link
+
+
+class EstimatesPage(Page):
+    NAME = 'estimates'
+    PATH = '/estimates'
+    NAV_LINK = sidebar_link('/estimates')
+    TABLE = (By.XPATH, "//table[.//tbody/tr]")
+    FIRST_DETAILS_LINK = (By.XPATH, "//tbody/tr[1]/td[9]/a[1]")
+    # Details live under /estimates/<id>, so they are reached from the list rather than opened
+    DETAILS_HEADING = (By.XPATH, "//body/div[@class='main-layout']/main[@class='container']"
+                                 "/div[@class='card']/div[@class='card-header']/div[1]")
@@ -0,0 +1,33 @@
+"""Login page."""
+from selenium.webdriver.common.by import By
+
+from tests.helpers import wait_for_page_settled
+from tests.locators import find_first
+from tests.pages.base import LOGIN_PATH, Page
+
+
+class LoginPage(Page):
+    NAME = 'login'
+    PATH = LOGIN_PATH
+    READY = (By.ID, "username")
+
+    USERNAME = (By.ID, "username")
+    PASSWORD = (By.ID, "password")
+    SIGN_IN_BUTTONS = [
+        (By.XPATH, '//button[normalize-space()="Sign In"]'),
+        (By.XPATH, "//button[@type='submit']"),
+        (By.XPATH, "//button"),
+    ]
+
+    def sign_in(self, username, password):
+        """Fill in and submit the form, then wait for the dashboard to finish loading."""
+        username_field = self.driver.find_element(*self.USERNAME)
+        password_field = self.driver.find_element(*self.PASSWORD)
+        username_field.clear()
+        username_field.send_keys(username)
+        password_field.clear()
+        password_field.send_keys(password)
+        # tries several possible buttons in one probe; the last match is tried first next time
+        button, _ = find_first(self.driver, "login/submit", self.SIGN_IN_BUTTONS, timeout=10)
+        button.click()
+        wait_for_page_settled(self.driver, label="login: dashboard", replaces=2)
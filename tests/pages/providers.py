@@ -0,0 +1,21 @@
+"""Provider search."""
+from selenium.webdriver.common.by import By
+
+from tests.pages.base import Page, sidebar_link
+
+
+class ProvidersPage(Page):
+    NAME = 'providers'
+    PATH = '/providers'
+    NAV_LINK = sidebar_link('/providers')
+    READY = (By.NAME, "specialty")
+    USED = (By.CLASS_NAME, "provider-results")
+
+    SPECIALTY = (By.XPATH, "//select[@name='specialty']")
+    NETWORK = (By.XPATH, "//select[@name='network']")
+    ACCEPTING = (By.XPATH, "//select[@name='accepting']")
+    SEARCH = (By.XPATH, "//button[normalize-space()='Search Providers']")
+
+    @staticmethod
+    def option(text):
+        return (By.XPATH, f"//option[normalize-space()='{text}']")
@@ -7,6 +7,7 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 import shared_driver
 from tests.helpers import get_current_scenario_data
+from tests.pages import SubmitClaimPage
 
 
 def test_successful_claim_submission():
@@ -36,11 +37,11 @@ def test_successful_claim_submission():
     driver = shared_driver.get_driver()
     wait = WebDriverWait(driver, 15)
 
-    # Navigate to claim submission
-    wait.until(EC.element_to_be_clickable((By.XPATH, "//body//aside//nav//ul//li[3]/a"))).click()
+    # Open claim submission
+    page = SubmitClaimPage(driver).open()
 
     # Select CPT from CSV data
-    cpt_code_dropdown = wait.until(EC.element_to_be_clickable((By.ID, "claim_cpt")))
+    cpt_code_dropdown = wait.until(EC.element_to_be_clickable(page.CPT))
     cpt_code_dropdown.click()
     select_cpt = Select(cpt_code_dropdown)
     
@@ -60,33 +61,30 @@ def test_successful_claim_submission():
                     break
 
     # Select service location from CSV data
-    location_dropdown = wait.until(EC.element_to_be_clickable((By.ID, "claim_site")))
+    location_dropdown = wait.until(EC.element_to_be_clickable(page.SITE))
     location_dropdown.click()
     select_site = Select(location_dropdown)
     select_site.select_by_visible_text(service_location)
 
     # Enter billed amount from CSV data
-    billed_amount_input = driver.find_element(By.ID, "claim_billed_amount")
+    billed_amount_input = driver.find_element(*page.BILLED_AMOUNT)
     billed_amount_input.clear()
     billed_amount_input.send_keys(str(billed_amount))
 
     # Enter service date from CSV data
-    service_date_input = driver.find_element(By.ID, "claim_service_date")
+    service_date_input = driver.find_element(*page.SERVICE_DATE)
     service_date_input.clear()
     service_date_input.send_keys(service_date)
 
     # Select network status from CSV data
-    if 'In-Network' in network_status:
-        driver.find_element(By.ID, "claim_network_true").click()
-    else:
-        driver.find_element(By.ID, "claim_network_false").click()
+    driver.find_element(*page.network_option(network_status)).click()
 
     # Submit
-    process_claim_button = driver.find_element(By.XPATH, "//button[@id='claim_submit']")
+    process_claim_button = driver.find_element(*page.SUBMIT)
     process_claim_button.click()
 
     try:
-        adjudication_result = wait.until(EC.presence_of_element_located((By.XPATH, "//div[@class='result-summary']")))
+        adjudication_result = wait.until(EC.presence_of_element_located(page.RESULT))
         result_text = adjudication_result.text
         
         # Accept both successful and denied claims as valid system responses
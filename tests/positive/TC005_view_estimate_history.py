@@ -1,28 +1,45 @@
 import pytest
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import shared_driver
-from tests.helpers import get_current_scenario_data
+import setup_client
+from tests.helpers import get_current_scenario_data, extract_table
+from tests.pages import EstimatesPage
 
 
+# Without the HTTP seed below the history only has the estimate TC002 calculates
+@pytest.mark.after("test_estimate_cost_for_cpt_99213_in_network_clinic")
 def test_verify_estimate_details():
     """Positive: verify estimate details using data from testdata.csv scenario."""
-    # Get current scenario data from CSV (for consistency, though this test doesn't need specific data)
+    # Get current scenario data from CSV (used to seed the estimate this test opens)
     test_data = get_current_scenario_data()
     
     driver = shared_driver.get_driver()
     wait = WebDriverWait(driver, 10)
 
-    # Navigate to Estimates page
-    estimates_link = wait.until(EC.element_to_be_clickable((By.XPATH, "//ul[@class='sidebar-nav']//li//a[@href='/estimates']")))
-    estimates_link.click()
+    # Seed an estimate over HTTP so the history has a row to open regardless of earlier UI flows
+    seed = [test_data.get(key) for key in ('estimate_cpt', 'estimate_location', 'estimate_network')]
+    seeded = False
+    if all(seed):
+        try:
+            setup_client.for_driver(driver).create_estimate(*seed)
+            seeded = True
+        except setup_client.SetupError as e:
+            print(f"⚠️  Could not seed an estimate over HTTP, relying on existing history: {e}")
+
+    # Open the Estimates page (after seeding, so the history includes the new row)
+    page = EstimatesPage(driver).open(reload=seeded)
+
+    # Read the estimate history in one round trip; the first row must link to its details page
+    estimates = extract_table(driver, page.TABLE, links=True)
+    assert estimates, "Estimate history is empty"
+    assert any(key.endswith('.href') for key in estimates[0]), f"First estimate has no details link: {estimates[0]}"
 
     # Click on an estimate
-    estimate = wait.until(EC.element_to_be_clickable((By.XPATH, f"//tbody/tr[1]/td[9]/a[1]")))
+    estimate = wait.until(EC.element_to_be_clickable(page.FIRST_DETAILS_LINK))
     estimate.click()
 
-    estimate_details = wait.until(EC.presence_of_element_located((By.XPATH, "//body/div[@class='main-layout']/main[@class='container']/div[@class='card']/div[@class='card-header']/div[1]")))
+    estimate_details = wait.until(EC.presence_of_element_located(page.DETAILS_HEADING))
 
     # Basic check: ensure details element contains expected heading
     assert estimate_details.text is not None
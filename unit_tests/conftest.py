@@ -0,0 +1,14 @@
+"""Runner and helper tests that need no browser: ``python -m pytest unit_tests``.
+
+Kept out of pytest.ini's testpaths so scenario runs do not collect them.
+"""
+import pytest
+
+import report_store
+
+
+@pytest.fixture(scope="session", autouse=True)
+def shared_session(tmp_path_factory):
+    """Overrides the root conftest's browser session; these runs stay out of the run history."""
+    report_store.DB_PATH = str(tmp_path_factory.mktemp('history') / 'history.sqlite')
+    yield
@@ -0,0 +1,17 @@
+from types import SimpleNamespace
+
+import result_cache
+import run_scenarios_selective as runner
+
+SCENARIOS = [(index, {'scenario_name': f'Scenario_{index}', 'username': 'alexsingh'}) for index in (1, 2, 3)]
+
+
+def test_single_process_spec_leaves_out_cached_passes(tmp_path, monkeypatch):
+    monkeypatch.setattr(result_cache, 'RESULT_CACHE_PATH', str(tmp_path / 'result_cache.json'))
+    result_cache.record(SCENARIOS[1][1], 'build-1', passed=True)
+    args = SimpleNamespace(app_build='build-1', no_cache=False, cache_ttl=None)
+
+    to_run, skipped = runner.skip_cached_passes(SCENARIOS, args)
+
+    assert skipped == [SCENARIOS[1]]
+    assert runner.scenario_select_spec(to_run) == 'list:1,3'
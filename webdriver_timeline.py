@@ -0,0 +1,161 @@
+"""WebDriver command timeline: where does a scenario's time go?
+
+When WEBDRIVER_TIMELINE=1 (run_scenarios_selective.py --timeline) every command sent through
+the shared driver's command executor is recorded with start/end time, command name, locator
+and the test it belongs to, together with explicit waits (WebDriverWait, settle waits),
+action pacing and time.sleep calls. At the end of the session conftest writes the raw
+timeline as JSON and prints a per-test breakdown:
+
+    network   commands outside any wait (chromedriver + browser round trips)
+    explicit  WebDriverWait.until/until_not and page-settled waits
+    implicit  find commands that failed after sitting in the implicit wait
+    sleep     time.sleep outside any wait
+    pacing    pauses added after click/send_keys
+
+Nested events (commands issued while polling inside a wait, sleeps inside WebDriverWait) are
+kept in the JSON but counted only once, under the outermost event. Recording is a
+perf_counter call and a list append per event, cheap enough to leave on in CI.
+"""
+import json
+import os
+import time
+from contextlib import contextmanager
+
+CATEGORIES = ('network', 'explicit', 'implicit', 'sleep', 'pacing')
+FIND_COMMANDS = ('findElement', 'findElements', 'findChildElement', 'findChildElements')
+
+_events = []
+_state = {'test': 'session', 'depth': 0, 'implicit_ms': 0}
+_original_sleep = time.sleep
+_installed = False
+
+
+def enabled():
+    return os.environ.get('WEBDRIVER_TIMELINE', 'false').lower() in ('1', 'true', 'yes')
+
+
+def set_current_test(nodeid):
+    _state['test'] = nodeid or 'session'
+
+
+def _record(kind, name, detail, start, end, error=False):
+    _events.append((_state['test'], kind, name, detail, start, end, _state['depth'], error))
+
+
+@contextmanager
+def _span(kind, name, detail=None):
+    start = time.perf_counter()
+    _state['depth'] += 1
+    try:
+        yield
+    finally:
+        _state['depth'] -= 1
+        _record(kind, name, detail, start, time.perf_counter())
+
+
+@contextmanager
+def _noop():
+    yield
+
+
+def span(kind, name, detail=None):
+    """Context manager recording a wait/pacing span; a no-op when the timeline is disabled."""
+    if not _installed:
+        return _noop()
+    return _span(kind, name, detail)
+
+
+def instrument(driver):
+    """Wrap ``driver``'s command executor so every WebDriver command is recorded."""
+    executor = driver.command_executor
+    original_execute = executor.execute
+
+    def execute(command, params):
+        start = time.perf_counter()
+        error = True
+        _state['depth'] += 1
+        try:
+            response = original_execute(command, params)
+            value = response.get('value') if isinstance(response, dict) else None
+            error = isinstance(value, dict) and 'error' in value
+            return response
+        finally:
+            end = time.perf_counter()
+            _state['depth'] -= 1
+            if command == 'setTimeouts' and params and 'implicit' in params:
+                _state['implicit_ms'] = params['implicit']
+            detail = None
+            if params and 'using' in params:
+                detail = f"{params['using']}={params.get('value')}"
+            kind = 'command'
+            if error and command in FIND_COMMANDS and _state['implicit_ms']:
+                kind = 'implicit'
+            _record(kind, command, detail, start, end, error)
+
+    executor.execute = execute
+    return driver
+
+
+def install():
+    """Patch WebDriverWait and time.sleep so explicit waits and sleeps show up in the timeline."""
+    global _installed
+    if _installed:
+        return
+    _installed = True
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    original_until = WebDriverWait.until
+    original_until_not = WebDriverWait.until_not
+
+    def until(self, method, message=""):
+        with _span('explicit', 'WebDriverWait.until', getattr(method, '__name__', repr(method))):
+            return original_until(self, method, message)
+
+    def until_not(self, method, message=""):
+        with _span('explicit', 'WebDriverWait.until_not', getattr(method, '__name__', repr(method))):
+            return original_until_not(self, method, message)
+
+    def sleep(seconds):
+        start = time.perf_counter()
+        try:
+            _original_sleep(seconds)
+        finally:
+            _record('sleep', 'time.sleep', seconds, start, time.perf_counter())
+
+    WebDriverWait.until = until
+    WebDriverWait.until_not = until_not
+    time.sleep = sleep
+
+
+def summarize():
+    """Per-test seconds per category, counting only top-level events."""
+    category = {'command': 'network', 'implicit': 'implicit', 'explicit': 'explicit',
+                'sleep': 'sleep', 'pacing': 'pacing'}
+    summary = {}
+    for test, kind, name, detail, start, end, depth, error in _events:
+        row = summary.setdefault(test, dict.fromkeys(CATEGORIES, 0.0))
+        row.setdefault('commands', 0)
+        if kind in ('command', 'implicit'):
+            row['commands'] += 1
+        if depth == 0:
+            row[category[kind]] += end - start
+    return summary
+
+
+def write(path):
+    """Write the raw timeline and the per-test summary as JSON; returns the summary."""
+    origin = min((event[4] for event in _events), default=0.0)
+    summary = summarize()
+    data = {
+        'events': [
+            {'test': test, 'kind': kind, 'name': name, 'detail': detail,
+             'start': round(start - origin, 6), 'end': round(end - origin, 6),
+             'depth': depth, 'error': error}
+            for test, kind, name, detail, start, end, depth, error in _events
+        ],
+        'summary': summary,
+    }
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as fh:
+        json.dump(data, fh, indent=1, default=str)
+    return summary